@@ -3,163 +3,153 @@ Flask Backend for Student Report Card Management System
 RESTful API that uses all data structures: Linked List, Stack, Queue, List
 """
 
-from flask import Flask, request, jsonify, render_template
+import os
+from flask import Flask, Response, g, request, jsonify, render_template
 from flask_cors import CORS
-import copy
-from student import Student
-from linked_list import StudentLinkedList
-from stack import UndoStack
-from queue import OperationQueue
+from report_card import ReportCardManagementSystem, SynchronizedOperationQueue, describe_operation
+from report_card.responses import (CompressionCache, choose_encoding, compress_stream, students_to_compact,
+                                   supported_encodings)
+from report_card.trie import MAX_COMPLETIONS
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for frontend-backend communication
 
-
-class ReportCardManagementSystem:
-    """Main management system integrating all data structures"""
+# Maximum number of IDs accepted by one multi-get call
+app.config['MAX_BATCH_IDS'] = int(os.environ.get('MAX_BATCH_IDS', 100))
+# Maximum number of mutations accepted by one batch call
+app.config['MAX_BATCH_MUTATIONS'] = int(os.environ.get('MAX_BATCH_MUTATIONS', 5000))
+# Responses smaller than this (in bytes) are sent uncompressed
+app.config['COMPRESSION_MIN_SIZE'] = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))
+
+# Compressed bodies of recent responses, reused while the body is unchanged
+compression_cache = CompressionCache(max_entries=int(os.environ.get('COMPRESSION_CACHE_SIZE', 64)))
+
+COMPRESSIBLE_TYPES = ('application/json', 'application/x-ndjson', 'application/javascript')
+
+
+# Initialize the management system, spilling cold report cards to disk if enabled
+store = None
+if os.environ.get('TIERED_STORAGE', '').lower() in ('1', 'true', 'yes'):
+    from report_card.tiered import TieredStore
+    store = TieredStore.from_environ()
+# SHARDS=N (N > 1) partitions students across N independently locked shards
+if int(os.environ.get('SHARDS', 1)) > 1:
+    from report_card.sharding import ShardedSystem
+    system = ShardedSystem.from_environ(store)
+else:
+    # QUEUE_COALESCE=1 merges pending operations on the same student
+    system = ReportCardManagementSystem(store=store, operation_queue=SynchronizedOperationQueue(
+        coalesce=os.environ.get('QUEUE_COALESCE', '').lower() in ('1', 'true', 'yes')))
+
+# Primary/replica log shipping (REPLICATION_ROLE=primary|replica)
+replication = None
+if os.environ.get('REPLICATION_ROLE'):
+    from report_card.replication import WRITE_ENDPOINTS, start_from_environ
+    replication = start_from_environ(system)
+
+
+# ADMISSION_CONTROL=1 sheds expensive requests under load (429/503 + Retry-After)
+admission = None
+if os.environ.get('ADMISSION_CONTROL', '').lower() in ('1', 'true', 'yes'):
+    from report_card.admission import AdmissionController, estimate_cost
+    admission = AdmissionController.from_environ()
+
+# WARM_START=1 builds the ID/name indexes and warms caches on a thread pool
+# while requests are already served (lookups use list scans until then)
+warm_start = None
+if os.environ.get('WARM_START', '').lower() in ('1', 'true', 'yes'):
+    from report_card.warmup import WarmStart
+    warm_start = WarmStart.from_environ(system)
+
+
+@app.before_request
+def reject_writes_on_replica():
+    """Replicas only serve reads; writes go to the primary"""
+    if replication is not None and replication.role == 'replica' and request.endpoint in WRITE_ENDPOINTS:
+        return jsonify({"success": False, "message": "This server is a read-only replica!"}), 403
+
+
+@app.before_request
+def admit_request():
+    """Admit the request or shed it before any work is done"""
+    if admission is None or request.endpoint is None:
+        return None
+    ticket, rejection = admission.admit(request.endpoint, estimate_cost(
+        request.endpoint, system.snapshot().get_size(), request.args.get('limit', type=int)))
+    if rejection is not None:
+        status, retry_after, message = rejection
+        return jsonify({"success": False, "message": message}), status, {'Retry-After': str(retry_after)}
+    g.admission_ticket = ticket
+    return None
+
+
+@app.after_request
+def release_admission(response):
+    """Release the admission slot once the body (possibly streamed) is sent"""
+    ticket = g.pop('admission_ticket', None)
+    if ticket is not None:
+        response.call_on_close(lambda: admission.release(ticket))
+    return response
+
+
+# Query parameters that switch GET /api/students to a sorted page
+SORTED_PAGE_ARGS = ('sort', 'order', 'offset', 'limit')
+
+
+def students_response(students, **extra):
+    """JSON response for a list of students, compact if ?shape=compact"""
+    if request.args.get('shape') == 'compact':
+        payload = {"success": True, **students_to_compact(students)}
+    else:
+        payload = {"success": True, "students": [student.to_dict() for student in students]}
+    payload.update(extra)
+    return jsonify(payload)
+
+
+@app.after_request
+def compress_response(response):
+    """Compress the response body according to the client's Accept-Encoding"""
+    if response.status_code not in (200, 201) or 'Content-Encoding' in response.headers:
+        return response
+    if not (response.mimetype.startswith('text/') or response.mimetype in COMPRESSIBLE_TYPES):
+        return response
     
-    def __init__(self):
-        # Linked List for storing all students
-        self.student_list = StudentLinkedList()
-        
-        # Stack for undo operations
-        self.undo_stack = UndoStack()
-        
-        # Queue for processing operations
-        self.operation_queue = OperationQueue()
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding(request.headers.get('Accept-Encoding'))
+    if encoding is None:
+        return response
     
-    def add_student(self, student_id, name):
-        """Add a new student to the system"""
-        if self.student_list.search_student(student_id) is not None:
-            return False, f"Student with ID {student_id} already exists!"
-        
-        student = Student(student_id, name)
-        self.student_list.add_student(student)
-        self.operation_queue.enqueue(student, "add")
-        return True, f"Student {name} (ID: {student_id}) added successfully!"
-    
-    def remove_student(self, student_id):
-        """Remove a student from the system"""
-        student = self.student_list.remove_student(student_id)
-        
-        if student is None:
-            return False, f"Student with ID {student_id} not found!"
-        
-        self.undo_stack.push(student, "delete")
-        self.operation_queue.enqueue(student, "delete")
-        return True, f"Student {student.name} (ID: {student_id}) removed successfully!"
-    
-    def search_student(self, student_id):
-        """Search for a student by ID"""
-        student = self.student_list.search_student(student_id)
-        if student is None:
-            return None, f"Student with ID {student_id} not found!"
-        return student, None
-    
-    def search_by_name(self, name):
-        """Search for students by name"""
-        results = self.student_list.search_by_name(name)
-        if len(results) == 0:
-            return [], f"No students found with name containing '{name}'"
-        return results, None
-    
-    def add_grade(self, student_id, subject, grade):
-        """Add a subject and grade to a student's report card"""
-        student = self.student_list.search_student(student_id)
-        if student is None:
-            return False, f"Student with ID {student_id} not found!"
-        
-        if not (0 <= grade <= 100):
-            return False, "Grade must be between 0 and 100!"
-        
-        if student.add_subject_grade(subject, grade):
-            self.operation_queue.enqueue(student, "add_grade")
-            return True, f"Grade {grade} added for {subject}!"
-        else:
-            return False, f"Subject {subject} already exists! Use update instead."
-    
-    def update_grade(self, student_id, subject, new_grade):
-        """Update a grade for a student"""
-        student = self.student_list.search_student(student_id)
-        if student is None:
-            return False, f"Student with ID {student_id} not found!"
-        
-        if not (0 <= new_grade <= 100):
-            return False, "Grade must be between 0 and 100!"
-        
-        old_grade = student.report_card.get_grade(subject)
-        if old_grade is None:
-            return False, f"Subject {subject} not found for this student!"
-        
-        old_student = copy.deepcopy(student)
-        
-        if student.update_subject_grade(subject, new_grade):
-            self.undo_stack.push(old_student, "modify")
-            self.operation_queue.enqueue(student, "update_grade")
-            return True, f"Grade for {subject} updated from {old_grade} to {new_grade}!"
-        else:
-            return False, "Failed to update grade!"
-    
-    def undo_last_delete(self):
-        """Undo the last delete operation"""
-        if self.undo_stack.is_empty():
-            return False, "No operations to undo!"
-        
-        top_node = self.undo_stack.peek()
-        if top_node.operation_type != "delete":
-            return False, "Last operation was not a delete. Cannot undo!"
-        
-        popped_node = self.undo_stack.pop()
-        student = popped_node.data
-        self.student_list.add_student(student)
-        return True, f"Undone: Student {student.name} (ID: {student.student_id}) restored!"
-    
-    def get_all_students(self):
-        """Get all students as a list"""
-        return self.student_list.get_all_students()
-    
-    def get_statistics(self):
-        """Get system statistics"""
-        stats = {
-            "total_students": self.student_list.get_size(),
-            "undo_stack_size": self.undo_stack.get_size(),
-            "queue_size": self.operation_queue.get_size(),
-            "highest_average": 0,
-            "lowest_average": 0,
-            "overall_average": 0
-        }
-        
-        if self.student_list.get_size() > 0:
-            students = self.student_list.get_all_students()
-            averages = [s.get_average() for s in students if s.report_card.get_all_subjects()]
-            if averages:
-                stats["highest_average"] = round(max(averages), 2)
-                stats["lowest_average"] = round(min(averages), 2)
-                stats["overall_average"] = round(sum(averages) / len(averages), 2)
-        
-        return stats
-
-
-# Initialize the management system
-system = ReportCardManagementSystem()
+    if response.is_streamed:
+        response.response = compress_stream(response.response, encoding)
+        response.headers.pop('Content-Length', None)
+    else:
+        body = response.get_data()
+        if len(body) < app.config['COMPRESSION_MIN_SIZE']:
+            return response
+        response.set_data(compression_cache.get_or_compress(request.full_path, encoding, body))
+    
+    response.headers['Content-Encoding'] = encoding
+    return response
 
 
 # API Routes
 
 @app.route('/api/students', methods=['GET'])
 def get_all_students():
-    """Get all students"""
-    students = system.get_all_students()
-    students_data = []
-    for student in students:
-        students_data.append({
-            "student_id": student.student_id,
-            "name": student.name,
-            "subjects": student.report_card.subjects,
-            "grades": student.report_card.grades,
-            "average": round(student.get_average(), 2)
-        })
-    return jsonify({"success": True, "students": students_data})
+    """Get all students, or a sorted page with ?sort=id|name|average&order=asc|desc&offset&limit"""
+    if not any(key in request.args for key in SORTED_PAGE_ARGS):
+        return students_response(system.get_all_students())
+    try:
+        offset = int(request.args.get('offset', 0))
+        limit = int(request.args['limit']) if request.args.get('limit') else None
+    except ValueError:
+        return jsonify({"success": False, "message": "offset and limit must be numbers!"}), 400
+    sort = request.args.get('sort', 'id')
+    order = request.args.get('order', 'asc')
+    students, total, error = system.get_sorted_students(sort, order, offset, limit)
+    if error:
+        return jsonify({"success": False, "message": error}), 400
+    return students_response(students, total=total, offset=offset, limit=limit, sort=sort, order=order)
 
 
 @app.route('/api/students', methods=['POST'])
@@ -179,6 +169,54 @@ def add_student():
         return jsonify({"success": False, "message": message}), 400
 
 
+@app.route('/api/autocomplete', methods=['GET'])
+def autocomplete():
+    """Top-N name or subject completions for a prefix"""
+    prefix = request.args.get('q', '').strip()
+    kind = request.args.get('type', 'name')
+    
+    if not prefix:
+        return jsonify({"success": False, "message": "q parameter is required!"}), 400
+    if kind not in ('name', 'subject'):
+        return jsonify({"success": False, "message": "type must be 'name' or 'subject'!"}), 400
+    try:
+        limit = int(request.args.get('limit', MAX_COMPLETIONS))
+    except ValueError:
+        return jsonify({"success": False, "message": "limit must be a number!"}), 400
+    if not (1 <= limit <= MAX_COMPLETIONS):
+        return jsonify({"success": False, "message": f"limit must be between 1 and {MAX_COMPLETIONS}!"}), 400
+    
+    completions = system.autocomplete(prefix, kind, limit)
+    return jsonify({
+        "success": True,
+        "completions": [{"value": value, "count": count} for value, count in completions]
+    })
+
+
+@app.route('/api/students/batch', methods=['GET', 'POST'])
+def get_students_batch():
+    """Get many students by ID in one call"""
+    if request.method == 'POST':
+        student_ids = (request.get_json(silent=True) or {}).get('student_ids')
+    else:
+        student_ids = [student_id for value in request.args.getlist('ids')
+                       for student_id in value.split(',')]
+    
+    if not isinstance(student_ids, list) or not all(isinstance(i, str) for i in student_ids):
+        return jsonify({"success": False, "message": "student_ids must be a list of IDs!"}), 400
+    
+    student_ids = [student_id.strip() for student_id in student_ids if student_id.strip()]
+    if not student_ids:
+        return jsonify({"success": False, "message": "At least one student ID is required!"}), 400
+    
+    max_ids = app.config['MAX_BATCH_IDS']
+    if len(student_ids) > max_ids:
+        return jsonify({"success": False, "message": f"At most {max_ids} IDs per request!"}), 400
+    
+    students, missing = system.search_students(student_ids)
+    return students_response(students, missing=missing)
+
+
 @app.route('/api/students/<student_id>', methods=['GET'])
 def get_student(student_id):
     """Get a specific student by ID"""
@@ -188,13 +226,7 @@ def get_student(student_id):
     
     return jsonify({
         "success": True,
-        "student": {
-            "student_id": student.student_id,
-            "name": student.name,
-            "subjects": student.report_card.subjects,
-            "grades": student.report_card.grades,
-            "average": round(student.get_average(), 2)
-        }
+        "student": student.to_dict()
     })
 
 
@@ -210,26 +242,30 @@ def delete_student(student_id):
 
 @app.route('/api/students/search', methods=['GET'])
 def search_students():
-    """Search students by name"""
+    """Search students by name (substring, or typo-tolerant with fuzzy=true)"""
     name = request.args.get('name', '').strip()
     if not name:
         return jsonify({"success": False, "message": "Name parameter is required!"}), 400
     
+    if request.args.get('fuzzy', '').lower() in ('1', 'true', 'yes'):
+        try:
+            max_distance = int(request.args.get('max_distance', 2))
+        except ValueError:
+            return jsonify({"success": False, "message": "max_distance must be a number!"}), 400
+        if not (0 <= max_distance <= 2):
+            return jsonify({"success": False, "message": "max_distance must be between 0 and 2!"}), 400
+        
+        matches, error = system.fuzzy_search_by_name(name, max_distance)
+        if error:
+            return jsonify({"success": False, "message": error}), 404
+        return students_response([student for student, _ in matches],
+                                 distances=[distance for _, distance in matches])
+    
     results, error = system.search_by_name(name)
     if error:
         return jsonify({"success": False, "message": error}), 404
     
-    students_data = []
-    for student in results:
-        students_data.append({
-            "student_id": student.student_id,
-            "name": student.name,
-            "subjects": student.report_card.subjects,
-            "grades": student.report_card.grades,
-            "average": round(student.get_average(), 2)
-        })
-    
-    return jsonify({"success": True, "students": students_data})
+    return students_response(results)
 
 
 @app.route('/api/students/<student_id>/grades', methods=['POST'])
@@ -276,16 +312,116 @@ def update_grade(student_id):
         return jsonify({"success": False, "message": message}), 400
 
 
-@app.route('/api/undo', methods=['POST'])
-def undo_delete():
-    """Undo last delete operation"""
-    success, message = system.undo_last_delete()
+@app.route('/api/students/<student_id>/history', methods=['GET'])
+def get_grade_history(student_id):
+    """Grade changes of a student (?subject=, ?since=T), or its grades at ?as_of=T (epoch seconds)"""
+    subject = request.args.get('subject') or None
+    try:
+        since = float(request.args['since']) if request.args.get('since') else None
+        as_of = float(request.args['as_of']) if request.args.get('as_of') else None
+    except ValueError:
+        return jsonify({"success": False, "message": "since and as_of must be numbers (epoch seconds)!"}), 400
+    
+    if as_of is not None:
+        grades, error = system.get_grades_as_of(student_id, as_of, subject)
+        if error:
+            return jsonify({"success": False, "message": error}), 404
+        return jsonify({"success": True, "student_id": student_id, "as_of": as_of, "grades": grades})
+    
+    changes, error = system.get_grade_history(student_id, subject, since)
+    if error:
+        return jsonify({"success": False, "message": error}), 404
+    return jsonify({"success": True, "student_id": student_id, "changes": changes})
+
+
+@app.route('/api/history', methods=['GET'])
+def get_changes_since():
+    """Grade changes of all students after ?since=T (epoch seconds), oldest first"""
+    try:
+        since = float(request.args.get('since', 0))
+        limit = int(request.args.get('limit', 1000))
+    except ValueError:
+        return jsonify({"success": False, "message": "since and limit must be numbers!"}), 400
+    
+    changes = system.get_changes_since(since, limit)
+    return jsonify({"success": True, "changes": changes, "history": system.get_history_stats()})
+
+
+@app.route('/api/batch', methods=['POST'])
+def apply_batch():
+    """Apply an ordered list of mutations atomically"""
+    data = request.get_json(silent=True) or {}
+    mutations = data.get('mutations')
+    
+    if not isinstance(mutations, list) or not mutations:
+        return jsonify({"success": False, "message": "mutations must be a non-empty list!"}), 400
+    
+    max_mutations = app.config['MAX_BATCH_MUTATIONS']
+    if len(mutations) > max_mutations:
+        return jsonify({"success": False, "message": f"At most {max_mutations} mutations per batch!"}), 400
+    
+    success, message = system.apply_batch(mutations)
     if success:
         return jsonify({"success": True, "message": message}), 200
     else:
         return jsonify({"success": False, "message": message}), 400
 
 
+@app.route('/api/undo', methods=['POST'])
+def undo():
+    """Undo the last operation, or every operation back to {"version": N}"""
+    data = request.get_json(silent=True) or {}
+    version = data.get('version')
+    
+    if version is None:
+        success, message = system.undo()
+    elif isinstance(version, int) and not isinstance(version, bool):
+        success, message = system.undo_to_version(version)
+    else:
+        return jsonify({"success": False, "message": "Version must be an integer!"}), 400
+    
+    if success:
+        return jsonify({"success": True, "message": message, "version": system.get_version()}), 200
+    else:
+        return jsonify({"success": False, "message": message}), 400
+
+
+@app.route('/api/redo', methods=['POST'])
+def redo():
+    """Redo the last undone operation"""
+    success, message = system.redo()
+    if success:
+        return jsonify({"success": True, "message": message, "version": system.get_version()}), 200
+    else:
+        return jsonify({"success": False, "message": message}), 400
+
+
+@app.route('/api/export', methods=['GET'])
+def export_students():
+    """Stream the whole roster as CSV, NDJSON or columnar binary"""
+    from report_card.export import FORMATS, DEFAULT_CHUNK_SIZE, export_roster
+    
+    fmt = request.args.get('format', 'ndjson')
+    compress = request.args.get('compress') or None
+    after = request.args.get('after') or None
+    try:
+        chunk_size = int(request.args.get('chunk_size', DEFAULT_CHUNK_SIZE))
+    except ValueError:
+        return jsonify({"success": False, "message": "Chunk size must be a number!"}), 400
+    
+    stream, error = export_roster(system.snapshot(), fmt, after, chunk_size, compress)
+    if error:
+        return jsonify({"success": False, "message": error}), 400
+    
+    content_type, extension = FORMATS[fmt]
+    filename = f"roster.{extension}"
+    if compress == 'gzip':
+        content_type, filename = 'application/gzip', filename + '.gz'
+    return Response(stream, content_type=content_type, headers={
+        "Content-Disposition": f"attachment; filename={filename}"
+    })
+
+
 @app.route('/api/statistics', methods=['GET'])
 def get_statistics():
     """Get system statistics"""
@@ -293,21 +429,107 @@ def get_statistics():
     return jsonify({"success": True, "statistics": stats})
 
 
+@app.route('/api/storage', methods=['GET'])
+def get_storage():
+    """Get tiered storage metrics (hot/cold report cards, hits, misses, evictions)"""
+    stats = system.get_storage_stats()
+    return jsonify({"success": True, "enabled": stats is not None, "storage": stats})
+
+
+@app.route('/api/replication', methods=['GET'])
+def get_replication():
+    """Get replication role, log position and lag"""
+    status = replication.get_status() if replication is not None else None
+    return jsonify({"success": True, "enabled": status is not None, "replication": status})
+
+
+@app.route('/api/admission', methods=['GET'])
+def get_admission():
+    """Get admission control limits, in-flight cost and shed counts"""
+    stats = admission.get_stats() if admission is not None else None
+    return jsonify({"success": True, "enabled": stats is not None, "admission": stats})
+
+
+@app.route('/api/health/live', methods=['GET'])
+def liveness():
+    """Liveness probe: the process is up and answering requests"""
+    return jsonify({"success": True, "status": "alive"})
+
+
+@app.route('/api/health/ready', methods=['GET'])
+def readiness():
+    """Readiness probe: 503 until the warm-start builds have finished, with their progress"""
+    status = warm_start.get_status() if warm_start is not None else None
+    ready = status is None or status["ready"]
+    return jsonify({"success": ready, "ready": ready, "warm_start": status}), 200 if ready else 503
+
+
+@app.route('/api/admin/memory', methods=['GET'])
+def get_memory():
+    """Estimated memory per data structure, process RSS and allocation tracking status"""
+    from report_card.memory import process_memory, tracker
+    structures = system.get_memory_usage(
+        extra=[("compression_cache", compression_cache), ("replication_log", getattr(replication, 'log', None))],
+        exclude=[replication])
+    return jsonify({
+        "success": True,
+        "structures": structures,
+        "total_bytes": sum(entry["bytes"] for entry in structures.values()),
+        "process": process_memory(),
+        "tracemalloc": tracker.get_status(),
+    })
+
+
+@app.route('/api/admin/memory/tracking', methods=['POST'])
+def set_memory_tracking():
+    """Start allocation tracking and take the baseline ({"action": "start", "frames": N}), or stop it"""
+    from report_card.memory import tracker
+    data = request.json or {}
+    action = data.get('action')
+    if action == 'start':
+        try:
+            frames = int(data.get('frames', 1))
+        except (TypeError, ValueError):
+            return jsonify({"success": False, "message": "frames must be a number!"}), 400
+        tracker.start(max(1, frames))
+    elif action == 'stop':
+        tracker.stop()
+    else:
+        return jsonify({"success": False, "message": "action must be 'start' or 'stop'!"}), 400
+    return jsonify({"success": True, "tracemalloc": tracker.get_status()})
+
+
+@app.route('/api/admin/memory/diff', methods=['GET'])
+def get_memory_diff():
+    """Largest allocation changes since the baseline (?group_by=lineno|filename|traceback, ?limit, ?reset)"""
+    from report_card.memory import tracker
+    try:
+        limit = int(request.args.get('limit', 20))
+    except ValueError:
+        return jsonify({"success": False, "message": "limit must be a number!"}), 400
+    reset = request.args.get('reset', '').lower() in ('1', 'true', 'yes')
+    diff, error = tracker.diff(request.args.get('group_by', 'lineno'), limit, reset)
+    if error:
+        return jsonify({"success": False, "message": error}), 400
+    return jsonify({"success": True, **diff})
+
+
 @app.route('/api/queue', methods=['GET'])
 def get_queue():
     """Get operation queue"""
     operations = []
-    current = system.operation_queue.front
-    while current is not None:
-        if isinstance(current.data, Student):
-            operations.append({
-                "operation_type": current.operation_type,
-                "student_id": current.data.student_id,
-                "student_name": current.data.name
-            })
-        current = current.next
+    for node in system.operation_queue.nodes():
+        operation = describe_operation(node.operation_type, node.data)
+        if operation:
+            operation["count"] = node.count
+            operations.append(operation)
     
-    return jsonify({"success": True, "queue": operations, "size": system.operation_queue.get_size()})
+    return jsonify({
+        "success": True,
+        "queue": operations,
+        "size": system.operation_queue.get_size(),
+        "coalesced": system.operation_queue.coalesced
+    })
 
 
 @app.route('/api/stack', methods=['GET'])
@@ -316,15 +538,19 @@ def get_stack():
     operations = []
     current = system.undo_stack.top
     while current is not None:
-        if isinstance(current.data, Student):
-            operations.append({
-                "operation_type": current.operation_type,
-                "student_id": current.data.student_id,
-                "student_name": current.data.name
-            })
+        operation = describe_operation(current.operation_type, current.data)
+        if operation:
+            operation["version"] = current.version
+            operations.append(operation)
         current = current.next
     
-    return jsonify({"success": True, "stack": operations, "size": system.undo_stack.get_size()})
+    return jsonify({
+        "success": True,
+        "stack": operations,
+        "size": system.undo_stack.get_size(),
+        "redo_size": system.redo_stack.get_size(),
+        "version": system.get_version()
+    })
 
 
 @app.route('/api/queue/process', methods=['POST'])
@@ -334,12 +560,9 @@ def process_queue():
     processed = []
     for op in operations:
         if op and op.data:
-            if isinstance(op.data, Student):
-                processed.append({
-                    "operation_type": op.operation_type,
-                    "student_id": op.data.student_id,
-                    "student_name": op.data.name
-                })
+            operation = describe_operation(op.operation_type, op.data)
+            if operation:
+                processed.append(operation)
     
     return jsonify({"success": True, "message": f"Processed {len(processed)} operations", "operations": processed})
 
@@ -350,5 +573,25 @@ def index():
     return render_template('index.html')
 
 
+# Hot read routes whose compressed bodies are cached during warm start
+WARM_PATHS = ('/api/students', '/api/statistics')
+
+
+def warm_responses():
+    """Render the hot read routes once per encoding so the compression cache is warm"""
+    client = app.test_client()
+    for path in WARM_PATHS:
+        for encoding in supported_encodings():
+            # Closing runs the after-request callbacks (e.g. releasing admission)
+            client.get(path, headers={'Accept-Encoding': encoding}).close()
+
+
+if warm_start is not None:
+    warm_start.add_task('responses', warm_responses)
+    warm_start.start()
+
+
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', debug=True, port=5000)
+    # The reloader runs the module twice, which would start replication twice
+    app.run(host='0.0.0.0', debug=True, port=int(os.environ.get('PORT', 5000)),
+            use_reloader=replication is None)
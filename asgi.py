@@ -0,0 +1,783 @@
+"""
+ASGI Backend for Student Report Card Management System
+Serves the same REST API as app.py on an async stack.
+
+- Reads run in worker threads, so a long traversal never blocks the event loop
+- Writes are serialized through a single mutation task (one writer at a time)
+
+Run locally with the bundled ASGI server:
+    python asgi.py            (or: uvicorn asgi:application --port 5000)
+"""
+
+import asyncio
+import json
+import mimetypes
+import os
+import re
+from urllib.parse import parse_qs, unquote
+
+from report_card import ReportCardManagementSystem, SynchronizedOperationQueue, describe_operation
+from report_card.responses import CompressionCache, choose_encoding, compress_stream, students_to_compact
+from report_card.trie import MAX_COMPLETIONS
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+TEMPLATE_FILE = os.path.join(BASE_DIR, "templates", "index.html")
+
+# Maximum number of IDs accepted by one multi-get call
+MAX_BATCH_IDS = int(os.environ.get("MAX_BATCH_IDS", 100))
+# Maximum number of mutations accepted by one batch call
+MAX_BATCH_MUTATIONS = int(os.environ.get("MAX_BATCH_MUTATIONS", 5000))
+# Responses smaller than this (in bytes) are sent uncompressed
+COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", 1024))
+
+# Compressed bodies of recent responses, reused while the body is unchanged
+compression_cache = CompressionCache(max_entries=int(os.environ.get("COMPRESSION_CACHE_SIZE", 64)))
+
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "application/javascript")
+
+# Initialize the management system, spilling cold report cards to disk if enabled
+store = None
+if os.environ.get("TIERED_STORAGE", "").lower() in ("1", "true", "yes"):
+    from report_card.tiered import TieredStore
+    store = TieredStore.from_environ()
+# SHARDS=N (N > 1) partitions students across N independently locked shards
+if int(os.environ.get("SHARDS", 1)) > 1:
+    from report_card.sharding import ShardedSystem
+    system = ShardedSystem.from_environ(store)
+else:
+    # QUEUE_COALESCE=1 merges pending operations on the same student
+    system = ReportCardManagementSystem(store=store, operation_queue=SynchronizedOperationQueue(
+        coalesce=os.environ.get("QUEUE_COALESCE", "").lower() in ("1", "true", "yes")))
+
+# Primary/replica log shipping (REPLICATION_ROLE=primary|replica)
+replication = None
+if os.environ.get("REPLICATION_ROLE"):
+    from report_card.replication import WRITE_ENDPOINTS, start_from_environ
+    replication = start_from_environ(system)
+
+# ADMISSION_CONTROL=1 sheds expensive requests under load (429/503 + Retry-After)
+admission = None
+if os.environ.get("ADMISSION_CONTROL", "").lower() in ("1", "true", "yes"):
+    from report_card.admission import AdmissionController, estimate_cost
+    admission = AdmissionController.from_environ()
+
+# WARM_START=1 builds the ID/name indexes and precomputes statistics on a
+# thread pool while requests are already served
+warm_start = None
+if os.environ.get("WARM_START", "").lower() in ("1", "true", "yes"):
+    from report_card.warmup import WarmStart
+    warm_start = WarmStart.from_environ(system)
+    warm_start.start()
+
+
+class MutationWorker:
+    """Single task that applies every write in arrival order"""
+
+    def __init__(self):
+        self.queue = None
+        self.task = None
+
+    def start(self):
+        """Start the mutation task on the running event loop"""
+        if self.task is None:
+            self.queue = asyncio.Queue()
+            self.task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop the mutation task once the queued writes are applied"""
+        if self.task is not None:
+            await self.queue.join()
+            self.task.cancel()
+            self.task = None
+
+    async def submit(self, func, *args):
+        """Queue a write and wait for its result"""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((func, args, future))
+        return await future
+
+    async def _run(self):
+        while True:
+            func, args, future = await self.queue.get()
+            try:
+                # The work itself runs off-loop, but only one write at a time
+                result = await asyncio.to_thread(func, *args)
+            except Exception as exc:
+                if not future.cancelled():
+                    future.set_exception(exc)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+            finally:
+                self.queue.task_done()
+
+
+mutations = MutationWorker()
+
+
+async def read(func, *args):
+    """Run a read-only call without blocking the event loop"""
+    return await asyncio.to_thread(func, *args)
+
+
+class Request:
+    """Minimal request object handed to route handlers"""
+
+    def __init__(self, scope, body, path_params):
+        self.method = scope["method"]
+        self.path = scope["path"]
+        query_string = scope.get("query_string", b"").decode()
+        self.full_path = self.path + "?" + query_string  # Same form as Flask's request.full_path
+        self.query = parse_qs(query_string)
+        self.headers = {name.decode("latin-1"): value.decode("latin-1") for name, value in scope.get("headers", [])}
+        self.args = {key: values[0] for key, values in self.query.items()}
+        self.body = body
+        self.path_params = path_params
+
+    @property
+    def json(self):
+        """Request body decoded as JSON (empty dict when missing or invalid)"""
+        try:
+            data = json.loads(self.body or b"{}")
+        except ValueError:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+
+def json_response(payload, status=200):
+    """Build a (status, headers, body) triple for a JSON payload"""
+    return status, [(b"content-type", b"application/json")], json.dumps(payload).encode()
+
+
+def students_payload(request, students, **extra):
+    """JSON payload for a list of students, compact if ?shape=compact"""
+    if request.args.get("shape") == "compact":
+        payload = {"success": True, **students_to_compact(students)}
+    else:
+        payload = {"success": True, "students": [student.to_dict() for student in students]}
+    payload.update(extra)
+    return payload
+
+
+def iter_nodes(current):
+    """Follow a chain of stack nodes"""
+    while current is not None:
+        yield current
+        current = current.next
+
+
+def operations_to_list(nodes):
+    """Describe the student operations of stack/queue nodes"""
+    operations = []
+    for current in nodes:
+        operation = describe_operation(current.operation_type, current.data)
+        if operation:
+            if hasattr(current, "version"):
+                operation["version"] = current.version
+            if hasattr(current, "count"):
+                operation["count"] = current.count
+            operations.append(operation)
+    return operations
+
+
+# API Routes
+
+# Query parameters that switch GET /api/students to a sorted page
+SORTED_PAGE_ARGS = ('sort', 'order', 'offset', 'limit')
+
+
+async def get_all_students(request):
+    """Get all students, or a sorted page with ?sort=id|name|average&order=asc|desc&offset&limit"""
+    if not any(key in request.args for key in SORTED_PAGE_ARGS):
+        return json_response(await read(lambda: students_payload(request, system.get_all_students())))
+    try:
+        offset = int(request.args.get('offset', 0))
+        limit = int(request.args['limit']) if request.args.get('limit') else None
+    except ValueError:
+        return json_response({"success": False, "message": "offset and limit must be numbers!"}, 400)
+    sort = request.args.get('sort', 'id')
+    order = request.args.get('order', 'asc')
+    students, total, error = await read(system.get_sorted_students, sort, order, offset, limit)
+    if error:
+        return json_response({"success": False, "message": error}, 400)
+    return json_response(await read(lambda: students_payload(
+        request, students, total=total, offset=offset, limit=limit, sort=sort, order=order)))
+
+
+async def add_student(request):
+    """Add a new student"""
+    data = request.json
+    student_id = str(data.get('student_id', '')).strip()
+    name = str(data.get('name', '')).strip()
+
+    if not student_id or not name:
+        return json_response({"success": False, "message": "Student ID and Name are required!"}, 400)
+
+    success, message = await mutations.submit(system.add_student, student_id, name)
+    return json_response({"success": success, "message": message}, 201 if success else 400)
+
+
+async def autocomplete(request):
+    """Top-N name or subject completions for a prefix"""
+    prefix = request.args.get('q', '').strip()
+    kind = request.args.get('type', 'name')
+
+    if not prefix:
+        return json_response({"success": False, "message": "q parameter is required!"}, 400)
+    if kind not in ('name', 'subject'):
+        return json_response({"success": False, "message": "type must be 'name' or 'subject'!"}, 400)
+    try:
+        limit = int(request.args.get('limit', MAX_COMPLETIONS))
+    except ValueError:
+        return json_response({"success": False, "message": "limit must be a number!"}, 400)
+    if not (1 <= limit <= MAX_COMPLETIONS):
+        return json_response({"success": False, "message": f"limit must be between 1 and {MAX_COMPLETIONS}!"}, 400)
+
+    # O(prefix + N): cheap enough to answer on the event loop
+    completions = system.autocomplete(prefix, kind, limit)
+    return json_response({
+        "success": True,
+        "completions": [{"value": value, "count": count} for value, count in completions]
+    })
+
+
+async def get_students_batch(request):
+    """Get many students by ID in one call"""
+    if request.method == 'POST':
+        student_ids = request.json.get('student_ids')
+    else:
+        student_ids = [student_id for value in request.query.get('ids', [])
+                       for student_id in value.split(',')]
+
+    if not isinstance(student_ids, list) or not all(isinstance(i, str) for i in student_ids):
+        return json_response({"success": False, "message": "student_ids must be a list of IDs!"}, 400)
+
+    student_ids = [student_id.strip() for student_id in student_ids if student_id.strip()]
+    if not student_ids:
+        return json_response({"success": False, "message": "At least one student ID is required!"}, 400)
+    if len(student_ids) > MAX_BATCH_IDS:
+        return json_response({"success": False, "message": f"At most {MAX_BATCH_IDS} IDs per request!"}, 400)
+
+    def lookup():
+        students, missing = system.search_students(student_ids)
+        return students_payload(request, students, missing=missing)
+
+    return json_response(await read(lookup))
+
+
+async def get_student(request):
+    """Get a specific student by ID"""
+    def lookup():
+        student, error = system.search_student(request.path_params["student_id"])
+        return (student.to_dict() if student else None), error
+
+    student_data, error = await read(lookup)
+    if error:
+        return json_response({"success": False, "message": error}, 404)
+    return json_response({"success": True, "student": student_data})
+
+
+async def delete_student(request):
+    """Delete a student"""
+    success, message = await mutations.submit(
+        system.remove_student, request.path_params["student_id"])
+    return json_response({"success": success, "message": message}, 200 if success else 404)
+
+
+async def search_students(request):
+    """Search students by name (substring, or typo-tolerant with fuzzy=true)"""
+    name = request.args.get('name', '').strip()
+    if not name:
+        return json_response({"success": False, "message": "Name parameter is required!"}, 400)
+
+    if request.args.get('fuzzy', '').lower() in ('1', 'true', 'yes'):
+        try:
+            max_distance = int(request.args.get('max_distance', 2))
+        except ValueError:
+            return json_response({"success": False, "message": "max_distance must be a number!"}, 400)
+        if not (0 <= max_distance <= 2):
+            return json_response({"success": False, "message": "max_distance must be between 0 and 2!"}, 400)
+
+        def fuzzy_search():
+            matches, error = system.fuzzy_search_by_name(name, max_distance)
+            if error:
+                return None, error
+            return students_payload(request, [student for student, _ in matches],
+                                    distances=[distance for _, distance in matches]), None
+
+        payload, error = await read(fuzzy_search)
+        if error:
+            return json_response({"success": False, "message": error}, 404)
+        return json_response(payload)
+
+    def search():
+        results, error = system.search_by_name(name)
+        if error:
+            return None, error
+        return students_payload(request, results), None
+
+    payload, error = await read(search)
+    if error:
+        return json_response({"success": False, "message": error}, 404)
+    return json_response(payload)
+
+
+def _parse_grade_body(request):
+    """Validate a grade request body, returning (subject, grade, error_response)"""
+    data = request.json
+    subject = str(data.get('subject', '')).strip()
+    if not subject:
+        return None, None, json_response({"success": False, "message": "Subject is required!"}, 400)
+    try:
+        grade = float(data.get('grade'))
+    except (ValueError, TypeError):
+        return None, None, json_response({"success": False, "message": "Grade must be a number!"}, 400)
+    return subject, grade, None
+
+
+async def add_grade(request):
+    """Add a grade to a student's report card"""
+    subject, grade, error_response = _parse_grade_body(request)
+    if error_response:
+        return error_response
+
+    success, message = await mutations.submit(
+        system.add_grade, request.path_params["student_id"], subject, grade)
+    return json_response({"success": success, "message": message}, 201 if success else 400)
+
+
+async def update_grade(request):
+    """Update a grade for a student"""
+    subject, grade, error_response = _parse_grade_body(request)
+    if error_response:
+        return error_response
+
+    success, message = await mutations.submit(
+        system.update_grade, request.path_params["student_id"], subject, grade)
+    return json_response({"success": success, "message": message}, 200 if success else 400)
+
+
+async def get_grade_history(request):
+    """Grade changes of a student (?subject=, ?since=T), or its grades at ?as_of=T (epoch seconds)"""
+    student_id = request.path_params["student_id"]
+    subject = request.args.get("subject") or None
+    try:
+        since = float(request.args["since"]) if request.args.get("since") else None
+        as_of = float(request.args["as_of"]) if request.args.get("as_of") else None
+    except ValueError:
+        return json_response({"success": False, "message": "since and as_of must be numbers (epoch seconds)!"}, 400)
+
+    if as_of is not None:
+        grades, error = await read(system.get_grades_as_of, student_id, as_of, subject)
+        if error:
+            return json_response({"success": False, "message": error}, 404)
+        return json_response({"success": True, "student_id": student_id, "as_of": as_of, "grades": grades})
+
+    changes, error = await read(system.get_grade_history, student_id, subject, since)
+    if error:
+        return json_response({"success": False, "message": error}, 404)
+    return json_response({"success": True, "student_id": student_id, "changes": changes})
+
+
+async def get_changes_since(request):
+    """Grade changes of all students after ?since=T (epoch seconds), oldest first"""
+    try:
+        since = float(request.args.get("since", 0))
+        limit = int(request.args.get("limit", 1000))
+    except ValueError:
+        return json_response({"success": False, "message": "since and limit must be numbers!"}, 400)
+
+    changes = await read(system.get_changes_since, since, limit)
+    return json_response({"success": True, "changes": changes, "history": system.get_history_stats()})
+
+
+async def apply_batch(request):
+    """Apply an ordered list of mutations atomically"""
+    mutations_list = request.json.get('mutations')
+    if not isinstance(mutations_list, list) or not mutations_list:
+        return json_response({"success": False, "message": "mutations must be a non-empty list!"}, 400)
+    if len(mutations_list) > MAX_BATCH_MUTATIONS:
+        return json_response({"success": False, "message": f"At most {MAX_BATCH_MUTATIONS} mutations per batch!"}, 400)
+
+    success, message = await mutations.submit(system.apply_batch, mutations_list)
+    return json_response({"success": success, "message": message}, 200 if success else 400)
+
+
+async def undo(request):
+    """Undo the last operation, or every operation back to {"version": N}"""
+    version = request.json.get('version')
+    if version is None:
+        success, message = await mutations.submit(system.undo)
+    elif isinstance(version, int) and not isinstance(version, bool):
+        success, message = await mutations.submit(system.undo_to_version, version)
+    else:
+        return json_response({"success": False, "message": "Version must be an integer!"}, 400)
+
+    if success:
+        return json_response({"success": True, "message": message, "version": system.get_version()})
+    return json_response({"success": False, "message": message}, 400)
+
+
+async def redo(request):
+    """Redo the last undone operation"""
+    success, message = await mutations.submit(system.redo)
+    if success:
+        return json_response({"success": True, "message": message, "version": system.get_version()})
+    return json_response({"success": False, "message": message}, 400)
+
+
+async def get_statistics(request):
+    """Get system statistics"""
+    stats = await read(system.get_statistics)
+    return json_response({"success": True, "statistics": stats})
+
+
+async def get_storage(request):
+    """Get tiered storage metrics (hot/cold report cards, hits, misses, evictions)"""
+    stats = await read(system.get_storage_stats)
+    return json_response({"success": True, "enabled": stats is not None, "storage": stats})
+
+
+async def get_replication(request):
+    """Get replication role, log position and lag"""
+    status = replication.get_status() if replication is not None else None
+    return json_response({"success": True, "enabled": status is not None, "replication": status})
+
+
+async def get_admission(request):
+    """Get admission control limits, in-flight cost and shed counts"""
+    stats = admission.get_stats() if admission is not None else None
+    return json_response({"success": True, "enabled": stats is not None, "admission": stats})
+
+
+async def liveness(request):
+    """Liveness probe: the process is up and answering requests"""
+    return json_response({"success": True, "status": "alive"})
+
+
+async def readiness(request):
+    """Readiness probe: 503 until the warm-start builds have finished, with their progress"""
+    status = warm_start.get_status() if warm_start is not None else None
+    ready = status is None or status["ready"]
+    return json_response({"success": ready, "ready": ready, "warm_start": status}, 200 if ready else 503)
+
+
+async def get_memory(request):
+    """Estimated memory per data structure, process RSS and allocation tracking status"""
+    from report_card.memory import process_memory, tracker
+    structures = await read(lambda: system.get_memory_usage(
+        extra=[("mutation_worker", mutations), ("compression_cache", compression_cache),
+               ("replication_log", getattr(replication, "log", None))],
+        exclude=[replication]))
+    return json_response({
+        "success": True,
+        "structures": structures,
+        "total_bytes": sum(entry["bytes"] for entry in structures.values()),
+        "process": process_memory(),
+        "tracemalloc": tracker.get_status(),
+    })
+
+
+async def set_memory_tracking(request):
+    """Start allocation tracking and take the baseline ({"action": "start", "frames": N}), or stop it"""
+    from report_card.memory import tracker
+    data = request.json
+    action = data.get("action")
+    if action == "start":
+        try:
+            frames = int(data.get("frames", 1))
+        except (TypeError, ValueError):
+            return json_response({"success": False, "message": "frames must be a number!"}, 400)
+        await read(tracker.start, max(1, frames))
+    elif action == "stop":
+        tracker.stop()
+    else:
+        return json_response({"success": False, "message": "action must be 'start' or 'stop'!"}, 400)
+    return json_response({"success": True, "tracemalloc": tracker.get_status()})
+
+
+async def get_memory_diff(request):
+    """Largest allocation changes since the baseline (?group_by=lineno|filename|traceback, ?limit, ?reset)"""
+    from report_card.memory import tracker
+    try:
+        limit = int(request.args.get("limit", 20))
+    except ValueError:
+        return json_response({"success": False, "message": "limit must be a number!"}, 400)
+    reset = request.args.get("reset", "").lower() in ("1", "true", "yes")
+    diff, error = await read(tracker.diff, request.args.get("group_by", "lineno"), limit, reset)
+    if error:
+        return json_response({"success": False, "message": error}, 400)
+    return json_response({"success": True, **diff})
+
+
+async def get_queue(request):
+    """Get operation queue"""
+    operations = await read(lambda: operations_to_list(system.operation_queue.nodes()))
+    return json_response({
+        "success": True,
+        "queue": operations,
+        "size": system.operation_queue.get_size(),
+        "coalesced": system.operation_queue.coalesced
+    })
+
+
+async def get_stack(request):
+    """Get undo stack"""
+    operations = await read(lambda: operations_to_list(iter_nodes(system.undo_stack.top)))
+    return json_response({
+        "success": True,
+        "stack": operations,
+        "size": system.undo_stack.get_size(),
+        "redo_size": system.redo_stack.get_size(),
+        "version": system.get_version()
+    })
+
+
+async def process_queue(request):
+    """Process all operations in queue"""
+    operations = await mutations.submit(system.operation_queue.process_all)
+    processed = [describe_operation(op.operation_type, op.data) for op in operations if op]
+    processed = [operation for operation in processed if operation]
+
+    return json_response({"success": True, "message": f"Processed {len(processed)} operations", "operations": processed})
+
+
+async def index(request):
+    """Serve the main HTML page"""
+    def render():
+        with open(TEMPLATE_FILE, encoding="utf-8") as template:
+            html = template.read()
+        # The template only uses url_for('static', ...)
+        return re.sub(r"\{\{\s*url_for\('static',\s*filename='([^']+)'\)\s*\}\}", r"/static/\1", html)
+
+    html = await read(render)
+    return 200, [(b"content-type", b"text/html; charset=utf-8")], html.encode()
+
+
+async def static_file(request):
+    """Serve a file from the static directory"""
+    path = os.path.normpath(os.path.join(STATIC_DIR, request.path_params["filename"]))
+    if not path.startswith(STATIC_DIR + os.sep) or not os.path.isfile(path):
+        return json_response({"success": False, "message": "Not found"}, 404)
+
+    def load():
+        with open(path, "rb") as static:
+            return static.read()
+
+    content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    return 200, [(b"content-type", content_type.encode())], await read(load)
+
+
+async def export_students(request):
+    """Stream the whole roster as CSV, NDJSON or columnar binary"""
+    from report_card.export import FORMATS, DEFAULT_CHUNK_SIZE, export_roster
+
+    fmt = request.args.get("format", "ndjson")
+    compress = request.args.get("compress") or None
+    after = request.args.get("after") or None
+    try:
+        chunk_size = int(request.args.get("chunk_size", DEFAULT_CHUNK_SIZE))
+    except ValueError:
+        return json_response({"success": False, "message": "Chunk size must be a number!"}, 400)
+
+    stream, error = await read(export_roster, system.snapshot(), fmt, after, chunk_size, compress)
+    if error:
+        return json_response({"success": False, "message": error}, 400)
+
+    content_type, extension = FORMATS[fmt]
+    filename = f"roster.{extension}"
+    if compress == "gzip":
+        content_type, filename = "application/gzip", filename + ".gz"
+    return 200, [
+        (b"content-type", content_type.encode()),
+        (b"content-disposition", f"attachment; filename={filename}".encode()),
+    ], stream
+
+
+# (method, pattern, handler) - checked in order, like Flask's URL map
+ROUTES = [
+    ("GET", r"/api/students", get_all_students),
+    ("GET", r"/api/autocomplete", autocomplete),
+    ("POST", r"/api/students", add_student),
+    ("GET", r"/api/students/search", search_students),
+    ("GET", r"/api/students/batch", get_students_batch),
+    ("POST", r"/api/students/batch", get_students_batch),
+    ("GET", r"/api/students/(?P<student_id>[^/]+)", get_student),
+    ("DELETE", r"/api/students/(?P<student_id>[^/]+)", delete_student),
+    ("POST", r"/api/students/(?P<student_id>[^/]+)/grades", add_grade),
+    ("PUT", r"/api/students/(?P<student_id>[^/]+)/grades", update_grade),
+    ("GET", r"/api/students/(?P<student_id>[^/]+)/history", get_grade_history),
+    ("GET", r"/api/history", get_changes_since),
+    ("POST", r"/api/batch", apply_batch),
+    ("POST", r"/api/undo", undo),
+    ("POST", r"/api/redo", redo),
+    ("GET", r"/api/statistics", get_statistics),
+    ("GET", r"/api/export", export_students),
+    ("GET", r"/api/storage", get_storage),
+    ("GET", r"/api/replication", get_replication),
+    ("GET", r"/api/admission", get_admission),
+    ("GET", r"/api/health/live", liveness),
+    ("GET", r"/api/health/ready", readiness),
+    ("GET", r"/api/admin/memory", get_memory),
+    ("POST", r"/api/admin/memory/tracking", set_memory_tracking),
+    ("GET", r"/api/admin/memory/diff", get_memory_diff),
+    ("GET", r"/api/queue", get_queue),
+    ("GET", r"/api/stack", get_stack),
+    ("POST", r"/api/queue/process", process_queue),
+    ("GET", r"/", index),
+    ("GET", r"/static/(?P<filename>.+)", static_file),
+]
+ROUTES = [(method, re.compile(pattern + "$"), handler) for method, pattern, handler in ROUTES]
+
+CORS_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"GET, POST, PUT, DELETE, OPTIONS"),
+    (b"access-control-allow-headers", b"Content-Type"),
+]
+
+
+def match_route(method, path):
+    """Find the handler for a request, returning (handler, path_params, status)"""
+    path_matched = False
+    for route_method, pattern, handler in ROUTES:
+        match = pattern.match(path)
+        if match:
+            path_matched = True
+            if route_method == method:
+                return handler, {key: unquote(value) for key, value in match.groupdict().items()}, 200
+    return None, None, 405 if path_matched else 404
+
+
+async def _read_body(receive):
+    body = b""
+    while True:
+        message = await receive()
+        body += message.get("body", b"")
+        if not message.get("more_body"):
+            return body
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            mutations.start()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await mutations.stop()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+def page_size(request):
+    """?limit of a paged request (None when absent or not a number)"""
+    limit = request.args.get('limit', '')
+    return int(limit) if limit.isdigit() else None
+
+
+async def handle(handler, request, send):
+    """Run a handler and send its response, first passing admission control when it is enabled
+
+    The admission ticket is held until the whole response has been sent, and is
+    released even when the client disconnects before a streamed body started.
+    """
+    ticket = None
+    if admission is not None:
+        endpoint = handler.__name__
+        ticket, rejection = admission.admit(endpoint, estimate_cost(endpoint, system.snapshot().get_size(), page_size(request)))
+        if rejection is not None:
+            status, retry_after, message = rejection
+            status, headers, body = json_response({"success": False, "message": message}, status)
+            await _send(send, status, headers + [(b"retry-after", str(retry_after).encode())], body)
+            return
+    try:
+        await _send(send, *await compress_response(request, *await handler(request)))
+    finally:
+        if ticket is not None:
+            admission.release(ticket)
+
+
+async def compress_response(request, status, headers, body):
+    """Compress the response body according to the client's Accept-Encoding"""
+    header_names = {name for name, _ in headers}
+    if status not in (200, 201) or b"content-encoding" in header_names:
+        return status, headers, body
+    content_type = dict(headers).get(b"content-type", b"").decode().split(";")[0].strip()
+    if not (content_type.startswith("text/") or content_type in COMPRESSIBLE_TYPES):
+        return status, headers, body
+
+    headers = headers + [(b"vary", b"Accept-Encoding")]
+    encoding = choose_encoding(request.headers.get("accept-encoding"))
+    if encoding is None:
+        return status, headers, body
+
+    if isinstance(body, bytes):
+        if len(body) < COMPRESSION_MIN_SIZE:
+            return status, headers, body
+        body = await read(compression_cache.get_or_compress, request.full_path, encoding, body)
+    else:
+        body = compress_stream(body, encoding)
+    return status, headers + [(b"content-encoding", encoding.encode())], body
+
+
+async def application(scope, receive, send):
+    """ASGI entry point"""
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    if scope["method"] == "OPTIONS":
+        status, headers, body = 200, [], b""
+    else:
+        handler, path_params, status = match_route(scope["method"], scope["path"])
+        if handler is not None and replication is not None and replication.role == "replica" \
+                and handler.__name__ in WRITE_ENDPOINTS:
+            # Replicas only serve reads; writes go to the primary
+            status, headers, body = json_response(
+                {"success": False, "message": "This server is a read-only replica!"}, 403)
+        elif handler is None:
+            message = "Not found" if status == 404 else "Method not allowed"
+            status, headers, body = json_response({"success": False, "message": message}, status)
+        else:
+            request = Request(scope, await _read_body(receive), path_params)
+            await handle(handler, request, send)
+            return
+    await _send(send, status, headers, body)
+
+
+async def _send(send, status, headers, body):
+    """Send a bytes body in one message, or stream a generator body"""
+    if not isinstance(body, bytes):
+        await _send_stream(send, status, headers, body)
+        return
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": headers + CORS_HEADERS + [(b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _send_stream(send, status, headers, stream):
+    """Send a generator body chunk by chunk, producing each chunk in a worker thread"""
+    try:
+        await send({"type": "http.response.start", "status": status, "headers": headers + CORS_HEADERS})
+        while True:
+            chunk = await read(next, stream, None)
+            if chunk is None:
+                break
+            if chunk:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+    finally:
+        stream.close()
+
+
+if __name__ == '__main__':
+    import uvicorn
+
+    uvicorn.run("asgi:application", host='0.0.0.0', port=int(os.environ.get("PORT", 5000)))
@@ -0,0 +1,135 @@
+"""
+Concurrency benchmark: Flask dev server (app.py) vs ASGI mode (asgi.py)
+Starts each server in a subprocess, seeds a roster, then drives a mixed
+read/write workload from many concurrent clients and reports throughput
+and latency percentiles for both modes.
+
+Usage:
+    python benchmarks/concurrency.py [--students 500] [--requests 2000] [--concurrency 32]
+"""
+
+import argparse
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERVERS = {
+    # The current mode: Flask's threaded development server
+    "flask": "import app; app.app.run(host='127.0.0.1', port={port}, threaded=True)",
+    "asgi": "import uvicorn; uvicorn.run('asgi:application', host='127.0.0.1', port={port}, log_level='warning')",
+}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def call(base_url, method, path, payload=None):
+    """Send one request and return (latency in ms, ok)"""
+    data = json.dumps(payload).encode() if payload is not None else None
+    request = urllib.request.Request(base_url + path, data=data, method=method,
+                                     headers={"Content-Type": "application/json"})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            response.read()
+            ok = True
+    except urllib.error.HTTPError as error:
+        error.read()
+        ok = error.code < 500
+    except OSError:
+        ok = False
+    return (time.perf_counter() - start) * 1000, ok
+
+
+def wait_until_ready(base_url, timeout=15):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(base_url + "/api/statistics", timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server at {base_url} did not start")
+
+
+def build_workload(students, requests, rng):
+    """Mixed workload: mostly reads, some grade writes"""
+    workload = []
+    for i in range(requests):
+        student_id = f"S{rng.randrange(students):05d}"
+        roll = rng.random()
+        if roll < 0.15:
+            workload.append(("GET", "/api/students", None))
+        elif roll < 0.30:
+            workload.append(("GET", "/api/statistics", None))
+        elif roll < 0.80:
+            workload.append(("GET", f"/api/students/{student_id}", None))
+        else:
+            workload.append(("POST", f"/api/students/{student_id}/grades",
+                             {"subject": f"Subject{i}", "grade": rng.randint(0, 100)}))
+    return workload
+
+
+def run_mode(mode, args):
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = subprocess.Popen([sys.executable, "-c", SERVERS[mode].format(port=port)],
+                              cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_until_ready(base_url)
+        for i in range(args.students):
+            call(base_url, "POST", "/api/students", {"student_id": f"S{i:05d}", "name": f"Student {i}"})
+
+        workload = build_workload(args.students, args.requests, random.Random(args.seed))
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            results = list(pool.map(lambda item: call(base_url, *item), workload))
+        elapsed = time.perf_counter() - start
+    finally:
+        server.terminate()
+        server.wait()
+
+    latencies = sorted(latency for latency, _ in results)
+    errors = sum(1 for _, ok in results if not ok)
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "mode": mode,
+        "throughput_rps": round(len(results) / elapsed, 1),
+        "p50_ms": round(quantiles[49], 2),
+        "p95_ms": round(quantiles[94], 2),
+        "p99_ms": round(quantiles[98], 2),
+        "errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Flask and ASGI serving modes under concurrency")
+    parser.add_argument("--students", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--modes", nargs="+", default=list(SERVERS), choices=list(SERVERS))
+    args = parser.parse_args()
+
+    print(f"{'mode':<8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for mode in args.modes:
+        result = run_mode(mode, args)
+        print(f"{result['mode']:<8}{result['throughput_rps']:>10}{result['p50_ms']:>10}"
+              f"{result['p95_ms']:>10}{result['p99_ms']:>10}{result['errors']:>8}")
+
+
+if __name__ == "__main__":
+    main()
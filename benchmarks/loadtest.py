@@ -0,0 +1,285 @@
+"""
+Load test: replay a mix of API routes at a target request rate
+Sends requests on a fixed schedule (open loop), so a slow server builds a
+backlog instead of slowing the generator down; latency is measured from the
+time each request was due, not from when a worker got to it. Reports
+p50/p95/p99 latency, throughput and error rate per route.
+
+The workload is either a weighted mix of the main routes or a recorded
+request log: one JSON object per line with "method", "path", an optional
+"body" and an optional "at" (seconds since the start of the recording).
+Lines without a method and path are skipped.
+
+Usage:
+    python benchmarks/loadtest.py [--url http://127.0.0.1:5000 | --mode flask|asgi]
+                                  [--rate 200] [--duration 10] [--mix add_grade=30,list=5 ...]
+    python benchmarks/loadtest.py --url ... --log traffic.jsonl [--speed 2 | --rate 200]
+"""
+
+import argparse
+import json
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from concurrency import ROOT, SERVERS, free_port, wait_until_ready
+
+# Relative weights of the generated routes
+DEFAULT_MIX = {
+    "add_student": 5,
+    "add_grade": 25,
+    "update_grade": 15,
+    "search": 15,
+    "list": 5,
+    "statistics": 15,
+    "get_student": 15,
+    "undo": 3,
+    "process_queue": 2,
+}
+
+# Load shedding responses (see report_card/admission.py), counted apart from errors
+SHED_STATUSES = (429, 503)
+
+# Route names for recorded requests: (method, path pattern, name)
+ROUTES = [
+    ("GET", r"/api/students", "list"),
+    ("POST", r"/api/students", "add_student"),
+    ("GET", r"/api/students/search", "search"),
+    ("GET", r"/api/students/batch", "batch_lookup"),
+    ("POST", r"/api/students/batch", "batch_lookup"),
+    ("GET", r"/api/students/[^/]+", "get_student"),
+    ("DELETE", r"/api/students/[^/]+", "delete_student"),
+    ("POST", r"/api/students/[^/]+/grades", "add_grade"),
+    ("PUT", r"/api/students/[^/]+/grades", "update_grade"),
+    ("POST", r"/api/batch", "batch"),
+    ("POST", r"/api/undo", "undo"),
+    ("POST", r"/api/redo", "redo"),
+    ("GET", r"/api/statistics", "statistics"),
+    ("GET", r"/api/queue", "queue"),
+    ("GET", r"/api/stack", "stack"),
+    ("POST", r"/api/queue/process", "process_queue"),
+    ("GET", r"/api/autocomplete", "autocomplete"),
+    ("GET", r"/api/export", "export"),
+]
+ROUTES = [(method, re.compile(pattern + r"/?$"), name) for method, pattern, name in ROUTES]
+
+
+def route_name(method, path):
+    path = path.split("?", 1)[0]
+    for route_method, pattern, name in ROUTES:
+        if method == route_method and pattern.match(path):
+            return name
+    return f"{method} {path}"
+
+
+def send(base_url, method, path, body=None):
+    """Send one request and return its status code (0 when the connection failed)"""
+    data = json.dumps(body).encode() if body is not None else None
+    request = urllib.request.Request(base_url + path, data=data, method=method,
+                                     headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as error:
+        error.read()
+        return error.code
+    except OSError:
+        return 0
+
+
+def parse_mix(text):
+    """'add_grade=30,list=5' -> {'add_grade': 30, 'list': 5}"""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name not in DEFAULT_MIX:
+            raise SystemExit(f"unknown route in mix: {name} (choose from {', '.join(DEFAULT_MIX)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+class MixWorkload:
+    """Endless stream of (route, method, path, body) drawn from a weighted mix"""
+
+    def __init__(self, mix, students, seed):
+        self.names = list(mix)
+        self.weights = [mix[name] for name in self.names]
+        self.students = students
+        self.rng = random.Random(seed)
+        self.added = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        rng = self.rng
+        name = rng.choices(self.names, self.weights)[0]
+        student_id = f"S{rng.randrange(self.students):05d}"
+        grade = {"subject": f"Subject{rng.randrange(1, 8)}", "grade": rng.randint(0, 100)}
+        if name == "add_student":
+            self.added += 1
+            return name, "POST", "/api/students", {"student_id": f"L{self.added:06d}", "name": f"Load {self.added}"}
+        if name == "add_grade":
+            return name, "POST", f"/api/students/{student_id}/grades", grade
+        if name == "update_grade":
+            # Every seeded student has a Subject0 grade
+            return name, "PUT", f"/api/students/{student_id}/grades", {"subject": "Subject0", "grade": grade["grade"]}
+        if name == "search":
+            return name, "GET", f"/api/students/search?name=Student%20{rng.randrange(self.students)}", None
+        if name == "get_student":
+            return name, "GET", f"/api/students/{student_id}", None
+        if name == "list":
+            return name, "GET", "/api/students", None
+        if name == "statistics":
+            return name, "GET", "/api/statistics", None
+        if name == "undo":
+            return name, "POST", "/api/undo", None
+        return name, "POST", "/api/queue/process", None
+
+
+def read_log(path):
+    """Recorded requests as (at, route, method, path, body); 'at' is None when not recorded"""
+    entries = []
+    with open(path) as log:
+        for line in log:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "method" not in record or "path" not in record:
+                continue
+            method = record["method"].upper()
+            entries.append((record.get("at"), route_name(method, record["path"]), method,
+                            record["path"], record.get("body")))
+    return entries
+
+
+def schedule(args):
+    """(due offset in seconds, route, method, path, body) for every request to send"""
+    if args.log:
+        entries = read_log(args.log)
+        if not entries:
+            raise SystemExit(f"no requests with a method and path in {args.log}")
+        if args.rate is None and all(at is not None for at, *_ in entries):
+            first = entries[0][0]
+            return [((at - first) / args.speed, *request) for at, *request in entries]
+        rate = args.rate or 100
+        return [(i / rate, *request) for i, (_, *request) in enumerate(entries)]
+
+    if args.students < 1:
+        raise SystemExit("the generated mix needs seeded students (--students 1 or more)")
+    rate = args.rate or 100
+    workload = MixWorkload(args.mix, args.students, args.seed)
+    return [(i / rate, *next(workload)) for i in range(int(rate * args.duration))]
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of sorted values"""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, round(fraction * len(values)) - 1))]
+
+
+def run(base_url, requests, concurrency):
+    """Send the requests on schedule; returns ([(route, status, latency ms)], elapsed seconds)"""
+    results = []
+    lock = threading.Lock()
+
+    def fire(due, route, method, path, body):
+        status = send(base_url, method, path, body)
+        latency = (time.perf_counter() - due) * 1000
+        with lock:
+            results.append((route, status, latency))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for offset, *request in requests:
+            due = start + offset
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            pool.submit(fire, due, *request)
+    return results, time.perf_counter() - start
+
+
+def summarize(results, elapsed):
+    """Per-route and overall count, throughput, error rates and latency percentiles"""
+    routes = {}
+    for route, status, latency in results:
+        routes.setdefault(route, []).append((status, latency))
+    routes["all"] = [(status, latency) for _, status, latency in results]
+
+    report = {}
+    for route, samples in routes.items():
+        latencies = sorted(latency for _, latency in samples)
+        shed = sum(1 for status, _ in samples if status in SHED_STATUSES)
+        errors = sum(1 for status, _ in samples if (status == 0 or status >= 500) and status not in SHED_STATUSES)
+        rejected = sum(1 for status, _ in samples if 400 <= status < 500 and status not in SHED_STATUSES)
+        report[route] = {
+            "count": len(samples),
+            "throughput_rps": round(len(samples) / elapsed, 1),
+            "p50_ms": round(percentile(latencies, 0.50), 2),
+            "p95_ms": round(percentile(latencies, 0.95), 2),
+            "p99_ms": round(percentile(latencies, 0.99), 2),
+            "error_rate": round(errors / len(samples), 4),  # 5xx and connection failures
+            "shed_rate": round(shed / len(samples), 4),  # 429/503 from admission control
+            "client_error_rate": round(rejected / len(samples), 4),  # 4xx (e.g. unknown student)
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a route mix or a recorded log at a target rate")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", help="running instance to test (default: start one with --mode)")
+    target.add_argument("--mode", choices=list(SERVERS), default="flask")
+    parser.add_argument("--rate", type=float, help="target requests per second (default 100, or the recorded timing)")
+    parser.add_argument("--duration", type=float, default=10, help="seconds of generated traffic")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX, help="route weights, e.g. add_grade=30,list=5")
+    parser.add_argument("--log", help="recorded request log (JSON lines) to replay instead of the mix")
+    parser.add_argument("--speed", type=float, default=1.0, help="replay speed-up for recorded timing")
+    parser.add_argument("--students", type=int, default=500,
+                        help="students to seed (with one grade each) before the run; 0 to skip")
+    parser.add_argument("--concurrency", type=int, default=64, help="maximum requests in flight")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    requests = schedule(args)
+    server = None
+    base_url = args.url.rstrip("/") if args.url else None
+    if base_url is None:
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = subprocess.Popen([sys.executable, "-c", SERVERS[args.mode].format(port=port)],
+                                  cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_until_ready(base_url)
+        for i in range(args.students):
+            send(base_url, "POST", "/api/students", {"student_id": f"S{i:05d}", "name": f"Student {i}"})
+            send(base_url, "POST", f"/api/students/S{i:05d}/grades", {"subject": "Subject0", "grade": 50})
+        results, elapsed = run(base_url, requests, args.concurrency)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    report = summarize(results, elapsed)
+    if args.json:
+        print(json.dumps({"requests": len(requests), "elapsed_s": round(elapsed, 2), "routes": report}, indent=2))
+        return
+
+    print(f"{'route':<16}{'count':>8}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errors':>9}{'shed':>8}{'4xx':>8}")
+    for route, row in sorted(report.items(), key=lambda item: (item[0] == "all", item[0])):
+        print(f"{route:<16}{row['count']:>8}{row['throughput_rps']:>9}{row['p50_ms']:>9}{row['p95_ms']:>9}"
+              f"{row['p99_ms']:>9}{row['error_rate']:>9.2%}{row['shed_rate']:>8.2%}{row['client_error_rate']:>8.2%}")
+
+
+if __name__ == "__main__":
+    main()
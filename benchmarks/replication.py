@@ -0,0 +1,154 @@
+"""
+Replication check: one primary and several read replicas as local processes
+Starts a primary and N replicas of app.py (or asgi.py), drives writes against
+the primary while sampling replica lag, then waits for every replica to catch
+up and verifies that each one serves exactly the primary's roster. One replica
+is restarted midway to exercise reconnect and resume.
+
+Usage:
+    python benchmarks/replication.py [--replicas 2] [--writes 2000] [--mode flask|asgi]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+from concurrency import ROOT, SERVERS, free_port, wait_until_ready
+
+
+def request_json(base_url, method, path, payload=None):
+    data = json.dumps(payload).encode() if payload is not None else None
+    request = urllib.request.Request(base_url + path, data=data, method=method,
+                                     headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+def start_server(mode, role, address):
+    port = free_port()
+    env = dict(os.environ, REPLICATION_ROLE=role, REPLICATION_ADDRESS=address)
+    process = subprocess.Popen([sys.executable, "-c", SERVERS[mode].format(port=port)], cwd=ROOT, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    base_url = f"http://127.0.0.1:{port}"
+    wait_until_ready(base_url)
+    return process, base_url
+
+
+def random_write(base_url, rng, step, students):
+    roll = rng.random()
+    student_id = rng.choice(students)
+    if roll < 0.1:
+        new_id = f"N{step:05d}"
+        students.append(new_id)
+        request_json(base_url, "POST", "/api/students", {"student_id": new_id, "name": f"New {step}"})
+    elif roll < 0.15:
+        request_json(base_url, "DELETE", f"/api/students/{student_id}")
+    elif roll < 0.6:
+        request_json(base_url, "POST", f"/api/students/{student_id}/grades",
+                     {"subject": f"Subject{rng.randrange(8)}", "grade": rng.randint(0, 100)})
+    elif roll < 0.8:
+        request_json(base_url, "PUT", f"/api/students/{student_id}/grades",
+                     {"subject": f"Subject{rng.randrange(8)}", "grade": rng.randint(0, 100)})
+    elif roll < 0.9:
+        request_json(base_url, "POST", "/api/batch", {"mutations": [
+            {"operation_type": "add_grade", "student_id": rng.choice(students),
+             "subject": f"Extra{step}", "grade": rng.randint(0, 100)} for _ in range(3)]})
+    elif roll < 0.95:
+        request_json(base_url, "POST", "/api/undo")
+    else:
+        request_json(base_url, "POST", "/api/redo")
+
+
+def wait_for_catch_up(primary_url, replica_urls, timeout=30):
+    """Seconds until every replica has applied the primary's last LSN"""
+    target = request_json(primary_url, "GET", "/api/replication")[1]["replication"]["lsn"]
+    start = time.perf_counter()
+    pending = set(replica_urls)
+    while pending and time.perf_counter() - start < timeout:
+        for url in list(pending):
+            if request_json(url, "GET", "/api/replication")[1]["replication"]["applied_lsn"] >= target:
+                pending.discard(url)
+        time.sleep(0.01)
+    if pending:
+        raise RuntimeError(f"replicas did not catch up to LSN {target}: {sorted(pending)}")
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check primary/replica log shipping with local processes")
+    parser.add_argument("--mode", choices=list(SERVERS), default="flask")
+    parser.add_argument("--replicas", type=int, default=2)
+    parser.add_argument("--students", type=int, default=200)
+    parser.add_argument("--writes", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    address = f"127.0.0.1:{free_port()}"
+    processes = []
+    try:
+        primary, primary_url = start_server(args.mode, "primary", address)
+        processes.append(primary)
+        replicas = [start_server(args.mode, "replica", address) for _ in range(args.replicas)]
+        processes.extend(process for process, _ in replicas)
+        replica_urls = [url for _, url in replicas]
+
+        status, body = request_json(replica_urls[0], "POST", "/api/students", {"student_id": "X", "name": "X"})
+        assert status == 403, f"replica accepted a write: {status} {body}"
+
+        rng = random.Random(args.seed)
+        students = [f"S{i:05d}" for i in range(args.students)]
+        for student_id in students:
+            request_json(primary_url, "POST", "/api/students", {"student_id": student_id, "name": student_id})
+
+        lag_samples = []
+        start = time.perf_counter()
+        for step in range(args.writes):
+            random_write(primary_url, rng, step, students)
+            if step % 50 == 0:
+                for url in replica_urls:
+                    lag_samples.append(request_json(url, "GET", "/api/replication")[1]["replication"]["lag_ops"])
+            if step == args.writes // 2 and args.replicas > 1:
+                # Restart the last replica: it must reload and catch up
+                replicas[-1][0].terminate()
+                replicas[-1][0].wait()
+                restarted = start_server(args.mode, "replica", address)
+                processes.append(restarted[0])
+                replicas[-1] = restarted
+                replica_urls[-1] = restarted[1]
+        elapsed = time.perf_counter() - start
+
+        catch_up = wait_for_catch_up(primary_url, replica_urls)
+        expected = request_json(primary_url, "GET", "/api/students")[1]["students"]
+        for url in replica_urls:
+            actual = request_json(url, "GET", "/api/students")[1]["students"]
+            assert actual == expected, f"replica {url} diverged from the primary"
+
+        print(json.dumps({
+            "mode": args.mode,
+            "replicas": args.replicas,
+            "writes": args.writes,
+            "write_rps": round(args.writes / elapsed, 1),
+            "lag_ops_mean": round(statistics.mean(lag_samples), 2) if lag_samples else 0,
+            "lag_ops_max": max(lag_samples, default=0),
+            "final_catch_up_ms": round(catch_up * 1000, 2),
+            "primary": request_json(primary_url, "GET", "/api/replication")[1]["replication"],
+            "consistent": True,
+        }, indent=2))
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Sharding benchmark: concurrent write throughput by shard count
+Seeds a roster, then many threads add grades to random students at once.
+Runs the single system and ShardedSystem with increasing shard counts in
+the same process and reports writes per second.
+
+Usage:
+    python benchmarks/sharding.py [--students 5000] [--writes 20000] [--threads 8] [--shards 1 2 4 8]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from report_card import ReportCardManagementSystem  # noqa: E402
+from report_card.sharding import ShardedSystem  # noqa: E402
+
+
+def run(system, args):
+    for i in range(args.students):
+        system.add_student(f"S{i:05d}", f"Student {i}")
+
+    rng = random.Random(args.seed)
+    writes = [(f"S{rng.randrange(args.students):05d}", f"Subject{i}", rng.randint(0, 100))
+              for i in range(args.writes)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        list(pool.map(lambda write: system.add_grade(*write), writes))
+    return args.writes / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent write throughput by shard count")
+    parser.add_argument("--students", type=int, default=5000)
+    parser.add_argument("--writes", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    baseline = run(ReportCardManagementSystem(), args)
+    print(f"{'store':<12}{'writes/s':>12}{'speedup':>10}")
+    print(f"{'single':<12}{baseline:>12.0f}{1.0:>10.2f}")
+    for shard_count in args.shards:
+        throughput = run(ShardedSystem(shard_count), args)
+        print(f"{f'{shard_count} shards':<12}{throughput:>12.0f}{throughput / baseline:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Startup-time benchmark for the web backend
+Measures, in a fresh interpreter per run, the time to import the
+report_card package, the time to import app.py (Flask and its dependencies
+included) and the time to serve the first request. The budget applies to
+the report_card import, the part this repository controls. The total boot
+time (dominated by the Flask import) is checked against the 100 ms worker
+boot target: over it prints a warning, or fails with --strict-boot. With
+--record, results are appended to a JSON-lines history file so boot time can
+be tracked across commits.
+
+Usage:
+    python benchmarks/startup.py [--runs 10] [--budget-ms 25] [--boot-budget-ms 100]
+                                 [--strict-boot] [--record]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HISTORY_FILE = os.path.join(ROOT, "benchmarks", "results", "startup.jsonl")
+
+# Executed in a child interpreter so nothing is already in sys.modules
+CHILD_SCRIPT = """
+import json, time
+t0 = time.perf_counter()
+import report_card
+t1 = time.perf_counter()
+import app
+t2 = time.perf_counter()
+response = app.app.test_client().get('/api/students')
+t3 = time.perf_counter()
+assert response.status_code == 200, response.status_code
+print(json.dumps({"package_import_ms": (t1 - t0) * 1000, "import_ms": (t2 - t0) * 1000,
+                  "first_request_ms": (t3 - t2) * 1000}))
+"""
+
+
+def run_once():
+    """Boot a fresh interpreter and return its timings"""
+    # Any non-empty PYTHONDONTWRITEBYTECODE disables the cache, even "0"
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT],
+        cwd=ROOT, env=env, check=True, capture_output=True, text=True
+    ).stdout
+    timings = json.loads(output.strip().splitlines()[-1])
+    timings["boot_ms"] = timings["import_ms"] + timings["first_request_ms"]
+    return timings
+
+
+def git_revision():
+    """Current commit hash, or None outside a git checkout"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, check=True, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import + first-request time")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=25.0,
+                        help="fail if the median report_card import time exceeds this")
+    parser.add_argument("--boot-budget-ms", type=float, default=100.0,
+                        help="warn if the median total boot time exceeds this")
+    parser.add_argument("--strict-boot", action="store_true",
+                        help="fail instead of warning when the boot time is over its budget")
+    parser.add_argument("--record", action="store_true",
+                        help="append the result to benchmarks/results/startup.jsonl")
+    args = parser.parse_args()
+
+    run_once()  # warm the bytecode cache so runs are comparable
+    runs = [run_once() for _ in range(args.runs)]
+
+    result = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "revision": git_revision(),
+        "python": sys.version.split()[0],
+        "runs": args.runs,
+    }
+    for key in ("package_import_ms", "import_ms", "first_request_ms", "boot_ms"):
+        values = sorted(run[key] for run in runs)
+        result[key] = {
+            "median": round(statistics.median(values), 2),
+            "min": round(values[0], 2),
+            "max": round(values[-1], 2),
+        }
+
+    print(f"report_card:   {result['package_import_ms']['median']:.2f} ms "
+          f"(median of {args.runs}, budget {args.budget_ms:.0f} ms)")
+    print(f"import app:    {result['import_ms']['median']:.2f} ms (including Flask)")
+    print(f"first request: {result['first_request_ms']['median']:.2f} ms")
+    print(f"boot total:    {result['boot_ms']['median']:.2f} ms (budget {args.boot_budget_ms:.0f} ms)")
+
+    if args.record:
+        os.makedirs(os.path.dirname(HISTORY_FILE), exist_ok=True)
+        with open(HISTORY_FILE, "a") as history:
+            history.write(json.dumps(result) + "\n")
+
+    status = 0
+    if result["package_import_ms"]["median"] > args.budget_ms:
+        print("report_card import time is over budget!")
+        status = 1
+    if result["boot_ms"]["median"] > args.boot_budget_ms:
+        if args.strict_boot:
+            print("Boot time is over budget!")
+            status = 1
+        else:
+            print("Warning: boot time is over budget (mostly the Flask import; use --strict-boot to fail)")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""
+Student Report Card Management System - core package
+Data structures (Linked List, Stack, Queue, List) and the management system.
+
+Optional subsystems are registered in _LAZY_ATTRIBUTES and only imported on
+first attribute access, so importing the package keeps worker boot cheap.
+"""
+
+import importlib
+
+from .student import Student, ReportCard
+from .linked_list import StudentLinkedList
+from .stack import UndoStack
+from .operation_queue import OperationQueue, SynchronizedOperationQueue, BatchOperation, describe_operation
+from .system import ReportCardManagementSystem
+
+# Attribute name -> submodule it lives in (imported on first use)
+_LAZY_ATTRIBUTES = {
+    "export_roster": "export",
+    "read_columnar": "export",
+    "TieredStore": "tiered",
+    "ReplicationPrimary": "replication",
+    "ReplicationFollower": "replication",
+    "ShardedSystem": "sharding",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+__all__ = [
+    "Student",
+    "ReportCard",
+    "StudentLinkedList",
+    "UndoStack",
+    "OperationQueue",
+    "SynchronizedOperationQueue",
+    "BatchOperation",
+    "describe_operation",
+    "ReportCardManagementSystem",
+]
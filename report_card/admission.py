@@ -0,0 +1,115 @@
+"""
+Admission Control and Load Shedding
+Listing, statistics, export and name search walk the whole roster, so a few
+of them at once can starve every other request. Each request gets an
+estimated cost (students visited) before it runs:
+
+- Routes with a concurrency limit reject requests beyond it with 429
+- Scan routes share a cost budget; a request that would exceed it while
+  other scans are running is rejected with 503
+- Single-student routes cost 1 and skip the budget, so they stay fast
+
+Rejections carry a Retry-After estimate from the route's recent latency.
+Nothing waits in a queue: a request is admitted or shed immediately.
+"""
+
+import math
+import os
+import threading
+import time
+
+# Endpoints whose work grows with the roster (Flask endpoint / ASGI handler names)
+SCAN_ENDPOINTS = ("get_all_students", "get_statistics", "export_students", "search_students",
+                  "get_memory", "get_memory_diff")
+
+# Concurrent requests allowed per endpoint (others are unlimited)
+DEFAULT_LIMITS = {
+    "get_all_students": 4,
+    "get_statistics": 4,
+    "export_students": 2,
+    "search_students": 8,
+    "get_memory": 1,
+    "get_memory_diff": 1,
+}
+
+# In-flight scan cost allowed at once, in students visited
+DEFAULT_BUDGET = 200000
+
+
+def estimate_cost(endpoint, roster_size, page_size=None):
+    """Estimated students visited by a request (1 for single-student routes)"""
+    if endpoint not in SCAN_ENDPOINTS:
+        return 1
+    if page_size is not None:
+        return max(1, min(roster_size, page_size))
+    return max(1, roster_size)
+
+
+class AdmissionController:
+    """Per-endpoint concurrency limits plus a shared cost budget for scans"""
+
+    def __init__(self, budget=DEFAULT_BUDGET, limits=None):
+        self.budget = budget
+        self.limits = dict(DEFAULT_LIMITS if limits is None else limits)
+        self.lock = threading.Lock()
+        self.active = {}  # endpoint -> requests running
+        self.cost_in_flight = 0
+        self.latency = {}  # endpoint -> moving average of seconds per request
+        self.admitted = 0
+        self.shed = {}  # endpoint -> requests rejected
+
+    @classmethod
+    def from_environ(cls, environ=None):
+        """Build from ADMISSION_BUDGET and ADMISSION_LIMITS ('get_statistics=2,get_all_students=4')"""
+        environ = os.environ if environ is None else environ
+        limits = dict(DEFAULT_LIMITS)
+        for part in filter(None, environ.get("ADMISSION_LIMITS", "").split(",")):
+            endpoint, _, limit = part.partition("=")
+            limits[endpoint.strip()] = int(limit)
+        return cls(int(environ.get("ADMISSION_BUDGET", DEFAULT_BUDGET)), limits)
+
+    def admit(self, endpoint, cost):
+        """Admit a request, returning (ticket, None) or (None, (status, retry_after, message))"""
+        with self.lock:
+            active = self.active.get(endpoint, 0)
+            limit = self.limits.get(endpoint)
+            if limit is not None and active >= limit:
+                return None, self._reject(endpoint, 429, "Too many concurrent requests for this endpoint!")
+            scan = endpoint in SCAN_ENDPOINTS
+            # A scan larger than the whole budget still runs, but only on its own
+            if scan and self.cost_in_flight and self.cost_in_flight + cost > self.budget:
+                return None, self._reject(endpoint, 503, "Server is busy, please retry later!")
+
+            self.active[endpoint] = active + 1
+            if scan:
+                self.cost_in_flight += cost
+            self.admitted += 1
+        return (endpoint, cost if scan else 0, time.perf_counter()), None
+
+    def release(self, ticket):
+        """Finish an admitted request"""
+        endpoint, cost, start = ticket
+        elapsed = time.perf_counter() - start
+        with self.lock:
+            self.active[endpoint] -= 1
+            self.cost_in_flight -= cost
+            previous = self.latency.get(endpoint)
+            self.latency[endpoint] = elapsed if previous is None else 0.8 * previous + 0.2 * elapsed
+
+    def _reject(self, endpoint, status, message):
+        self.shed[endpoint] = self.shed.get(endpoint, 0) + 1
+        # Roughly when the running requests will have finished (whole seconds, at least 1)
+        retry_after = max(1, math.ceil(self.latency.get(endpoint, 0) * max(1, self.active.get(endpoint, 0))))
+        return status, retry_after, message
+
+    def get_stats(self):
+        with self.lock:
+            return {
+                "budget": self.budget,
+                "cost_in_flight": self.cost_in_flight,
+                "limits": dict(self.limits),
+                "active": {endpoint: count for endpoint, count in self.active.items() if count},
+                "admitted": self.admitted,
+                "shed": dict(self.shed),
+                "latency_ms": {endpoint: round(seconds * 1000, 2) for endpoint, seconds in self.latency.items()},
+            }
@@ -0,0 +1,312 @@
+"""
+Streaming Roster Export
+Streams students from the StudentLinkedList in fixed-size chunks as CSV,
+NDJSON or a compact columnar binary format, optionally gzip-compressed.
+Only one chunk is held in memory at a time.
+
+Exports are resumable: every record carries its student_id, and passing the
+last exported ID as the cursor ('after') continues right after it. If that
+student has been deleted since, the export continues after the list position
+it had; a cursor the roster never contained is rejected.
+
+Command-line client (talks to a running server):
+    python -m report_card.export --url http://localhost:5000 --format ndjson -o roster.ndjson
+    python -m report_card.export ... --resume     (continue an interrupted export)
+"""
+
+import csv
+import io
+import json
+import struct
+import sys
+import zlib
+from array import array
+
+# format -> (content type, file extension)
+FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "columnar": ("application/octet-stream", "rcc"),
+}
+
+DEFAULT_CHUNK_SIZE = 500
+MAX_CHUNK_SIZE = 10000
+
+CSV_HEADER = ["student_id", "name", "subject", "grade"]
+
+# Columnar format: magic, then length-prefixed frames, then a zero length
+COLUMNAR_MAGIC = b"RCC1"
+
+
+def iter_chunks(students, chunk_size):
+    """Group an iterator of students into lists of at most chunk_size"""
+    chunk = []
+    for student in students:
+        chunk.append(student)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def encode_csv_chunk(chunk):
+    """One row per (student, subject); students without grades get one empty row"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for student in chunk:
+        card = student.report_card
+        if not card.subjects:
+            writer.writerow([student.student_id, student.name, "", ""])
+        for subject, grade in zip(card.subjects, card.grades):
+            writer.writerow([student.student_id, student.name, subject, grade])
+    return buffer.getvalue().encode("utf-8")
+
+
+def encode_ndjson_chunk(chunk):
+    """One JSON object per student per line"""
+    return "".join(json.dumps(student.to_dict()) + "\n" for student in chunk).encode("utf-8")
+
+
+def _pack_strings(strings):
+    return b"".join(struct.pack("<H", len(encoded)) + encoded
+                    for encoded in (value.encode("utf-8") for value in strings))
+
+
+def encode_columnar_chunk(chunk):
+    """Encode a chunk as one column-oriented frame
+
+    Frame layout (little-endian):
+        uint32 student count, uint32 subject dictionary size,
+        dictionary strings, student_id strings, name strings,
+        uint16 subject count per student, uint32 subject index per grade,
+        float64 grade per grade.
+    Strings are uint16 length + UTF-8 bytes. Subject names are stored once per
+    frame in the dictionary and referenced by index.
+    """
+    dictionary = {}
+    counts = array("H")
+    subject_indexes = array("I")
+    grades = array("d")
+    for student in chunk:
+        card = student.report_card
+        counts.append(len(card.subjects))
+        for subject, grade in zip(card.subjects, card.grades):
+            subject_indexes.append(dictionary.setdefault(subject, len(dictionary)))
+            grades.append(grade)
+
+    columns = [counts, subject_indexes, grades]
+    if sys.byteorder == "big":
+        for column in columns:
+            column.byteswap()
+
+    frame = b"".join([
+        struct.pack("<II", len(chunk), len(dictionary)),
+        _pack_strings(dictionary),
+        _pack_strings(student.student_id for student in chunk),
+        _pack_strings(student.name for student in chunk),
+        counts.tobytes(), subject_indexes.tobytes(), grades.tobytes(),
+    ])
+    return struct.pack("<I", len(frame)) + frame
+
+
+ENCODERS = {
+    "csv": encode_csv_chunk,
+    "ndjson": encode_ndjson_chunk,
+    "columnar": encode_columnar_chunk,
+}
+
+
+def export_roster(student_list, fmt="ndjson", after=None, chunk_size=DEFAULT_CHUNK_SIZE, compress=None):
+    """Build a streaming export of the roster
+
+    Returns (stream, error) where stream is a generator of bytes chunks.
+    """
+    if fmt not in FORMATS:
+        return None, f"Format must be one of {', '.join(FORMATS)}!"
+    if compress not in (None, "gzip"):
+        return None, "Compression must be 'gzip'!"
+    if not (1 <= chunk_size <= MAX_CHUNK_SIZE):
+        return None, f"Chunk size must be between 1 and {MAX_CHUNK_SIZE}!"
+
+    students = student_list.iter_students(after)
+    if students is None:
+        return None, f"Cursor student {after} not found!"
+
+    stream = _encode_stream(students, fmt, chunk_size, header=after is None)
+    if compress == "gzip":
+        stream = _gzip_stream(stream)
+    return stream, None
+
+
+def _encode_stream(students, fmt, chunk_size, header=True):
+    encode = ENCODERS[fmt]
+    if header and fmt == "csv":
+        yield (",".join(CSV_HEADER) + "\n").encode("utf-8")
+    if header and fmt == "columnar":
+        yield COLUMNAR_MAGIC
+    for chunk in iter_chunks(students, chunk_size):
+        yield encode(chunk)
+    if fmt == "columnar":
+        yield struct.pack("<I", 0)
+
+
+def _gzip_stream(stream, level=6):
+    """Gzip-compress a byte stream chunk by chunk (a fresh gzip member)"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for data in stream:
+        compressed = compressor.compress(data)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def read_columnar(fileobj):
+    """Decode a columnar export, yielding one student dictionary at a time
+
+    A missing magic header is allowed so resumed (appended) exports can be
+    read frame by frame as well.
+    """
+    start = fileobj.read(4)
+    if start == COLUMNAR_MAGIC:
+        start = fileobj.read(4)
+    while len(start) == 4:
+        (length,) = struct.unpack("<I", start)
+        if length == 0:
+            start = fileobj.read(4)
+            continue
+        frame = fileobj.read(length)
+        if len(frame) < length:
+            return  # Truncated frame from an interrupted export
+        yield from _decode_frame(frame)
+        start = fileobj.read(4)
+
+
+def _decode_frame(frame):
+    count, dictionary_size = struct.unpack_from("<II", frame, 0)
+    offset = 8
+
+    def read_strings(n):
+        nonlocal offset
+        values = []
+        for _ in range(n):
+            (length,) = struct.unpack_from("<H", frame, offset)
+            offset += 2
+            values.append(frame[offset:offset + length].decode("utf-8"))
+            offset += length
+        return values
+
+    def read_array(typecode, n):
+        nonlocal offset
+        values = array(typecode)
+        values.frombytes(frame[offset:offset + n * values.itemsize])
+        if sys.byteorder == "big":
+            values.byteswap()
+        offset += n * values.itemsize
+        return values
+
+    dictionary = read_strings(dictionary_size)
+    student_ids = read_strings(count)
+    names = read_strings(count)
+    counts = read_array("H", count)
+    total = sum(counts)
+    subject_indexes = read_array("I", total)
+    grades = read_array("d", total)
+
+    position = 0
+    for student_id, name, n in zip(student_ids, names, counts):
+        subjects = [dictionary[i] for i in subject_indexes[position:position + n]]
+        yield {"student_id": student_id, "name": name, "subjects": subjects,
+               "grades": list(grades[position:position + n])}
+        position += n
+
+
+def _csv_row_id(line):
+    return next(csv.reader([line.decode("utf-8")]))[0]
+
+
+def _last_exported_id(path, fmt):
+    """Find the last complete record in a partial export and trim anything after it"""
+    with open(path, "rb+") as output:
+        data = output.read()
+        if fmt == "columnar":
+            offset = 4 if data.startswith(COLUMNAR_MAGIC) else 0
+            last_id, end = None, offset
+            while offset + 4 <= len(data):
+                (length,) = struct.unpack_from("<I", data, offset)
+                frame = data[offset + 4:offset + 4 + length]
+                if length == 0 or len(frame) < length:
+                    break
+                for record in _decode_frame(frame):
+                    last_id = record["student_id"]
+                offset += 4 + length
+                end = offset
+        else:
+            end = data.rfind(b"\n") + 1
+            lines = data[:end].split(b"\n")[:-1]
+            last_id = None
+            if fmt == "csv" and len(lines) > 1:
+                # A student spans several rows and the cut may fall between them:
+                # drop all rows of the last student and resume after the one before
+                first = len(lines) - 1
+                cut_id = _csv_row_id(lines[first])
+                while first > 1 and _csv_row_id(lines[first - 1]) == cut_id:
+                    first -= 1
+                end = sum(len(line) + 1 for line in lines[:first])
+                last_id = _csv_row_id(lines[first - 1]) if first > 1 else None
+            elif fmt != "csv" and lines:
+                last_id = json.loads(lines[-1])["student_id"]
+        output.truncate(end)
+    return last_id, end
+
+
+def main(argv=None):
+    """Download an export from a running server, optionally resuming it"""
+    import argparse
+    import os
+    import urllib.parse
+    import urllib.request
+
+    parser = argparse.ArgumentParser(description="Stream the student roster to a file")
+    parser.add_argument("--url", default="http://localhost:5000", help="server base URL")
+    parser.add_argument("--format", choices=list(FORMATS), default="ndjson")
+    parser.add_argument("--output", "-o", required=True)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--gzip", action="store_true", help="compress the output")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue an interrupted export in --output")
+    args = parser.parse_args(argv)
+
+    params = {"format": args.format, "chunk_size": args.chunk_size}
+    mode = "wb"
+    if args.resume and os.path.exists(args.output):
+        if args.gzip:
+            parser.error("--resume is only supported for uncompressed exports")
+        last_id, end = _last_exported_id(args.output, args.format)
+        if last_id is not None:
+            params["after"] = last_id
+            mode = "ab"
+        elif end:
+            mode = "ab"  # Header already written, no complete records yet
+    if args.gzip:
+        params["compress"] = "gzip"
+
+    url = f"{args.url.rstrip('/')}/api/export?{urllib.parse.urlencode(params)}"
+    written = 0
+    with urllib.request.urlopen(url) as response, open(args.output, mode) as output:
+        if mode == "ab" and "after" not in params:
+            # The server sends the header again; keep the one already on disk
+            header = len(COLUMNAR_MAGIC) if args.format == "columnar" else len(",".join(CSV_HEADER)) + 1
+            response.read(header)
+        while True:
+            data = response.read(64 * 1024)
+            if not data:
+                break
+            output.write(data)
+            written += len(data)
+    print(f"Wrote {written} bytes to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
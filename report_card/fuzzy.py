@@ -0,0 +1,128 @@
+"""
+Symmetric-Delete Index for Typo-Tolerant Name Search
+Finds students whose name words are within a bounded edit distance of the
+query words ("Jonh" -> "John", "Deepka" -> "Deepika") without computing the
+edit distance against every student.
+
+Every indexed word is stored under all of its variants with up to
+max_distance characters deleted. A query generates its own delete variants
+and only the words sharing a variant are verified with a real edit distance.
+"""
+
+
+def delete_variants(word, max_distance):
+    """All strings obtained by deleting up to max_distance characters from word"""
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for value in frontier:
+            for i in range(len(value)):
+                next_frontier.add(value[:i] + value[i + 1:])
+        variants |= next_frontier
+        frontier = next_frontier
+    return variants
+
+
+def edit_distance(a, b, max_distance):
+    """Edit distance with adjacent transpositions (optimal string alignment)
+
+    Returns max_distance + 1 as soon as the distance is known to exceed it.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+class SymmetricDeleteIndex:
+    """Fuzzy name index, kept current by StudentLinkedList"""
+
+    def __init__(self, max_distance=2):
+        self.max_distance = max_distance
+        self.words = {}  # word -> {student_id: Student}
+        self.deletes = {}  # delete variant -> set of words
+
+    def student_added(self, student):
+        for word in set(student.name.lower().split()):
+            students = self.words.get(word)
+            if students is None:
+                students = self.words[word] = {}
+                for variant in delete_variants(word, self.max_distance):
+                    self.deletes.setdefault(variant, set()).add(word)
+            students[student.student_id] = student
+
+    def student_removed(self, student):
+        for word in set(student.name.lower().split()):
+            students = self.words.get(word)
+            if students is None:
+                continue
+            students.pop(student.student_id, None)
+            if not students:
+                del self.words[word]
+                for variant in delete_variants(word, self.max_distance):
+                    words = self.deletes.get(variant)
+                    if words is not None:
+                        words.discard(word)
+                        if not words:
+                            del self.deletes[variant]
+
+    def report_card_changed(self, student, event, subject, old_grade, new_grade):
+        pass  # Grades do not affect name search
+
+    def clear(self):
+        self.words.clear()
+        self.deletes.clear()
+
+    def _matching_words(self, query_word, max_distance):
+        """Indexed words within max_distance of query_word, as word -> distance"""
+        matches = {}
+        for variant in delete_variants(query_word, max_distance):
+            for word in self.deletes.get(variant, ()):
+                if word not in matches:
+                    distance = edit_distance(query_word, word, max_distance)
+                    if distance <= max_distance:
+                        matches[word] = distance
+        return matches
+
+    def search(self, query, max_distance=None):
+        """Students matching every query word within the distance bound
+
+        Returns a list of (student, distance) ranked by total distance, where
+        each query word counts the distance to its closest word in the name.
+        """
+        if max_distance is None or max_distance > self.max_distance:
+            max_distance = self.max_distance
+
+        totals = None
+        for query_word in query.lower().split():
+            best = {}  # student_id -> (distance, student) for this query word
+            for word, distance in self._matching_words(query_word, max_distance).items():
+                for student_id, student in self.words[word].items():
+                    if student_id not in best or distance < best[student_id][0]:
+                        best[student_id] = (distance, student)
+
+            if totals is None:
+                totals = best
+            else:
+                totals = {student_id: (totals[student_id][0] + distance, student)
+                          for student_id, (distance, student) in best.items()
+                          if student_id in totals}
+            if not totals:
+                return []
+
+        results = [(student, distance) for distance, student in (totals or {}).values()]
+        results.sort(key=lambda item: (item[1], item[0].name.lower(), item[0].student_id))
+        return results
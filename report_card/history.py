@@ -0,0 +1,290 @@
+"""
+Grade History (append-only time series)
+Records every grade change per (student, subject) so the value at any past
+time and the changes since a time can be answered after update_grade has
+overwritten the report card.
+
+GradeHistory is registered on the StudentLinkedList like the other indexes.
+Each (student, subject) series is a bytearray of delta-encoded entries:
+
+    varint(milliseconds since the previous entry)
+    varint(header) where header is
+        zigzag(grade delta in hundredths) << 2 | 0   - exact to 0.01 (the usual case)
+        1                                            - subject removed
+        2, followed by 8 bytes                       - any other grade (raw double)
+
+so a typical change costs 3-5 bytes. Every CHECKPOINT_EVERY entries the
+decoder state is saved in small arrays, so "as of T" decodes at most that
+many entries after a binary search.
+
+History outlives the roster: deleting a student records the removal of each
+subject but keeps the series, so audits still see the student's grades.
+"""
+
+import bisect
+import math
+import struct
+import threading
+import time
+from array import array
+from collections import OrderedDict
+
+CHECKPOINT_EVERY = 64
+
+KIND_CENTI = 0
+KIND_REMOVED = 1
+KIND_FLOAT = 2
+
+_DOUBLE = struct.Struct("<d")
+
+
+def _put_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _get_varint(data, position):
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
+
+
+def _zigzag(value):
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value):
+    return value // 2 if value % 2 == 0 else -(value + 1) // 2
+
+
+def _as_centi(grade):
+    """Grade in hundredths, or None when that would lose precision"""
+    try:
+        centi = round(grade * 100)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return centi if centi / 100 == grade else None
+
+
+class GradeSeries:
+    """Delta-encoded changes of one (student, subject)"""
+
+    __slots__ = ("data", "count", "last_time", "last_value", "last_centi", "checkpoints")
+
+    def __init__(self):
+        self.data = bytearray()
+        self.count = 0
+        self.last_time = 0  # ms; the first delta is relative to 0
+        self.last_value = None  # None: no grade (never set or removed)
+        self.last_centi = 0  # Base for the next hundredths delta
+        # Decoder state before every CHECKPOINT_EVERY-th entry:
+        # (times, offsets, centis, values with NaN for None), created on first use
+        self.checkpoints = None
+
+    def append(self, when, grade):
+        if self.count and self.count % CHECKPOINT_EVERY == 0:
+            if self.checkpoints is None:
+                self.checkpoints = (array("q"), array("Q"), array("q"), array("d"))
+            times, offsets, centis, values = self.checkpoints
+            offsets.append(len(self.data))
+            centis.append(self.last_centi)
+            values.append(math.nan if self.last_value is None else self.last_value)
+            times.append(self.last_time)  # Last: readers bisect on times
+
+        entry = bytearray()
+        _put_varint(entry, when - self.last_time)
+        centi = None if grade is None else _as_centi(grade)
+        if grade is None:
+            _put_varint(entry, KIND_REMOVED)
+        elif centi is not None:
+            _put_varint(entry, _zigzag(centi - self.last_centi) << 2 | KIND_CENTI)
+            self.last_centi = centi
+        else:
+            _put_varint(entry, KIND_FLOAT)
+            entry += _DOUBLE.pack(grade)
+        self.data += entry  # One extend, so lock-free readers never see half an entry
+        self.count += 1
+        self.last_time = when
+        self.last_value = grade
+
+    def _start(self, when):
+        """Decoder state (time, value, centi, offset) at the last checkpoint at or before 'when'"""
+        if self.checkpoints is not None:
+            times, offsets, centis, values = self.checkpoints
+            index = bisect.bisect_right(times, when) - 1
+            if index >= 0:
+                value = values[index]
+                return times[index], None if math.isnan(value) else value, centis[index], offsets[index]
+        return 0, None, 0, 0
+
+    def _entries(self, state):
+        """Yield (time ms, old grade, new grade) for every entry after a decoder state"""
+        end = len(self.data)  # Entries appended while decoding are left out
+        when, value, centi, position = state
+        data = self.data
+        while position < end:
+            delta, position = _get_varint(data, position)
+            header, position = _get_varint(data, position)
+            when += delta
+            kind = header & 3
+            if kind == KIND_CENTI:
+                centi += _unzigzag(header >> 2)
+                new = centi / 100
+            elif kind == KIND_REMOVED:
+                new = None
+            else:
+                new = _DOUBLE.unpack_from(data, position)[0]
+                position += _DOUBLE.size
+            yield when, value, new
+            value = new
+
+    def decode(self, since=None):
+        """Yield (time ms, old grade, new grade) for entries after 'since' (all when None)"""
+        if since is None:
+            yield from self._entries((0, None, 0, 0))
+            return
+        for entry in self._entries(self._start(since)):
+            if entry[0] > since:
+                yield entry
+
+    def value_at(self, when):
+        """Grade at time 'when' (ms), None if it had none"""
+        state = self._start(when)
+        value = state[1]
+        for change_time, _, new in self._entries(state):
+            if change_time > when:
+                break
+            value = new
+        return value
+
+    def nbytes(self):
+        size = len(self.data)
+        if self.checkpoints is not None:
+            size += sum(column.itemsize * len(column) for column in self.checkpoints)
+        return size
+
+
+class GradeHistory:
+    """Index listener recording every grade change as a time series"""
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self.lock = threading.Lock()
+        # (student_id, subject) -> GradeSeries, least recently changed first
+        self.series = OrderedDict()
+        self.subjects = {}  # student_id -> {subject: GradeSeries}
+        self.now = 0  # Last timestamp handed out (ms); never goes backwards
+        self.changes = 0
+
+    def _record(self, student_id, subject, grade):
+        with self.lock:
+            key = (student_id, subject)
+            series = self.series.get(key)
+            if series is None:
+                if grade is None:
+                    return
+                series = self.series[key] = GradeSeries()
+                self.subjects.setdefault(student_id, {})[subject] = series
+            elif series.last_value == grade:
+                return
+            self.now = max(self.now, int(self.clock() * 1000))
+            series.append(self.now, grade)
+            self.series.move_to_end(key)
+            self.changes += 1
+
+    # Index listener protocol
+
+    def student_added(self, student):
+        # New students, and ones restored by undo or a replica reload: record
+        # only grades that differ from the latest history
+        card = student.report_card
+        for subject, grade in zip(card.subjects, card.grades):
+            self._record(student.student_id, subject, grade)
+
+    def student_removed(self, student):
+        for subject in student.report_card.get_all_subjects():
+            self._record(student.student_id, subject, None)
+
+    def report_card_changed(self, student, event, subject, old_grade, new_grade):
+        self._record(student.student_id, subject, new_grade)
+
+    def clear(self):
+        """Keep the history: it is an audit trail, not a copy of the roster"""
+
+    # Queries (times are epoch seconds, like time.time())
+
+    def _series_for(self, student_id, subject=None):
+        with self.lock:
+            subjects = self.subjects.get(student_id, {})
+            if subject is not None:
+                return {subject: subjects[subject]} if subject in subjects else {}
+            return dict(subjects)
+
+    def has_history(self, student_id):
+        return student_id in self.subjects
+
+    def history(self, student_id, subject=None, since=None):
+        """Changes of a student (one subject or all) after 'since', oldest first"""
+        since_ms = None if since is None else int(since * 1000)
+        changes = []
+        for name, series in self._series_for(student_id, subject).items():
+            changes.extend(_change(when, student_id, name, old, new) for when, old, new in series.decode(since_ms))
+        changes.sort(key=lambda change: change["time"])
+        return changes
+
+    def as_of(self, student_id, when, subject=None):
+        """{subject: grade} of a student at time 'when' (subjects without a grade then are left out)"""
+        when_ms = int(when * 1000)
+        grades = {}
+        for name, series in self._series_for(student_id, subject).items():
+            value = series.value_at(when_ms)
+            if value is not None:
+                grades[name] = value
+        return grades
+
+    def changes_since(self, since, limit=None):
+        """Every change after 'since' across all students, oldest first"""
+        since_ms = int(since * 1000)
+        with self.lock:
+            recent = []
+            # Walk back from the most recently changed series until one is older than 'since'
+            for key in reversed(self.series):
+                series = self.series[key]
+                if series.last_time <= since_ms:
+                    break
+                recent.append((key, series))
+        changes = []
+        for (student_id, subject), series in recent:
+            changes.extend(_change(when, student_id, subject, old, new)
+                           for when, old, new in series.decode(since_ms))
+        changes.sort(key=lambda change: change["time"])
+        return changes if limit is None else changes[:limit]
+
+    def get_stats(self):
+        with self.lock:
+            series = list(self.series.values())
+            changes = self.changes
+        size = sum(item.nbytes() for item in series)
+        return {
+            "series": len(series),
+            "changes": changes,
+            "bytes": size,
+            "bytes_per_change": round(size / changes, 2) if changes else 0,
+        }
+
+
+def _change(when, student_id, subject, old_grade, new_grade):
+    return {
+        "time": when / 1000,
+        "student_id": student_id,
+        "subject": subject,
+        "old_grade": old_grade,
+        "new_grade": new_grade,
+    }
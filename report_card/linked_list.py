@@ -0,0 +1,217 @@
+"""
+Linked List Implementation for Student Records
+Each node contains a Student object
+"""
+
+import functools
+import itertools
+
+from .student import Student
+
+class Node:
+    """Node class for Linked List"""
+    
+    def __init__(self, data):
+        self.data = data  # Student object
+        self.next = None
+
+
+class StudentLinkedList:
+    """Linked List ADT for managing student records
+    
+    Secondary indexes registered with add_index are notified of every change:
+    student_added(student), student_removed(student),
+    report_card_changed(student, event, subject, old_grade, new_grade), clear().
+    
+    With a TieredStore, the report cards of stored students may be spilled to
+    disk and are faulted back in when read.
+    
+    Every added student gets the next insertion position (student.position).
+    Students are always appended, so positions increase in list order; the
+    position of a removed student is kept in removed_positions so a cursor
+    pointing at it can still be resumed.
+    """
+    
+    def __init__(self, store=None):
+        self.head = None
+        self.size = 0
+        self.indexes = []
+        self.store = store
+        self.positions = itertools.count()
+        self.removed_positions = {}  # student_id -> position of a removed student
+    
+    def is_empty(self):
+        """Check if the linked list is empty"""
+        return self.head is None
+    
+    def add_student(self, student):
+        """Add a student to the linked list (at the end)"""
+        new_node = Node(student)
+        
+        if self.is_empty():
+            self.head = new_node
+        else:
+            current = self.head
+            while current.next is not None:
+                current = current.next
+            current.next = new_node
+        
+        self.size += 1
+        student.position = next(self.positions)
+        self.removed_positions.pop(student.student_id, None)
+        self._attach(student)
+        return True
+    
+    def remove_student(self, student_id):
+        """Remove a student by ID from the linked list"""
+        if self.is_empty():
+            return None
+        
+        # If head node is to be removed
+        if self.head.data.student_id == student_id:
+            removed_student = self.head.data
+            self.head = self.head.next
+            self.size -= 1
+            self._detach(removed_student)
+            return removed_student
+        
+        # Search for the node to remove
+        current = self.head
+        while current.next is not None:
+            if current.next.data.student_id == student_id:
+                removed_student = current.next.data
+                current.next = current.next.next
+                self.size -= 1
+                self._detach(removed_student)
+                return removed_student
+            current = current.next
+        
+        return None
+    
+    def search_student(self, student_id):
+        """Search for a student by ID"""
+        current = self.head
+        while current is not None:
+            if current.data.student_id == student_id:
+                return current.data
+            current = current.next
+        return None
+    
+    def search_students(self, student_ids):
+        """Find many students by ID in a single traversal
+        
+        Returns a dict of student_id -> Student for the IDs that were found.
+        """
+        remaining = set(student_ids)
+        found = {}
+        current = self.head
+        while current is not None and remaining:
+            student_id = current.data.student_id
+            if student_id in remaining:
+                found[student_id] = current.data
+                remaining.discard(student_id)
+            current = current.next
+        return found
+    
+    def search_by_name(self, name):
+        """Search for students by name (can return multiple)"""
+        results = []
+        current = self.head
+        while current is not None:
+            if name.lower() in current.data.name.lower():
+                results.append(current.data)
+            current = current.next
+        return results
+    
+    def display_all(self):
+        """Display all students in the linked list"""
+        if self.is_empty():
+            return "No students found."
+        
+        result = f"\nTotal Students: {self.size}\n"
+        result += "=" * 60 + "\n"
+        current = self.head
+        index = 1
+        while current is not None:
+            result += f"\n[{index}] {current.data.display()}\n"
+            current = current.next
+            index += 1
+        return result
+    
+    def iter_students(self, after=None):
+        """Iterate over students in list order without copying them
+        
+        If 'after' is given, iteration starts after the student with that ID,
+        or after the position it had if it was removed since. Returns None when
+        that student was never in the list.
+        """
+        current = self.head
+        if after is not None:
+            while current is not None and current.data.student_id != after:
+                current = current.next
+            if current is None:
+                position = self.removed_positions.get(after)
+                if position is None:
+                    return None
+                current = self.head
+                while current is not None and current.data.position < position:
+                    current = current.next
+            else:
+                current = current.next
+        return self._iter_from(current)
+    
+    def _iter_from(self, current):
+        while current is not None:
+            yield current.data
+            current = current.next
+    
+    def get_all_students(self):
+        """Get a list of all students"""
+        students = []
+        current = self.head
+        while current is not None:
+            students.append(current.data)
+            current = current.next
+        return students
+    
+    def get_size(self):
+        """Get the size of the linked list"""
+        return self.size
+    
+    def clear(self):
+        """Clear all students from the linked list"""
+        current = self.head
+        while current is not None:
+            current.data.report_card.on_change = None
+            current = current.next
+        self.head = None
+        self.size = 0
+        self.removed_positions = {}
+        for index in self.indexes:
+            index.clear()
+    
+    def add_index(self, index):
+        """Register a secondary index and load the current students into it"""
+        self.indexes.append(index)
+        current = self.head
+        while current is not None:
+            index.student_added(current.data)
+            current = current.next
+    
+    def _attach(self, student):
+        if self.store is not None:
+            student.report_card.store = self.store
+        student.report_card.on_change = functools.partial(self._report_card_changed, student)
+        for index in self.indexes:
+            index.student_added(student)
+    
+    def _detach(self, student):
+        self.removed_positions[student.student_id] = student.position
+        student.report_card.on_change = None
+        for index in self.indexes:
+            index.student_removed(student)
+    
+    def _report_card_changed(self, student, event, subject, old_grade, new_grade):
+        for index in self.indexes:
+            index.report_card_changed(student, event, subject, old_grade, new_grade)
+
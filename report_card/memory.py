@@ -0,0 +1,156 @@
+"""
+Memory Accounting
+Estimates the memory held by each data structure of the system and tracks
+allocations between two points in time with tracemalloc.
+
+measure() walks the object graph of each structure (gc.get_referents),
+summing sys.getsizeof of every object reached. Structures are measured in order and an object is
+counted only once, by the first structure that reaches it, so students are
+charged to the linked list and the undo stack is charged only for what it
+holds on its own (deep copies, removed students, command records). The walk
+never enters another measured structure, callbacks, modules or locks.
+"""
+
+import functools
+import gc
+import os
+import sys
+import threading
+import tracemalloc
+import types
+import weakref
+
+# Never walked into: code, callbacks, OS resources and weak references
+SKIP_TYPES = (
+    type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType,
+    functools.partial, weakref.ReferenceType, weakref.finalize,
+    type(threading.Lock()), type(threading.RLock()),
+)
+
+
+def _walk(root, seen, roots):
+    """(bytes, objects) reachable from root that no earlier walk has counted"""
+    size = count = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        key = id(obj)
+        if key in seen or (key in roots and obj is not root):
+            continue
+        seen.add(key)
+        if isinstance(obj, SKIP_TYPES):
+            continue
+        size += sys.getsizeof(obj)
+        count += 1
+        # Unlike reading __dict__, traversal never materializes an instance's attribute dict
+        stack.extend(gc.get_referents(obj))
+    return size, count
+
+
+def measure(structures, exclude=()):
+    """Estimated {name: {"bytes", "objects"}} for [(name, structure)], summing repeated names
+
+    Objects in 'exclude' (and whatever only they reach) are not walked.
+    """
+    roots = {id(obj) for _, obj in structures} | {id(obj) for obj in exclude}
+    seen = set()
+    report = {}
+    for name, obj in structures:
+        if obj is None:
+            continue
+        size, count = _walk(obj, seen, roots)
+        entry = report.setdefault(name, {"bytes": 0, "objects": 0})
+        entry["bytes"] += size
+        entry["objects"] += count
+    return report
+
+
+def process_memory():
+    """Resident set size of this process in bytes (None where unavailable) and its peak"""
+    rss = peak = None
+    try:
+        with open("/proc/self/statm") as statm:
+            rss = int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak *= 1 if sys.platform == "darwin" else 1024  # bytes on macOS, KiB elsewhere
+    except ImportError:
+        pass
+    return {"rss_bytes": rss, "peak_rss_bytes": peak}
+
+
+def _location(traceback, group_by):
+    if group_by == "traceback":
+        return [f"{frame.filename}:{frame.lineno}" for frame in traceback]
+    if group_by == "filename":
+        return traceback[0].filename
+    return f"{traceback[0].filename}:{traceback[0].lineno}"
+
+
+class AllocationTracker:
+    """tracemalloc baseline snapshot and diffs against it"""
+
+    GROUPINGS = ("lineno", "filename", "traceback")
+
+    def __init__(self):
+        self.baseline = None
+        self.lock = threading.Lock()
+
+    def start(self, frames=1):
+        """Start tracing (if needed) and take the baseline snapshot"""
+        with self.lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(frames)
+            self.baseline = self._snapshot()
+
+    def stop(self):
+        with self.lock:
+            self.baseline = None
+            if tracemalloc.is_tracing():
+                tracemalloc.stop()
+
+    def _snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
+
+    def diff(self, group_by="lineno", limit=20, reset=False):
+        """Largest allocation changes since the baseline, returning (diff, error)"""
+        if group_by not in self.GROUPINGS:
+            return None, f"group_by must be one of {', '.join(self.GROUPINGS)}!"
+        with self.lock:
+            if self.baseline is None or not tracemalloc.is_tracing():
+                return None, "Allocation tracking is not started!"
+            snapshot = self._snapshot()
+            stats = snapshot.compare_to(self.baseline, group_by)
+            if reset:
+                self.baseline = snapshot
+        return {
+            "size_diff_bytes": sum(stat.size_diff for stat in stats),
+            "top": [{
+                "location": _location(stat.traceback, group_by),
+                "size_bytes": stat.size,
+                "size_diff_bytes": stat.size_diff,
+                "count": stat.count,
+                "count_diff": stat.count_diff,
+            } for stat in stats[:limit]],
+        }, None
+
+    def get_status(self):
+        tracing = tracemalloc.is_tracing()
+        current, peak = tracemalloc.get_traced_memory() if tracing else (0, 0)
+        return {
+            "tracing": tracing,
+            "frames": tracemalloc.get_traceback_limit() if tracing else None,
+            "traced_bytes": current,
+            "traced_peak_bytes": peak,
+        }
+
+
+# Shared by the web backends (one tracemalloc per process)
+tracker = AllocationTracker()
@@ -0,0 +1,201 @@
+"""
+Multi-Version Snapshots of the Roster
+Readers get an immutable, point-in-time view of every student without
+taking the system lock, while writers keep mutating the live linked list.
+
+SnapshotIndex is registered on the StudentLinkedList like any other index.
+It collects the changes of one system mutation and publishes them as a new
+Snapshot when the mutation finishes (so a batch is never seen half-applied).
+A snapshot stores frozen student records in fixed-size chunks; publishing
+copies only the chunks that changed plus the small tuple of chunk
+references, and shares every other chunk with the previous version.
+
+Old versions are reclaimed by reference counting: a snapshot, and any chunk
+only it still uses, is freed as soon as no reader holds it.
+"""
+
+DEFAULT_CHUNK_SIZE = 64
+
+
+class ReportCardVersion:
+    """Frozen subjects and grades of a report card"""
+
+    __slots__ = ("subjects", "grades", "average")
+
+    def __init__(self, subjects, grades):
+        self.subjects = subjects  # tuple
+        self.grades = grades  # tuple
+        self.average = sum(grades) / len(grades) if grades else 0.0
+
+    def get_grade(self, subject):
+        if subject in self.subjects:
+            return self.grades[self.subjects.index(subject)]
+        return None
+
+    def calculate_average(self):
+        return self.average
+
+    def get_all_subjects(self):
+        return list(self.subjects)
+
+
+class StudentVersion:
+    """Frozen student record, read through the same methods as Student"""
+
+    __slots__ = ("student_id", "name", "report_card", "position")
+
+    def __init__(self, student_id, name, report_card, position=None):
+        self.student_id = student_id
+        self.name = name
+        self.report_card = report_card
+        self.position = position
+
+    @classmethod
+    def freeze(cls, student):
+        card = student.report_card
+        return cls(student.student_id, student.name,
+                   ReportCardVersion(tuple(card.subjects), tuple(card.grades)), student.position)
+
+    def get_average(self):
+        return self.report_card.average
+
+    def to_dict(self):
+        """Same shape as Student.to_dict()"""
+        return {
+            "student_id": self.student_id,
+            "name": self.name,
+            "subjects": list(self.report_card.subjects),
+            "grades": list(self.report_card.grades),
+            "average": round(self.report_card.average, 2)
+        }
+
+
+class Snapshot:
+    """Immutable roster version, in linked list order"""
+
+    __slots__ = ("version", "chunks", "size", "removed_positions")
+
+    def __init__(self, version, chunks, size, removed_positions=None):
+        self.version = version
+        self.chunks = chunks  # tuple of tuples of StudentVersion
+        self.size = size
+        # student_id -> list position of removed students (shared with the index)
+        self.removed_positions = {} if removed_positions is None else removed_positions
+
+    def iter_students(self, after=None):
+        """Iterate over the records; same cursor contract as StudentLinkedList.iter_students"""
+        if after is None:
+            return (record for chunk in self.chunks for record in chunk)
+        for chunk_index, chunk in enumerate(self.chunks):
+            for position, record in enumerate(chunk):
+                if record.student_id == after:
+                    return self._iter_from(chunk_index, position + 1)
+        removed = self.removed_positions.get(after)
+        if removed is None:
+            return None
+        for chunk_index, chunk in enumerate(self.chunks):
+            for position, record in enumerate(chunk):
+                if record.position > removed:
+                    return self._iter_from(chunk_index, position)
+        return iter(())
+
+    def _iter_from(self, chunk_index, position):
+        yield from self.chunks[chunk_index][position:]
+        for chunk in self.chunks[chunk_index + 1:]:
+            yield from chunk
+
+    def get_size(self):
+        return self.size
+
+
+class SnapshotIndex:
+    """Publishes copy-on-write Snapshots of a StudentLinkedList"""
+
+    def __init__(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.current = Snapshot(0, (), 0)  # Read without any lock
+        self.chunks = []  # Chunks of the next version
+        self.writable = {}  # chunk index -> list copy being edited for the next version
+        self.location = {}  # student_id -> chunk index
+        self.changed = {}  # student_id -> live Student to freeze on publish
+        self.removed_positions = {}  # student_id -> list position of a removed student
+        self.size = 0
+        self.pending = False  # Changes not yet published
+
+    def _writable(self, chunk_index):
+        chunk = self.writable.get(chunk_index)
+        if chunk is None:
+            chunk = self.writable[chunk_index] = list(self.chunks[chunk_index])
+        return chunk
+
+    def student_added(self, student):
+        last = len(self.chunks) - 1
+        if last < 0 or len(self.writable.get(last, self.chunks[last])) >= self.chunk_size:
+            self.chunks.append(())
+            last += 1
+        self._writable(last).append(student)
+        self.location[student.student_id] = last
+        self.changed[student.student_id] = student
+        self.removed_positions.pop(student.student_id, None)
+        self.size += 1
+        self.pending = True
+
+    def student_removed(self, student):
+        chunk_index = self.location.pop(student.student_id, None)
+        if chunk_index is None:
+            return
+        chunk = self._writable(chunk_index)
+        for position, record in enumerate(chunk):
+            if record.student_id == student.student_id:
+                del chunk[position]
+                break
+        self.changed.pop(student.student_id, None)
+        self.removed_positions[student.student_id] = student.position
+        self.size -= 1
+        self.pending = True
+
+    def report_card_changed(self, student, event, subject, old_grade, new_grade):
+        chunk_index = self.location.get(student.student_id)
+        if chunk_index is not None:
+            self._writable(chunk_index)
+            self.changed[student.student_id] = student
+            self.pending = True
+
+    def clear(self):
+        self.chunks = []
+        self.writable = {}
+        self.location = {}
+        self.changed = {}
+        self.removed_positions = {}
+        self.size = 0
+        self.pending = True
+
+    def publish(self):
+        """Make the changes since the last publish visible as a new Snapshot"""
+        if not self.pending:
+            return self.current
+
+        for student_id, student in self.changed.items():
+            chunk = self.writable[self.location[student_id]]
+            for position, record in enumerate(chunk):
+                if record.student_id == student_id:
+                    chunk[position] = StudentVersion.freeze(student)
+                    break
+        for chunk_index, chunk in self.writable.items():
+            self.chunks[chunk_index] = tuple(chunk)
+        self.writable = {}
+        self.changed = {}
+        self.pending = False
+
+        # Drop chunks emptied by removals once they make up a good part of the list
+        empty = sum(1 for chunk in self.chunks if not chunk)
+        if empty and empty * 4 >= len(self.chunks):
+            self.chunks = [chunk for chunk in self.chunks if chunk]
+            for chunk_index, chunk in enumerate(self.chunks):
+                for record in chunk:
+                    self.location[record.student_id] = chunk_index
+
+        self.current = Snapshot(self.current.version + 1, tuple(self.chunks), self.size,
+                                self.removed_positions)
+        return self.current
+
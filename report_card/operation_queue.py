@@ -0,0 +1,269 @@
+"""
+Queue Implementation for Operation Processing
+Used to process student operations in FIFO order
+"""
+
+import threading
+
+from .student import Student
+
+class QueueNode:
+    """Node class for Queue"""
+    
+    def __init__(self, data, operation_type="add"):
+        self.data = data  # Student object or operation data
+        self.operation_type = operation_type  # "add", "update", "delete", etc.
+        self.count = 1  # Number of operations merged into this node
+        self.next = None
+        self.prev = None
+
+
+class BatchOperation:
+    """Several operations recorded as a single queue or stack entry"""
+    
+    def __init__(self, operations):
+        # List of (operation_type, student, details) tuples in applied order
+        self.operations = operations
+    
+    def __len__(self):
+        return len(self.operations)
+    
+    def __str__(self):
+        return f"{len(self.operations)} operations"
+
+
+def describe_operation(operation_type, data):
+    """Describe a stack/queue entry as a dictionary (None if it is not a student operation)"""
+    if isinstance(data, Student):
+        return {
+            "operation_type": operation_type,
+            "student_id": data.student_id,
+            "student_name": data.name
+        }
+    if isinstance(data, BatchOperation):
+        return {
+            "operation_type": operation_type,
+            "student_id": None,
+            "student_name": str(data),
+            "operations": [describe_operation(op_type, student)
+                           for op_type, student, _ in data.operations]
+        }
+    return None
+
+
+# Grade operations that coalesce into a single "upsert"
+GRADE_OPERATIONS = ("add_grade", "update_grade", "remove_grade", "upsert")
+
+
+def coalesce_operations(pending_type, operation_type):
+    """Merged type of a pending and a new operation on one student
+    
+    Returns None when the two cannot be merged and "cancel" when they cancel out.
+    """
+    if pending_type == "add":
+        if operation_type in GRADE_OPERATIONS:
+            return "add"  # Processing the add sees the student's latest grades
+        if operation_type == "delete":
+            return "cancel"
+    elif pending_type in GRADE_OPERATIONS:
+        if operation_type in GRADE_OPERATIONS:
+            return "upsert"
+        if operation_type == "delete":
+            return "delete"
+    return None
+
+
+class OperationQueue:
+    """Queue ADT for managing operations in FIFO order
+    
+    With coalesce=True, a new operation on a student that already has a
+    pending operation is merged into it (it keeps the earlier position):
+    grade changes become one "upsert", grade changes followed by a delete
+    become the delete, and an add followed by a delete cancels out.
+    """
+    
+    def __init__(self, max_size=100, coalesce=False):
+        self.front = None
+        self.rear = None
+        self.size = 0
+        self.max_size = max_size
+        self.coalesce = coalesce
+        self.pending = {}  # student_id -> queued node that later operations may merge into
+        self.coalesced = 0  # Operations merged into (or cancelled with) a pending one
+    
+    def is_empty(self):
+        """Check if the queue is empty"""
+        return self.front is None
+    
+    def is_full(self):
+        """Check if the queue is full"""
+        return self.size >= self.max_size
+    
+    def enqueue(self, student, operation_type="add"):
+        """Add an operation to the queue"""
+        if self.coalesce and self._coalesce(student, operation_type):
+            return True
+        if self.is_full():
+            return False
+        
+        new_node = QueueNode(student, operation_type)
+        
+        if self.is_empty():
+            self.front = new_node
+            self.rear = new_node
+        else:
+            new_node.prev = self.rear
+            self.rear.next = new_node
+            self.rear = new_node
+        
+        self.size += 1
+        if self.coalesce:
+            if isinstance(student, Student):
+                self.pending[student.student_id] = new_node
+            elif isinstance(student, BatchOperation):
+                # Later operations must not jump ahead of the batch
+                for _, batch_student, _ in student.operations:
+                    self.pending.pop(batch_student.student_id, None)
+        return True
+    
+    def _coalesce(self, student, operation_type):
+        """Merge the operation into the student's pending node; False if it needs its own node"""
+        if not isinstance(student, Student):
+            return False
+        node = self.pending.get(student.student_id)
+        if node is None:
+            return False
+        merged_type = coalesce_operations(node.operation_type, operation_type)
+        if merged_type is None:
+            return False
+        
+        self.coalesced += 1
+        if merged_type == "cancel":
+            self._unlink(node)
+        else:
+            node.operation_type = merged_type
+            node.data = student
+            node.count += 1
+        return True
+    
+    def _unlink(self, node):
+        """Remove a node from anywhere in the queue"""
+        if node.prev is None:
+            self.front = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.rear = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = node.next = None
+        self.size -= 1
+        self._forget(node)
+    
+    def _forget(self, node):
+        if self.pending and isinstance(node.data, Student) and \
+                self.pending.get(node.data.student_id) is node:
+            del self.pending[node.data.student_id]
+    
+    def dequeue(self):
+        """Remove and return the front operation from the queue"""
+        if self.is_empty():
+            return None
+        
+        dequeued_node = self.front
+        
+        if self.front == self.rear:
+            # Only one element
+            self.front = None
+            self.rear = None
+        else:
+            self.front = self.front.next
+            self.front.prev = None
+        
+        self.size -= 1
+        self._forget(dequeued_node)
+        return dequeued_node
+    
+    def peek(self):
+        """Peek at the front of the queue without removing"""
+        if self.is_empty():
+            return None
+        return self.front
+    
+    def nodes(self):
+        """Queued nodes, front first"""
+        nodes = []
+        current = self.front
+        while current is not None:
+            nodes.append(current)
+            current = current.next
+        return nodes
+    
+    def get_size(self):
+        """Get the size of the queue"""
+        return self.size
+    
+    def clear(self):
+        """Clear the queue"""
+        self.front = None
+        self.rear = None
+        self.size = 0
+        self.pending.clear()
+    
+    def display(self):
+        """Display all operations in the queue"""
+        if self.is_empty():
+            return "Queue is empty."
+        
+        result = f"\nOperation Queue (Size: {self.size}):\n"
+        result += "-" * 40 + "\n"
+        current = self.front
+        index = 1
+        while current is not None:
+            if isinstance(current.data, Student):
+                result += f"[{index}] {current.operation_type.upper()}: {current.data.name} (ID: {current.data.student_id})\n"
+            else:
+                result += f"[{index}] {current.operation_type.upper()}: {current.data}\n"
+            current = current.next
+            index += 1
+        return result
+    
+    def process_all(self):
+        """Process all operations in the queue and return them"""
+        operations = []
+        while not self.is_empty():
+            operations.append(self.dequeue())
+        return operations
+
+
+class SynchronizedOperationQueue(OperationQueue):
+    """Operation queue guarded by its own short lock
+
+    Writers enqueue (and coalesce into pending nodes) under the system lock,
+    while processing and listing run from other threads; the lock keeps a
+    merge from landing on a node that was just dequeued.
+    """
+
+    def __init__(self, max_size=100, coalesce=False):
+        super().__init__(max_size, coalesce)
+        self.lock = threading.RLock()  # process_all dequeues while holding it
+
+    def enqueue(self, student, operation_type="add"):
+        with self.lock:
+            return super().enqueue(student, operation_type)
+
+    def dequeue(self):
+        with self.lock:
+            return super().dequeue()
+
+    def clear(self):
+        with self.lock:
+            return super().clear()
+
+    def process_all(self):
+        with self.lock:
+            return super().process_all()
+
+    def nodes(self):
+        with self.lock:
+            return super().nodes()
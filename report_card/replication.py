@@ -0,0 +1,350 @@
+"""
+Primary/Replica Log Shipping
+The primary publishes every applied mutation (the same events that feed the
+OperationQueue) as an ordered log and streams it to follower processes over
+a local TCP socket. Followers apply the log to their own system and serve
+the read-only endpoints.
+
+Wire protocol: one JSON object per line.
+    follower -> primary   {"epoch": ..., "lsn": N}     on connect (resume point)
+                          {"ack": N}                   after applying each message
+    primary -> follower   {"type": "snapshot", "epoch": ..., "lsn": N, "students": [...]}
+                          {"type": "op", "lsn": N, "time": T, "entry": {...}}
+                          {"type": "heartbeat", "lsn": N, "time": T}
+
+Log sequence numbers (LSNs) count published mutations. A follower that
+reconnects resumes from its last applied LSN while the primary still retains
+the entries after it; otherwise (or after a primary restart, which changes
+the epoch) it receives a fresh snapshot first.
+"""
+
+import itertools
+import json
+import os
+import socket
+import threading
+import time
+from collections import deque
+
+from .student import Student
+from .operation_queue import BatchOperation
+
+DEFAULT_ADDRESS = "127.0.0.1:7070"
+DEFAULT_RETAIN = 10000
+HEARTBEAT_INTERVAL = 1.0
+RECONNECT_DELAY = 1.0
+
+# Endpoints that change the roster; a replica rejects these (reads, including
+# POST /api/students/batch lookups, and the admin endpoints stay available)
+WRITE_ENDPOINTS = frozenset({
+    "add_student", "delete_student", "add_grade", "update_grade",
+    "apply_batch", "undo", "redo", "process_queue",
+})
+
+
+def parse_address(address):
+    """'host:port' -> (host, port)"""
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def encode_student(student):
+    card = student.report_card
+    return {"student_id": student.student_id, "name": student.name,
+            "subjects": list(card.subjects), "grades": list(card.grades)}
+
+
+def decode_student(record):
+    student = Student(record["student_id"], record["name"])
+    for subject, grade in zip(record["subjects"], record["grades"]):
+        student.add_subject_grade(subject, grade)
+    return student
+
+
+def encode_operation(operation_type, data, details=None):
+    """A queued mutation as a JSON-serializable log entry"""
+    if operation_type == "batch":
+        return {"operation_type": "batch",
+                "operations": [encode_operation(*operation) for operation in data.operations]}
+    entry = {"operation_type": operation_type, "student_id": data.student_id}
+    if operation_type == "add":
+        # Restored students come back with their grades
+        entry["student"] = encode_student(data)
+    elif details is not None:
+        entry["details"] = list(details)
+    return entry
+
+
+def _send(sock, message):
+    sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+class ReplicationLog:
+    """Bounded, ordered log of the mutations applied by a primary system"""
+
+    def __init__(self, system, retain=DEFAULT_RETAIN):
+        self.system = system
+        self.epoch = os.urandom(8).hex()  # Identifies this primary's log
+        self.lsn = 0
+        self.entries = deque(maxlen=retain)  # (lsn, encoded line), oldest first
+        self.condition = threading.Condition()
+        system.add_mutation_listener(self.append)
+
+    def append(self, operation_type, data, details):
+        # Runs under the system lock, so entries are encoded in commit order
+        entry = encode_operation(operation_type, data, details)
+        with self.condition:
+            self.lsn += 1
+            line = json.dumps({"type": "op", "lsn": self.lsn, "time": time.time(), "entry": entry})
+            self.entries.append((self.lsn, line.encode("utf-8") + b"\n"))
+            self.condition.notify_all()
+
+    def read_after(self, lsn, timeout):
+        """Encoded entries after lsn, waiting up to timeout for new ones
+
+        Returns None when entries after lsn are no longer retained.
+        """
+        with self.condition:
+            if self.lsn == lsn:
+                self.condition.wait(timeout)
+            if lsn == self.lsn:
+                return []
+            if lsn > self.lsn or not self.entries or self.entries[0][0] > lsn + 1:
+                return None
+            # Followers are usually near the end, so walk back from the newest entry
+            lines = [line for _, line in itertools.islice(reversed(self.entries), self.lsn - lsn)]
+            lines.reverse()
+            return lines
+
+    def snapshot(self):
+        """(lsn, students) as of a single point in the log"""
+        with self.system.lock:
+            return self.lsn, [encode_student(student)
+                              for student in self.system.student_list.iter_students()]
+
+
+class FollowerConnection:
+    """Primary-side stream of the log to one follower"""
+
+    def __init__(self, log, sock, address):
+        self.log = log
+        self.sock = sock
+        self.address = f"{address[0]}:{address[1]}"
+        self.connected_at = time.time()
+        self.sent_lsn = 0
+        self.acked_lsn = 0
+        self.acked_at = None
+        self.connected = True
+
+    def run(self):
+        try:
+            reader = self.sock.makefile("rb")
+            hello = json.loads(reader.readline() or b"{}")
+            lsn = hello.get("lsn", 0) if hello.get("epoch") == self.log.epoch else None
+            threading.Thread(target=self._read_acks, args=(reader,), daemon=True).start()
+
+            heartbeat_at = 0.0
+            while True:
+                lines = self.log.read_after(lsn, HEARTBEAT_INTERVAL) if lsn is not None else None
+                if lines is None:
+                    lsn, students = self.log.snapshot()
+                    _send(self.sock, {"type": "snapshot", "epoch": self.log.epoch,
+                                      "lsn": lsn, "students": students})
+                    self.sent_lsn = lsn
+                    continue
+                if lines:
+                    self.sock.sendall(b"".join(lines))
+                    lsn += len(lines)
+                    self.sent_lsn = lsn
+                now = time.time()
+                if now - heartbeat_at >= HEARTBEAT_INTERVAL:
+                    _send(self.sock, {"type": "heartbeat", "lsn": self.log.lsn, "time": now})
+                    heartbeat_at = now
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.connected = False
+            self.sock.close()
+
+    def _read_acks(self, reader):
+        try:
+            for line in reader:
+                self.acked_lsn = json.loads(line)["ack"]
+                self.acked_at = time.time()
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def get_status(self):
+        return {
+            "address": self.address,
+            "connected": self.connected,
+            "sent_lsn": self.sent_lsn,
+            "acked_lsn": self.acked_lsn,
+            "lag_ops": self.log.lsn - self.acked_lsn,
+            "last_ack_age": round(time.time() - self.acked_at, 3) if self.acked_at else None,
+        }
+
+
+class ReplicationPrimary:
+    """Publishes a system's mutation log to followers connecting on address"""
+
+    role = "primary"
+
+    def __init__(self, system, address=DEFAULT_ADDRESS, retain=DEFAULT_RETAIN):
+        self.log = ReplicationLog(system, retain)
+        self.address = address
+        self.followers = []
+        self.server = socket.create_server(parse_address(address))
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                sock, address = self.server.accept()
+            except OSError:
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            follower = FollowerConnection(self.log, sock, address)
+            self.followers = self._connected() + [follower]
+            threading.Thread(target=follower.run, daemon=True).start()
+
+    def _connected(self):
+        """Followers still attached (disconnected ones are forgotten)"""
+        return [follower for follower in self.followers if follower.connected]
+
+    def get_status(self):
+        return {
+            "role": self.role,
+            "address": self.address,
+            "epoch": self.log.epoch,
+            "lsn": self.log.lsn,
+            "followers": [follower.get_status() for follower in self._connected()],
+        }
+
+    def close(self):
+        self.server.close()
+
+
+class ReplicationFollower:
+    """Applies a primary's mutation log to a local (read-only) system"""
+
+    role = "replica"
+
+    def __init__(self, system, address=DEFAULT_ADDRESS):
+        self.system = system
+        self.address = address
+        self.epoch = None
+        self.applied_lsn = 0
+        self.primary_lsn = 0
+        self.connected = False
+        self.caught_up_at = time.time()
+        self.last_message_at = None
+        self.snapshots = 0
+        self.closed = False
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        while not self.closed:
+            try:
+                with socket.create_connection(parse_address(self.address)) as sock:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    self.connected = True
+                    self._follow(sock)
+            except (OSError, ValueError):
+                pass
+            self.connected = False
+            time.sleep(RECONNECT_DELAY)
+
+    def _follow(self, sock):
+        _send(sock, {"epoch": self.epoch, "lsn": self.applied_lsn})
+        for line in sock.makefile("rb"):
+            message = json.loads(line)
+            self.last_message_at = time.time()
+            if message["type"] == "op":
+                self._apply(message["entry"])
+                self.applied_lsn = message["lsn"]
+            elif message["type"] == "snapshot":
+                self._load(message["students"])
+                self.epoch = message["epoch"]
+                self.applied_lsn = message["lsn"]
+                self.snapshots += 1
+            self.primary_lsn = max(self.primary_lsn, message["lsn"])
+            if self.applied_lsn >= self.primary_lsn:
+                self.caught_up_at = self.last_message_at
+
+            _send(sock, {"ack": self.applied_lsn})
+
+    def _load(self, records):
+        # One mutation, so snapshot readers see the old roster or the new one
+        with self.system.mutating():
+            self.system.student_list.clear()
+            self.system.operation_queue.clear()
+            for record in records:
+                self.system.student_list.add_student(decode_student(record))
+
+    def _apply(self, entry):
+        with self.system.mutating():
+            if entry["operation_type"] == "batch":
+                applied = [operation for operation in map(self._apply_one, entry["operations"])
+                           if operation[1] is not None]
+                self.system.operation_queue.enqueue(BatchOperation(applied), "batch")
+            else:
+                operation_type, student, _ = self._apply_one(entry)
+                if student is not None:
+                    self.system.operation_queue.enqueue(student, operation_type)
+
+    def _apply_one(self, entry):
+        """Apply one student operation, returning (operation_type, student, details)"""
+        operation_type = entry["operation_type"]
+        student_list = self.system.student_list
+        details = entry.get("details")
+        if operation_type == "add":
+            student = decode_student(entry["student"])
+            student_list.add_student(student)
+        elif operation_type == "delete":
+            student = student_list.remove_student(entry["student_id"])
+        else:
+            student = self.system.find_student(entry["student_id"])
+            if student is None:
+                pass
+            elif operation_type == "add_grade":
+                student.add_subject_grade(details[0], details[1])
+            elif operation_type == "remove_grade":
+                student.report_card.remove_subject(details[0])
+            elif operation_type == "update_grade":
+                student.update_subject_grade(details[0], details[-1])
+        return operation_type, student, details
+
+    def get_status(self):
+        now = time.time()
+        behind = self.applied_lsn < self.primary_lsn
+        return {
+            "role": self.role,
+            "primary": self.address,
+            "connected": self.connected,
+            "epoch": self.epoch,
+            "applied_lsn": self.applied_lsn,
+            "primary_lsn": self.primary_lsn,
+            "lag_ops": self.primary_lsn - self.applied_lsn,
+            # Time since the replica last had every entry the primary had announced
+            "lag_seconds": round(now - self.caught_up_at, 3) if behind else 0.0,
+            "last_message_age": round(now - self.last_message_at, 3) if self.last_message_at else None,
+            "snapshots": self.snapshots,
+        }
+
+    def close(self):
+        self.closed = True
+
+
+def start_from_environ(system, environ=None):
+    """Start replication from REPLICATION_ROLE / REPLICATION_ADDRESS (None if unset)"""
+    environ = os.environ if environ is None else environ
+    role = environ.get("REPLICATION_ROLE", "").lower()
+    address = environ.get("REPLICATION_ADDRESS") or DEFAULT_ADDRESS
+    if role == "primary":
+        return ReplicationPrimary(system, address, int(environ.get("REPLICATION_RETAIN", DEFAULT_RETAIN)))
+    if role == "replica":
+        return ReplicationFollower(system, address)
+    if role:
+        raise ValueError("REPLICATION_ROLE must be 'primary' or 'replica'")
+    return None
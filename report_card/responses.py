@@ -0,0 +1,147 @@
+"""
+Response helpers for the web backend
+- Compact student shape: subject dictionary once per response, rows as arrays
+- Accept-Encoding negotiation and compression (gzip, brotli if installed)
+- A small cache of compressed bodies so unchanged responses are not recompressed
+"""
+
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+
+# Fields of each row in the compact shape
+COMPACT_FIELDS = ["student_id", "name", "average", "subject_ids", "grades"]
+
+# Buffered responses favour ratio, streamed responses favour latency
+GZIP_LEVEL = 6
+GZIP_STREAM_LEVEL = 1
+BROTLI_QUALITY = 5
+BROTLI_STREAM_QUALITY = 1
+
+_brotli = None
+
+
+def _load_brotli():
+    """Import the optional brotli module on first use (False if missing)"""
+    global _brotli
+    if _brotli is None:
+        try:
+            import brotli
+            _brotli = brotli
+        except ImportError:
+            _brotli = False
+    return _brotli
+
+
+def students_to_compact(students):
+    """Describe students with a shared subject dictionary instead of repeated names"""
+    subjects = {}
+    rows = []
+    for student in students:
+        card = student.report_card
+        rows.append([
+            student.student_id,
+            student.name,
+            round(student.get_average(), 2),
+            [subjects.setdefault(subject, len(subjects)) for subject in card.subjects],
+            list(card.grades),
+        ])
+    return {"shape": "compact", "subjects": list(subjects), "fields": COMPACT_FIELDS, "students": rows}
+
+
+def supported_encodings():
+    """Content codings this server can produce, best first"""
+    return ("br", "gzip") if _load_brotli() else ("gzip",)
+
+
+def choose_encoding(accept_encoding):
+    """Pick the best supported coding from an Accept-Encoding header (None for identity)"""
+    if not accept_encoding:
+        return None
+
+    weights = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip().lower()] = weight
+
+    best, best_weight = None, 0.0
+    for coding in supported_encodings():
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+def compress(body, encoding):
+    """Compress a whole body with the buffered-response level"""
+    if encoding == "br":
+        return _load_brotli().compress(body, quality=BROTLI_QUALITY)
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    return compressor.compress(body) + compressor.flush()
+
+
+def compress_stream(chunks, encoding):
+    """Compress a streamed body chunk by chunk, flushing so clients see data promptly"""
+    if encoding == "br":
+        compressor = _load_brotli().Compressor(quality=BROTLI_STREAM_QUALITY)
+        for chunk in chunks:
+            data = compressor.process(chunk) + compressor.flush()
+            if data:
+                yield data
+        yield compressor.finish()
+        return
+
+    compressor = zlib.compressobj(GZIP_STREAM_LEVEL, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+class CompressionCache:
+    """LRU cache of compressed bodies keyed by (URL, encoding)
+
+    An entry is reused only while the uncompressed body is byte-for-byte the
+    same (checked with a digest), so stale entries can never be served.
+    """
+
+    def __init__(self, max_entries=64):
+        self.entries = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get_or_compress(self, url, encoding, body):
+        """Return the compressed body, compressing only when it changed"""
+        key = (url, encoding)
+        digest = hashlib.blake2b(body, digest_size=16).digest()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] == digest:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        compressed = compress(body, encoding)
+        with self.lock:
+            self.entries[key] = (digest, compressed)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return compressed
+
+    def clear(self):
+        """Drop every cached body"""
+        with self.lock:
+            self.entries.clear()
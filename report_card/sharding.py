@@ -0,0 +1,578 @@
+"""
+Hash-Partitioned (Sharded) Student Store
+Splits students across N shards by a stable hash of student_id. Every shard
+is a complete ReportCardManagementSystem with its own linked list, lock,
+undo history and aggregate state, so every per-student traversal is N times
+shorter. Writers to different shards still serialize on the structures the
+shards share: the autocomplete and sorted indexes (behind LockedIndex), the
+operation queue and the snapshot publish lock. Write throughput therefore
+grows with shorter lists rather than with parallel writers; see
+benchmarks/sharding.py (1 shard runs at about half the single system's
+rate, 4 shards at about 1.1-1.3x, 8 shards at about 1.5x).
+
+Cross-shard reads (listing, search, statistics) merge the shards' results,
+optionally in parallel on a thread pool. ShardedSystem offers the same API
+as ReportCardManagementSystem, so the web backends can use either.
+
+Differences from a single system:
+- Students are listed shard by shard rather than in insertion order
+- Undo/redo pick the latest operation across shards (versions are global),
+  and a new mutation on any shard clears the redo history of every shard
+- A batch spanning several shards is recorded once per shard
+
+Snapshot reads see every shard at one point in time: each shard's snapshot
+is published together with a new combined ShardedSnapshot under one short
+publish lock, and mutations spanning shards publish all of them at once.
+"""
+
+import contextlib
+import functools
+import heapq
+import itertools
+import math
+import os
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from .operation_queue import SynchronizedOperationQueue
+from .stack import StackNode
+from .sorted_index import SORT_KEYS, SortedIndex
+from .system import ReportCardManagementSystem
+from .trie import AutocompleteIndex
+
+
+def shard_index(student_id, shard_count):
+    """Shard holding a student (stable across processes, unlike hash())"""
+    return zlib.crc32(student_id.encode("utf-8")) % shard_count
+
+
+class AverageAggregate:
+    """Per-shard average of every graded student, kept current by the shard's list"""
+
+    def __init__(self):
+        self.averages = {}  # student_id -> average, for students with grades
+
+    def student_added(self, student):
+        self._update(student)
+
+    def student_removed(self, student):
+        self.averages.pop(student.student_id, None)
+
+    def report_card_changed(self, student, event, subject, old_grade, new_grade):
+        self._update(student)
+
+    def clear(self):
+        self.averages.clear()
+
+    def _update(self, student):
+        if student.report_card.get_all_subjects():
+            self.averages[student.student_id] = student.get_average()
+        else:
+            self.averages.pop(student.student_id, None)
+
+    def summary(self):
+        """(count, sum, highest, lowest) of the averages"""
+        values = list(self.averages.values())
+        if not values:
+            return 0, 0.0, None, None
+        return len(values), math.fsum(values), max(values), min(values)
+
+
+class LockedIndex:
+    """Wraps an index shared by several shards so concurrent shard writers take turns"""
+
+    def __init__(self, index):
+        self.index = index
+        self.lock = threading.Lock()
+
+    def student_added(self, student):
+        with self.lock:
+            self.index.student_added(student)
+
+    def student_removed(self, student):
+        with self.lock:
+            self.index.student_removed(student)
+
+    def report_card_changed(self, student, event, subject, old_grade, new_grade):
+        with self.lock:
+            self.index.report_card_changed(student, event, subject, old_grade, new_grade)
+
+    def clear(self):
+        with self.lock:
+            self.index.clear()
+
+
+class ShardLock:
+    """Holds every shard lock at once, always taken in shard order"""
+
+    def __init__(self, locks):
+        self.locks = locks
+
+    def acquire(self):
+        for lock in self.locks:
+            lock.acquire()
+        return True
+
+    def release(self):
+        for lock in reversed(self.locks):
+            lock.release()
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+def iter_views(views, after=None):
+    """Iterate the students of per-shard views in shard order, resuming after a student"""
+    if after is None:
+        return itertools.chain.from_iterable(view.iter_students() for view in views)
+    index = shard_index(after, len(views))
+    rest = views[index].iter_students(after)
+    if rest is None:
+        return None
+    return itertools.chain(rest, itertools.chain.from_iterable(
+        view.iter_students() for view in views[index + 1:]))
+
+
+class ShardedSnapshot:
+    """Read view of all shards: (view, average summary) per shard"""
+
+    def __init__(self, parts):
+        self.parts = parts
+        self.size = sum(view.get_size() for view, _ in parts)
+
+    def iter_students(self, after=None):
+        return iter_views([view for view, _ in self.parts], after)
+
+    def get_size(self):
+        return self.size
+
+    def get_sizes(self):
+        return [view.get_size() for view, _ in self.parts]
+
+    def get_summaries(self):
+        return [summary for _, summary in self.parts]
+
+
+class ShardedStudentList:
+    """Read view over the shards' linked lists (writes are routed by student_id)"""
+
+    def __init__(self, system):
+        self.system = system
+
+    def _list_for(self, student_id):
+        return self.system.shard_for(student_id).student_list
+
+    def iter_students(self, after=None):
+        """Iterate shard by shard; 'after' resumes after that student as in StudentLinkedList"""
+        return iter_views([shard.student_list for shard in self.system.shards], after)
+
+    def get_all_students(self):
+        return list(self.iter_students())
+
+    def get_size(self):
+        return sum(shard.student_list.get_size() for shard in self.system.shards)
+
+    def is_empty(self):
+        return self.get_size() == 0
+
+    def search_student(self, student_id):
+        return self.system.find_student(student_id)
+
+    def search_students(self, student_ids):
+        found = {}
+        for shard, ids in self.system.group_by_shard(student_ids).items():
+            found.update(shard.find_students(ids))
+        return found
+
+    def search_by_name(self, name):
+        return list(itertools.chain.from_iterable(
+            self.system.map_shards(lambda shard: shard.find_by_name(name))))
+
+    def add_student(self, student):
+        return self._list_for(student.student_id).add_student(student)
+
+    def remove_student(self, student_id):
+        return self._list_for(student_id).remove_student(student_id)
+
+    def clear(self):
+        for shard in self.system.shards:
+            shard.student_list.clear()
+
+
+class MergedStackView:
+    """Read-only view of the shards' undo (or redo) stacks in the order undo (or redo) picks them"""
+
+    def __init__(self, stacks, newest_first=True):
+        self.stacks = stacks
+        self.newest_first = newest_first
+
+    @property
+    def top(self):
+        """Head of a merged copy of the stack nodes (walk it with .next)"""
+        nodes = []
+        for stack in self.stacks:
+            current = stack.top
+            while current is not None:
+                nodes.append(current)
+                current = current.next
+        nodes.sort(key=lambda node: node.version, reverse=self.newest_first)
+
+        head = None
+        for node in reversed(nodes):
+            copy = StackNode(node.data, node.operation_type, node.details, node.version)
+            copy.next = head
+            head = copy
+        return head
+
+    def get_size(self):
+        return sum(stack.get_size() for stack in self.stacks)
+
+    def is_empty(self):
+        return self.get_size() == 0
+
+
+class ShardedSystem:
+    """ReportCardManagementSystem API over N independent shards"""
+
+    def __init__(self, shard_count=4, store=None, parallel=False, coalesce=False):
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1")
+        self.versions = itertools.count(1)  # Shared so undo order is global
+        self.operation_queue = SynchronizedOperationQueue(coalesce=coalesce)
+        self.shards = [ReportCardManagementSystem(store, self.operation_queue, self.versions)
+                       for _ in range(shard_count)]
+        self.store = store
+
+        # Top-k completions cannot be merged exactly from per-shard top-k lists,
+        # so the shards share one autocomplete index instead of keeping their own
+        self.autocomplete_index = AutocompleteIndex()
+        shared_index = LockedIndex(self.autocomplete_index)
+        # Sorted pages have the same problem, so the sorted indexes are shared too
+        self.sorted_indexes = {sort: SortedIndex(sort) for sort in SORT_KEYS}
+        shared_sorted = [LockedIndex(index) for index in self.sorted_indexes.values()]
+        for shard in self.shards:
+            shard.student_list.indexes.remove(shard.autocomplete_index)
+            shard.autocomplete_index = self.autocomplete_index
+            shard.student_list.add_index(shared_index)
+            for index in shard.sorted_indexes.values():
+                shard.student_list.indexes.remove(index)
+            shard.sorted_indexes = self.sorted_indexes
+            for index in shared_sorted:
+                shard.student_list.add_index(index)
+            shard.average_aggregate = AverageAggregate()
+            shard.student_list.add_index(shard.average_aggregate)
+
+        self.lock = ShardLock([shard.lock for shard in self.shards])
+        self.student_list = ShardedStudentList(self)
+        self.undo_stack = MergedStackView([shard.undo_stack for shard in self.shards])
+        self.redo_stack = MergedStackView([shard.redo_stack for shard in self.shards], newest_first=False)
+
+        # Cross-shard reads fan out on a pool when enabled
+        self.pool = ThreadPoolExecutor(max_workers=shard_count) if parallel and shard_count > 1 else None
+
+        # A shard's own mutations publish through publish_snapshot, so the
+        # combined snapshot is always swapped under the publish lock
+        self.snapshots = self.shards[0].snapshot_index is not None
+        self.publish_lock = threading.Lock()
+        self.current = self._live_snapshot()
+        for shard in self.shards:
+            shard.publish_snapshot = functools.partial(self.publish_snapshot, [shard])
+            shard._record = functools.partial(self._record, shard)
+
+    @classmethod
+    def from_environ(cls, store=None, environ=None):
+        """Build from SHARDS, SHARD_PARALLEL and QUEUE_COALESCE (None when SHARDS is unset or 1)"""
+        environ = os.environ if environ is None else environ
+        shard_count = int(environ.get("SHARDS", 1))
+        if shard_count <= 1:
+            return None
+        parallel = environ.get("SHARD_PARALLEL", "").lower() in ("1", "true", "yes")
+        coalesce = environ.get("QUEUE_COALESCE", "").lower() in ("1", "true", "yes")
+        return cls(shard_count, store=store, parallel=parallel, coalesce=coalesce)
+
+    def shard_for(self, student_id):
+        return self.shards[shard_index(student_id, len(self.shards))]
+
+    def group_by_shard(self, student_ids):
+        """shard -> list of the given IDs it holds"""
+        groups = {}
+        for student_id in student_ids:
+            groups.setdefault(self.shard_for(student_id), []).append(student_id)
+        return groups
+
+    def map_shards(self, func):
+        """Run func on every shard (on the pool if enabled), results in shard order"""
+        if self.pool is None:
+            return [func(shard) for shard in self.shards]
+        return list(self.pool.map(func, self.shards))
+
+    # Writes: routed to the owning shard, which takes only its own lock
+
+    def add_student(self, student_id, name):
+        """Add a new student to the system"""
+        return self.shard_for(student_id).add_student(student_id, name)
+
+    def remove_student(self, student_id):
+        """Remove a student from the system"""
+        return self.shard_for(student_id).remove_student(student_id)
+
+    def add_grade(self, student_id, subject, grade):
+        """Add a subject and grade to a student's report card"""
+        return self.shard_for(student_id).add_grade(student_id, subject, grade)
+
+    def update_grade(self, student_id, subject, new_grade):
+        """Update a grade for a student"""
+        return self.shard_for(student_id).update_grade(student_id, subject, new_grade)
+
+    def apply_batch(self, mutations):
+        """Apply a list of mutations atomically across shards
+
+        The involved shards are locked in shard order, every shard validates
+        its part, and only then is anything applied.
+        """
+        parts = {}
+        for index, mutation in enumerate(mutations):
+            item, error = self.shards[0]._parse_mutation(mutation)
+            if error:
+                return False, f"Mutation {index + 1}: {error}"
+            parts.setdefault(shard_index(item[1], len(self.shards)), []).append((index + 1, item))
+
+        with contextlib.ExitStack() as stack:
+            plans = []
+            for index in sorted(parts):
+                shard = self.shards[index]
+                stack.enter_context(shard.mutating())
+                plan, error = shard._plan_batch(parts[index])
+                if error:
+                    return False, error
+                plans.append((shard, plan))
+            # Every shard records its part under the same version, so undo/redo
+            # treat the parts as one operation
+            version = next(self.versions) if len(plans) > 1 else None
+            applied = sum(shard._apply_plan(plan, version) for shard, plan in plans)
+            self.publish_snapshot([shard for shard, _ in plans])
+        return True, f"Applied {applied} mutations!"
+
+    def add_mutation_listener(self, listener):
+        """Register a callable notified of every applied mutation on any shard"""
+        for shard in self.shards:
+            shard.add_mutation_listener(listener)
+
+    # Undo/redo: versions come from one counter, so the latest operation is global
+
+    def get_version(self):
+        """Version of the current state (the latest applied mutation on any shard)"""
+        return max(shard.get_version() for shard in self.shards)
+
+    @contextlib.contextmanager
+    def mutating(self):
+        """Hold every shard lock as one mutation, publishing all shards together at the end"""
+        with contextlib.ExitStack() as stack:
+            for shard in self.shards:
+                stack.enter_context(shard.mutating())
+            try:
+                yield
+            finally:
+                self.publish_snapshot()
+
+    def publish_snapshot(self, shards=None):
+        """Publish the given shards (all by default) and swap in a new combined snapshot
+
+        Called with the shards' locks held.
+        """
+        if not self.snapshots:
+            return
+        shards = self.shards if shards is None else shards
+        with self.publish_lock:
+            parts = list(self.current.parts)
+            for index, shard in enumerate(self.shards):
+                if shard in shards:
+                    parts[index] = (shard.snapshot_index.publish(), shard.average_aggregate.summary())
+            self.current = ShardedSnapshot(parts)
+
+    def _live_snapshot(self):
+        return ShardedSnapshot([(shard.snapshot(), shard.average_aggregate.summary()) for shard in self.shards])
+
+    def snapshot(self):
+        """Consistent read view of all shards (live view when snapshots are disabled)"""
+        if self.snapshots:
+            return self.current
+        return self._live_snapshot()
+
+    def _record(self, shard, data, operation_type, details=None, version=None):
+        """Record a new mutation on its shard and invalidate redo on every shard
+
+        Redo stacks are only popped by undo/redo, which hold every shard lock,
+        so a writer holding just its own shard's lock may clear them.
+        """
+        ReportCardManagementSystem._record(shard, data, operation_type, details, version)
+        for other in self.shards:
+            if other is not shard:
+                other.redo_stack.clear()
+
+    def undo(self):
+        """Undo the latest operation across all shards"""
+        with self.mutating():
+            return self._step("undo", max)
+
+    def redo(self):
+        """Redo the most recently undone operation across all shards"""
+        with self.mutating():
+            return self._step("redo", min)
+
+    def _step(self, action, pick):
+        """Undo or redo the operation with the picked version on every shard that holds part of it"""
+        tops = [(shard, getattr(shard, f"{action}_stack").peek()) for shard in self.shards]
+        tops = [(shard, node) for shard, node in tops if node is not None]
+        if not tops:
+            return False, f"No operations to {action}!"
+
+        version = pick(node.version for _, node in tops)
+        parts = [(shard, node) for shard, node in tops if node.version == version]
+        if len(parts) == 1:
+            return getattr(parts[0][0], action)()
+        count = sum(len(node.data) for _, node in parts)
+        for shard, _ in parts:
+            getattr(shard, action)()
+        done = "Undone" if action == "undo" else "Redone"
+        return True, f"{done}: batch of {count} operations across {len(parts)} shards"
+
+    def undo_to_version(self, version):
+        """Undo operations on every shard until the system is back at the given version"""
+        with self.mutating():
+            current = self.get_version()
+            if version == current:
+                return True, f"Already at version {version}."
+
+            # Every shard must still hold all of its operations newer than the target
+            known = {shard.undo_stack.base_version for shard in self.shards}
+            for shard in self.shards:
+                node = shard.undo_stack.top
+                while node is not None:
+                    known.add(node.version)
+                    node = node.next
+            if version > current or version not in known or \
+                    any(shard.undo_stack.base_version > version for shard in self.shards):
+                return False, f"Version {version} is not in the undo history!"
+
+            count = 0
+            while self.get_version() > version:
+                self.undo()
+                count += 1
+            return True, f"Undone {count} operations, now at version {version}."
+
+    # Reads: merged from every shard
+
+    def find_student(self, student_id):
+        """Student with this ID or None, from its shard's ID index once it is built"""
+        return self.shard_for(student_id).find_student(student_id)
+
+    def search_student(self, student_id):
+        """Search for a student by ID"""
+        return self.shard_for(student_id).search_student(student_id)
+
+    def search_students(self, student_ids):
+        """Search for many students by ID, returning (found, missing)"""
+        student_ids = list(dict.fromkeys(student_ids))
+        found = self.student_list.search_students(student_ids)
+        students = [found[student_id] for student_id in student_ids if student_id in found]
+        missing = [student_id for student_id in student_ids if student_id not in found]
+        return students, missing
+
+    def autocomplete(self, prefix, kind="name", limit=None):
+        """Top completions for a name or subject prefix as (value, count) pairs"""
+        return self.shards[0].autocomplete(prefix, kind, limit)
+
+    def search_by_name(self, name):
+        """Search for students by name"""
+        results = self.student_list.search_by_name(name)
+        if len(results) == 0:
+            return [], f"No students found with name containing '{name}'"
+        return results, None
+
+    def fuzzy_search_by_name(self, name, max_distance=2):
+        """Search for students by name allowing typos, returning ([(student, distance)], error)"""
+        results = list(itertools.chain.from_iterable(
+            self.map_shards(lambda shard: shard.fuzzy_search_by_name(name, max_distance)[0])))
+        if len(results) == 0:
+            return [], f"No students found with name close to '{name}'"
+        results.sort(key=lambda item: (item[1], item[0].name.lower(), item[0].student_id))
+        return results, None
+
+    def get_all_students(self):
+        """Get all students as a list (shard by shard)"""
+        return list(self.snapshot().iter_students())
+
+    def get_sorted_students(self, sort="id", order="asc", offset=0, limit=None):
+        """A page of students from the shared sorted indexes, returning (students, total, error)"""
+        with self.lock:
+            return self.shards[0].get_sorted_students(sort, order, offset, limit)
+
+    def get_statistics(self):
+        """Get system statistics, merged from the shards' aggregates"""
+        view = self.snapshot()
+        stats = {
+            "total_students": view.get_size(),
+            "undo_stack_size": self.undo_stack.get_size(),
+            "queue_size": self.operation_queue.get_size(),
+            "highest_average": 0,
+            "lowest_average": 0,
+            "overall_average": 0
+        }
+
+        summaries = [summary for summary in view.get_summaries() if summary[0]]
+        if summaries:
+            count = sum(summary[0] for summary in summaries)
+            stats["highest_average"] = round(max(summary[2] for summary in summaries), 2)
+            stats["lowest_average"] = round(min(summary[3] for summary in summaries), 2)
+            stats["overall_average"] = round(math.fsum(summary[1] for summary in summaries) / count, 2)
+        stats["shards"] = view.get_sizes()
+        return stats
+
+    def get_grade_history(self, student_id, subject=None, since=None):
+        """Grade changes of a student after 'since' (epoch seconds), returning (changes, error)"""
+        return self.shard_for(student_id).get_grade_history(student_id, subject, since)
+
+    def get_grades_as_of(self, student_id, when, subject=None):
+        """A student's grades at time 'when' (epoch seconds), returning ({subject: grade}, error)"""
+        return self.shard_for(student_id).get_grades_as_of(student_id, when, subject)
+
+    def get_changes_since(self, since, limit=None):
+        """Grade changes of all students after 'since' (epoch seconds), merged by time"""
+        merged = heapq.merge(*self.map_shards(lambda shard: shard.get_changes_since(since, limit)),
+                             key=lambda change: change["time"])
+        return list(itertools.islice(merged, limit))
+
+    def get_history_stats(self):
+        """Size of the grade history, summed over the shards"""
+        stats = [shard.get_history_stats() for shard in self.shards]
+        changes = sum(item["changes"] for item in stats)
+        size = sum(item["bytes"] for item in stats)
+        return {
+            "series": sum(item["series"] for item in stats),
+            "changes": changes,
+            "bytes": size,
+            "bytes_per_change": round(size / changes, 2) if changes else 0,
+        }
+
+    def memory_structures(self):
+        """Every shard's structures, summed by name (the shared autocomplete index counts once)"""
+        groups = [shard.memory_structures() + [("average_aggregate", shard.average_aggregate)]
+                  for shard in self.shards]
+        return [pair for pairs in zip(*groups) for pair in pairs]
+
+    def get_memory_usage(self, extra=(), exclude=()):
+        """Estimated bytes and objects per data structure (walks them all under every shard lock)"""
+        from .memory import measure
+        with self.lock:
+            return measure(self.memory_structures() + list(extra), exclude=(self, *self.shards, *exclude))
+
+    def get_storage_stats(self):
+        """Get tiered storage metrics (None when every report card stays in memory)"""
+        if self.store is None:
+            return None
+        return self.store.get_stats()
@@ -0,0 +1,194 @@
+"""
+Sorted Indexes for Ordered Roster Views
+Keeps the students ordered by student_id, name and average so a sorted page
+can be read in O(log n + page size) instead of copying and sorting the list.
+
+SortedList is a flat B-tree: a list of sorted sublists of at most
+2 * LOAD items, with a Fenwick tree over the sublist lengths so the item at
+any position is found in O(log n). SortedIndex keeps one SortedList of
+(key, student_id, student) entries up to date as a StudentLinkedList index
+listener; student_id breaks ties, so entries never compare students.
+"""
+
+import bisect
+
+SORT_KEYS = ("id", "name", "average")
+
+
+class SortedList:
+    """Sorted sequence with O(log n) insert, remove and positional access"""
+
+    LOAD = 256
+
+    def __init__(self):
+        self.lists = []  # Sorted sublists, in order
+        self.maxes = []  # Last item of each sublist
+        self.tree = []  # Fenwick tree over len(sublist)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _rebuild(self):
+        """Rebuild the Fenwick tree after sublists were split or dropped"""
+        tree = [len(sublist) for sublist in self.lists]
+        for index in range(len(tree)):
+            parent = index | (index + 1)
+            if parent < len(tree):
+                tree[parent] += tree[index]
+        self.tree = tree
+
+    def _update(self, index, delta):
+        tree = self.tree
+        while index < len(tree):
+            tree[index] += delta
+            index |= index + 1
+
+    def _locate(self, position):
+        """(sublist index, offset in it) of the item at a position"""
+        index = -1
+        step = 1 << (len(self.tree).bit_length() - 1) if self.tree else 0
+        while step:
+            candidate = index + step
+            if candidate < len(self.tree) and self.tree[candidate] <= position:
+                position -= self.tree[candidate]
+                index = candidate
+            step >>= 1
+        return index + 1, position
+
+    def add(self, item):
+        if not self.lists:
+            self.lists.append([item])
+            self.maxes.append(item)
+            self._rebuild()
+            self.size = 1
+            return
+        index = bisect.bisect_left(self.maxes, item)
+        if index == len(self.maxes):
+            index -= 1
+            self.lists[index].append(item)
+            self.maxes[index] = item
+        else:
+            bisect.insort(self.lists[index], item)
+        self.size += 1
+
+        sublist = self.lists[index]
+        if len(sublist) > 2 * self.LOAD:
+            self.lists.insert(index + 1, sublist[self.LOAD:])
+            del sublist[self.LOAD:]
+            self.maxes.insert(index, sublist[-1])
+            self._rebuild()
+        else:
+            self._update(index, 1)
+
+    def remove(self, item):
+        """Remove an item that is in the list (ValueError otherwise)"""
+        index = bisect.bisect_left(self.maxes, item)
+        sublist = self.lists[index] if index < len(self.lists) else []
+        position = bisect.bisect_left(sublist, item)
+        if position == len(sublist) or sublist[position] != item:
+            raise ValueError(f"{item!r} not in list")
+        del sublist[position]
+        self.size -= 1
+        if not sublist:
+            del self.lists[index]
+            del self.maxes[index]
+            self._rebuild()
+        else:
+            self.maxes[index] = sublist[-1]
+            self._update(index, -1)
+
+    def clear(self):
+        self.lists = []
+        self.maxes = []
+        self.tree = []
+        self.size = 0
+
+    def islice(self, start, stop):
+        """Yield the items at positions start <= position < stop"""
+        stop = min(stop, self.size)
+        if start >= stop:
+            return
+        index, offset = self._locate(start)
+        remaining = stop - start
+        while remaining > 0:
+            chunk = self.lists[index][offset:offset + remaining]
+            yield from chunk
+            remaining -= len(chunk)
+            index, offset = index + 1, 0
+
+    def ireverse(self, start, stop):
+        """Yield the items at positions stop > position >= start, last first"""
+        stop = min(stop, self.size)
+        if start >= stop:
+            return
+        index, offset = self._locate(stop - 1)
+        remaining = stop - start
+        while remaining > 0:
+            chunk = self.lists[index][max(0, offset + 1 - remaining):offset + 1]
+            yield from reversed(chunk)
+            remaining -= len(chunk)
+            index -= 1
+            offset = len(self.lists[index]) - 1 if index >= 0 else 0
+
+
+def _name_key(student):
+    return student.name.casefold()
+
+
+def _id_key(student):
+    return ""  # Entries are (key, student_id, student): the tie-breaker does the sorting
+
+
+def _average_key(student):
+    return student.get_average()
+
+
+class SortedIndex:
+    """Index listener keeping students ordered by id, name or average"""
+
+    KEYS = {"id": _id_key, "name": _name_key, "average": _average_key}
+
+    def __init__(self, sort="id"):
+        self.sort = sort
+        self.key = self.KEYS[sort]
+        self.entries = SortedList()  # (key, student_id, student)
+        self.current = {}  # student_id -> entry currently in the list
+
+    def _insert(self, student):
+        entry = (self.key(student), student.student_id, student)
+        self.entries.add(entry)
+        self.current[student.student_id] = entry
+
+    def student_added(self, student):
+        self._insert(student)
+
+    def student_removed(self, student):
+        entry = self.current.pop(student.student_id, None)
+        if entry is not None:
+            self.entries.remove(entry)
+
+    def report_card_changed(self, student, event, subject, old_grade, new_grade):
+        if self.sort != "average":
+            return
+        entry = self.current.get(student.student_id)
+        if entry is not None and entry[0] != self.key(student):
+            self.entries.remove(entry)
+            self._insert(student)
+
+    def clear(self):
+        self.entries.clear()
+        self.current = {}
+
+    def get_size(self):
+        return len(self.entries)
+
+    def page(self, offset=0, limit=None, descending=False):
+        """Students at positions offset .. offset + limit in the chosen order"""
+        size = len(self.entries)
+        stop = size if limit is None else min(size, offset + limit)
+        if descending:
+            entries = self.entries.ireverse(size - stop, size - offset)
+        else:
+            entries = self.entries.islice(offset, stop)
+        return [student for _, _, student in entries]
@@ -0,0 +1,127 @@
+"""
+Stack Implementation for Undo/Redo Operations
+Stores a compact command record per mutation so it can be undone or redone
+"""
+
+from .student import Student
+
+class StackNode:
+    """Node class for Stack"""
+
+    __slots__ = ("data", "operation_type", "details", "version", "next", "prev")
+
+    def __init__(self, data, operation_type="delete", details=None, version=None):
+        self.data = data  # Student object (or BatchOperation for "batch")
+        self.operation_type = operation_type  # "add", "delete", "add_grade", "update_grade" or "batch"
+        self.details = details  # Extra data needed to invert the operation, e.g. (subject, old, new)
+        self.version = version  # System version after the operation was applied
+        self.next = None  # Towards the bottom
+        self.prev = None  # Towards the top
+
+
+class UndoStack:
+    """Stack ADT for managing undo operations
+
+    Doubly linked so the oldest entry can be dropped in O(1) when the stack
+    is full, which keeps memory bounded by max_size.
+    """
+
+    def __init__(self, max_size=100):
+        self.top = None
+        self.bottom = None
+        self.size = 0
+        self.max_size = max_size
+        # Version of the oldest state that can still be reached by undoing
+        self.base_version = 0
+
+    def is_empty(self):
+        """Check if the stack is empty"""
+        return self.top is None
+
+    def is_full(self):
+        """Check if the stack is full"""
+        return self.size >= self.max_size
+
+    def push(self, student, operation_type="delete", details=None, version=None):
+        """Push an operation onto the stack"""
+        if self.is_full():
+            # Remove oldest item (bottom of stack)
+            self._remove_bottom()
+
+        new_node = StackNode(student, operation_type, details, version)
+        new_node.next = self.top
+        if self.top is not None:
+            self.top.prev = new_node
+        else:
+            self.bottom = new_node
+        self.top = new_node
+        self.size += 1
+        return True
+
+    def pop(self):
+        """Pop an operation from the stack"""
+        if self.is_empty():
+            return None
+
+        popped_node = self.top
+        self.top = self.top.next
+        if self.top is not None:
+            self.top.prev = None
+        else:
+            self.bottom = None
+        popped_node.next = None
+        self.size -= 1
+        return popped_node
+
+    def peek(self):
+        """Peek at the top of the stack without removing"""
+        if self.is_empty():
+            return None
+        return self.top
+
+    def _remove_bottom(self):
+        """Remove the bottom element when stack is full"""
+        if self.bottom is None:
+            return None
+
+        removed = self.bottom
+        if removed.version is not None:
+            self.base_version = removed.version
+        self.bottom = removed.prev
+        if self.bottom is not None:
+            self.bottom.next = None
+        else:
+            self.top = None
+        removed.prev = None
+        self.size -= 1
+        return removed
+
+    def get_size(self):
+        """Get the size of the stack"""
+        return self.size
+
+    def clear(self):
+        """Clear the stack"""
+        if self.top is not None and self.top.version is not None:
+            self.base_version = self.top.version
+        self.top = None
+        self.bottom = None
+        self.size = 0
+
+    def display(self):
+        """Display all items in the stack (for debugging)"""
+        if self.is_empty():
+            return "Stack is empty."
+
+        result = f"\nUndo Stack (Size: {self.size}):\n"
+        result += "-" * 40 + "\n"
+        current = self.top
+        index = 1
+        while current is not None:
+            if isinstance(current.data, Student):
+                result += f"[{index}] {current.operation_type.upper()}: {current.data.name} (ID: {current.data.student_id})\n"
+            else:
+                result += f"[{index}] {current.operation_type.upper()}: {current.data}\n"
+            current = current.next
+            index += 1
+        return result
@@ -0,0 +1,183 @@
+"""
+Student and ReportCard Classes
+Represents a student with their report card information
+"""
+
+import contextlib
+
+class ReportCard:
+    """Represents a report card with subjects and grades"""
+    
+    def __init__(self):
+        # Using List (array) to store subjects and grades
+        self._subjects = []  # List of subject names
+        self._grades = []    # List of corresponding grades
+        # Called as on_change(event, subject, old_grade, new_grade) while the
+        # student is stored in a StudentLinkedList, so its indexes stay current
+        self.on_change = None
+        # TieredStore that may spill the lists to disk (both None while cold)
+        self.store = None
+    
+    @property
+    def subjects(self):
+        return self._lists()[0]
+    
+    @subjects.setter
+    def subjects(self, subjects):
+        with self._write_lock():
+            self._lists(dirty=True)
+            self._subjects = subjects
+    
+    @property
+    def grades(self):
+        return self._lists()[1]
+    
+    @grades.setter
+    def grades(self, grades):
+        with self._write_lock():
+            self._lists(dirty=True)
+            self._grades = grades
+    
+    def _lists(self, dirty=False):
+        """The subject and grade lists, faulted in from the store if the card is cold"""
+        if self.store is None:
+            return self._subjects, self._grades
+        return self.store.touch(self, dirty)
+    
+    def _write_lock(self):
+        """Held while changing the lists so the store cannot evict them halfway"""
+        return self.store.lock if self.store is not None else contextlib.nullcontext()
+        
+    def add_subject(self, subject, grade):
+        """Add a subject and grade to the report card"""
+        with self._write_lock():
+            subjects, grades = self._lists(dirty=True)
+            if subject in subjects:
+                return False
+            subjects.append(subject)
+            grades.append(grade)
+            if self.on_change is not None:
+                self.on_change("subject_added", subject, None, grade)
+            return True
+    
+    def update_grade(self, subject, new_grade):
+        """Update grade for a specific subject"""
+        with self._write_lock():
+            subjects, grades = self._lists(dirty=True)
+            if subject not in subjects:
+                return False
+            index = subjects.index(subject)
+            old_grade = grades[index]
+            grades[index] = new_grade
+            if self.on_change is not None:
+                self.on_change("grade_updated", subject, old_grade, new_grade)
+            return True
+    
+    def remove_subject(self, subject):
+        """Remove a subject and its grade from the report card"""
+        with self._write_lock():
+            subjects, grades = self._lists(dirty=True)
+            if subject not in subjects:
+                return False
+            index = subjects.index(subject)
+            subjects.pop(index)
+            old_grade = grades.pop(index)
+            if self.on_change is not None:
+                self.on_change("subject_removed", subject, old_grade, None)
+            return True
+    
+    def get_grade(self, subject):
+        """Get grade for a specific subject"""
+        subjects, grades = self._lists()
+        if subject in subjects:
+            index = subjects.index(subject)
+            return grades[index]
+        return None
+    
+    def calculate_average(self):
+        """Calculate average of all grades"""
+        grades = self.grades
+        if len(grades) == 0:
+            return 0.0
+        return sum(grades) / len(grades)
+    
+    def get_all_subjects(self):
+        """Get all subjects"""
+        return self.subjects.copy()
+    
+    def display(self):
+        """Display the report card"""
+        subjects, grades = self._lists()
+        if len(subjects) == 0:
+            return "No subjects added yet."
+        
+        result = "\nReport Card:\n"
+        result += "-" * 40 + "\n"
+        for i in range(len(subjects)):
+            result += f"{subjects[i]}: {grades[i]}\n"
+        result += "-" * 40 + "\n"
+        result += f"Average: {self.calculate_average():.2f}\n"
+        return result
+    
+    def __str__(self):
+        return self.display()
+    
+    def __getstate__(self):
+        # The change callback and the store belong to the list holding the
+        # student; never copy them, and copy the lists even while they are cold
+        state = self.__dict__.copy()
+        state["_subjects"] = self.subjects
+        state["_grades"] = self.grades
+        state["on_change"] = None
+        state["store"] = None
+        return state
+
+
+class Student:
+    """Represents a student with ID, name, and report card"""
+    
+    def __init__(self, student_id, name):
+        self.student_id = student_id
+        self.name = name
+        self.report_card = ReportCard()
+        self.position = None  # Insertion position, set by StudentLinkedList
+    
+    def add_subject_grade(self, subject, grade):
+        """Add a subject and grade to student's report card"""
+        return self.report_card.add_subject(subject, grade)
+    
+    def update_subject_grade(self, subject, new_grade):
+        """Update grade for a subject"""
+        return self.report_card.update_grade(subject, new_grade)
+    
+    def get_average(self):
+        """Get student's average grade"""
+        return self.report_card.calculate_average()
+    
+    def to_dict(self):
+        """Get student as a JSON-serializable dictionary (API response shape)"""
+        return {
+            "student_id": self.student_id,
+            "name": self.name,
+            "subjects": self.report_card.subjects,
+            "grades": self.report_card.grades,
+            "average": round(self.get_average(), 2)
+        }
+    
+    def display(self):
+        """Display student information and report card"""
+        result = f"\n{'='*50}\n"
+        result += f"Student ID: {self.student_id}\n"
+        result += f"Student Name: {self.name}\n"
+        result += self.report_card.display()
+        result += f"{'='*50}\n"
+        return result
+    
+    def __str__(self):
+        return self.display()
+    
+    def __eq__(self, other):
+        if isinstance(other, Student):
+            return self.student_id == other.student_id
+        return False
+
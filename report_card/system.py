@@ -0,0 +1,609 @@
+"""
+Report Card Management System
+Integrates all data structures: Linked List, Stack, Queue, List.
+Shared by the web backend (app.py) and the CLI (main.py).
+"""
+
+import contextlib
+import functools
+import itertools
+import threading
+
+from .student import Student
+from .linked_list import StudentLinkedList
+from .stack import UndoStack
+from .operation_queue import OperationQueue, BatchOperation
+from .trie import AutocompleteIndex
+from .fuzzy import SymmetricDeleteIndex
+from .mvcc import SnapshotIndex, StudentVersion
+from .sorted_index import SORT_KEYS, SortedIndex
+from .history import GradeHistory
+
+# Operation types accepted by apply_batch (same names as the queue uses)
+BATCH_OPERATIONS = ("add", "delete", "add_grade", "update_grade")
+
+
+def synchronized(method):
+    """Run a system method as one mutation (see ReportCardManagementSystem.mutating)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self.mutating():
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class ReportCardManagementSystem:
+    """Main management system integrating all data structures"""
+
+    def __init__(self, store=None, operation_queue=None, versions=None, snapshots=None):
+        # Guards every mutation so threaded servers see consistent state
+        self.lock = threading.RLock()
+        self.lock_depth = 0  # Nesting of mutating(); publishes when it drops to 0
+
+        # Optional TieredStore keeping only hot report cards in memory
+        self.store = store
+
+        # Linked List for storing all students
+        self.student_list = StudentLinkedList(store)
+
+        # Trie index for name/subject autocomplete, maintained by the list
+        self.autocomplete_index = AutocompleteIndex()
+        self.student_list.add_index(self.autocomplete_index)
+
+        # Symmetric-delete index for typo-tolerant name search
+        self.fuzzy_index = SymmetricDeleteIndex(max_distance=2)
+        self.student_list.add_index(self.fuzzy_index)
+
+        # Ordered views by student_id, name and average for sorted, paged listing
+        self.sorted_indexes = {sort: SortedIndex(sort) for sort in SORT_KEYS}
+        for index in self.sorted_indexes.values():
+            self.student_list.add_index(index)
+
+        # ID and name indexes, built in the background by warmup.WarmStart.
+        # While they are None, lookups walk the linked list.
+        self.id_index = None
+        self.name_index = None
+
+        # (snapshot version, highest, lowest, overall) averages of the last
+        # snapshot statistics were computed for
+        self.statistics_cache = None
+
+        # Append-only, delta-encoded history of every grade change
+        self.grade_history = GradeHistory()
+        self.student_list.add_index(self.grade_history)
+
+        # Copy-on-write snapshots for lock-free list/statistics reads. Off by
+        # default with a TieredStore, where they would pin every report card
+        # in memory again.
+        if snapshots is None:
+            snapshots = store is None
+        self.snapshot_index = SnapshotIndex() if snapshots else None
+        if self.snapshot_index is not None:
+            self.student_list.add_index(self.snapshot_index)
+
+        # Stacks for undo/redo: one compact command record per mutation
+        self.undo_stack = UndoStack()
+        self.redo_stack = UndoStack()
+
+        # Version numbers for new mutations; identifies a state in the history.
+        # Shards of a ShardedSystem share one counter so versions stay global.
+        self.versions = versions if versions is not None else itertools.count(1)
+        self.sequence = 0  # Version of the last new mutation
+
+        # Queue for processing operations (may be shared between shards)
+        self.operation_queue = operation_queue if operation_queue is not None else OperationQueue()
+
+        # Called as listener(operation_type, data, details) for every applied
+        # mutation, in the order it is queued (e.g. replication log shipping)
+        self.mutation_listeners = []
+
+    @synchronized
+    def add_student(self, student_id, name):
+        """Add a new student to the system"""
+        if self.find_student(student_id) is not None:
+            return False, f"Student with ID {student_id} already exists!"
+
+        student = Student(student_id, name)
+        self.student_list.add_student(student)
+        self._record(student, "add")
+        self._enqueue(student, "add")
+        return True, f"Student {name} (ID: {student_id}) added successfully!"
+
+    @synchronized
+    def remove_student(self, student_id):
+        """Remove a student from the system"""
+        student = self.student_list.remove_student(student_id)
+
+        if student is None:
+            return False, f"Student with ID {student_id} not found!"
+
+        self._record(student, "delete")
+        self._enqueue(student, "delete")
+        return True, f"Student {student.name} (ID: {student_id}) removed successfully!"
+
+    def find_student(self, student_id):
+        """Student with this ID or None, from the ID index once it is built"""
+        index = self.id_index
+        if index is None:
+            return self.student_list.search_student(student_id)
+        return index.get(student_id)
+
+    def find_students(self, student_ids):
+        """student_id -> Student for the IDs that were found"""
+        index = self.id_index
+        if index is None:
+            return self.student_list.search_students(student_ids)
+        return index.get_many(student_ids)
+
+    def find_by_name(self, name):
+        """Students whose name contains 'name', in list order"""
+        index = self.name_index
+        results = index.search(name) if index is not None else None
+        if results is None:
+            return self.student_list.search_by_name(name)
+        return results
+
+    def search_student(self, student_id):
+        """Search for a student by ID"""
+        student = self.find_student(student_id)
+        if student is None:
+            return None, f"Student with ID {student_id} not found!"
+        return student, None
+
+    def search_students(self, student_ids):
+        """Search for many students by ID, returning (found, missing)"""
+        # Drop duplicates but keep the caller's order
+        student_ids = list(dict.fromkeys(student_ids))
+        found = self.find_students(student_ids)
+        students = [found[student_id] for student_id in student_ids if student_id in found]
+        missing = [student_id for student_id in student_ids if student_id not in found]
+        return students, missing
+
+    def autocomplete(self, prefix, kind="name", limit=None):
+        """Top completions for a name or subject prefix as (value, count) pairs"""
+        if kind == "subject":
+            return self.autocomplete_index.complete_subjects(prefix, limit)
+        return self.autocomplete_index.complete_names(prefix, limit)
+
+    def search_by_name(self, name):
+        """Search for students by name"""
+        results = self.find_by_name(name)
+        if len(results) == 0:
+            return [], f"No students found with name containing '{name}'"
+        return results, None
+
+    def fuzzy_search_by_name(self, name, max_distance=2):
+        """Search for students by name allowing typos, returning ([(student, distance)], error)"""
+        # The index's sets and dicts are changed by writers under the lock
+        with self.lock:
+            results = self.fuzzy_index.search(name, max_distance)
+        if len(results) == 0:
+            return [], f"No students found with name close to '{name}'"
+        return results, None
+
+    @synchronized
+    def add_grade(self, student_id, subject, grade):
+        """Add a subject and grade to a student's report card"""
+        student = self.find_student(student_id)
+        if student is None:
+            return False, f"Student with ID {student_id} not found!"
+
+        if not (0 <= grade <= 100):
+            return False, "Grade must be between 0 and 100!"
+
+        if student.add_subject_grade(subject, grade):
+            self._record(student, "add_grade", (subject, grade))
+            self._enqueue(student, "add_grade", (subject, grade))
+            return True, f"Grade {grade} added for {subject}!"
+        else:
+            return False, f"Subject {subject} already exists! Use update instead."
+
+    @synchronized
+    def update_grade(self, student_id, subject, new_grade):
+        """Update a grade for a student"""
+        student = self.find_student(student_id)
+        if student is None:
+            return False, f"Student with ID {student_id} not found!"
+
+        if not (0 <= new_grade <= 100):
+            return False, "Grade must be between 0 and 100!"
+
+        old_grade = student.report_card.get_grade(subject)
+        if old_grade is None:
+            return False, f"Subject {subject} not found for this student!"
+
+        if student.update_subject_grade(subject, new_grade):
+            self._record(student, "update_grade", (subject, old_grade, new_grade))
+            self._enqueue(student, "update_grade", (subject, old_grade, new_grade))
+            return True, f"Grade for {subject} updated from {old_grade} to {new_grade}!"
+        else:
+            return False, "Failed to update grade!"
+
+    @synchronized
+    def apply_batch(self, mutations):
+        """Apply a list of mutations atomically
+        
+        Every mutation is validated before anything is changed, so either the
+        whole batch is applied or nothing is. The batch is recorded as a
+        single undo entry and a single queue record.
+        """
+        parsed = []
+        for index, mutation in enumerate(mutations):
+            item, error = self._parse_mutation(mutation)
+            if error:
+                return False, f"Mutation {index + 1}: {error}"
+            parsed.append((index + 1, item))
+
+        plan, error = self._plan_batch(parsed)
+        if error:
+            return False, error
+        applied = self._apply_plan(plan)
+        return True, f"Applied {applied} mutations!"
+
+    def _plan_batch(self, parsed):
+        """Validate numbered, parsed mutations against a simulated view of the roster
+        
+        Returns (plan, error); the plan can be applied with _apply_plan.
+        Must be called while holding the system lock.
+        """
+        # Look up every referenced student in one traversal.
+        found = self.find_students({item[1] for _, item in parsed})
+        students = dict(found)
+        subjects = {sid: set(student.report_card.subjects) for sid, student in found.items()}
+        plan = []
+        for number, (operation_type, student_id, name, subject, grade) in parsed:
+            student = students.get(student_id)
+            if operation_type == "add":
+                if student is not None:
+                    return None, f"Mutation {number}: Student with ID {student_id} already exists!"
+                student = Student(student_id, name)
+                students[student_id] = student
+                subjects[student_id] = set()
+            elif student is None:
+                return None, f"Mutation {number}: Student with ID {student_id} not found!"
+            elif operation_type == "delete":
+                students[student_id] = None
+            elif operation_type == "add_grade":
+                if subject in subjects[student_id]:
+                    return None, f"Mutation {number}: Subject {subject} already exists! Use update instead."
+                subjects[student_id].add(subject)
+            elif subject not in subjects[student_id]:
+                return None, f"Mutation {number}: Subject {subject} not found for this student!"
+            plan.append((operation_type, student, subject, grade))
+        return plan, None
+
+    def _apply_plan(self, plan, version=None):
+        """Apply a validated batch plan (cannot fail), returning the number of mutations"""
+        applied = []
+        for operation_type, student, subject, grade in plan:
+            if operation_type == "add":
+                self.student_list.add_student(student)
+                details = None
+            elif operation_type == "delete":
+                self.student_list.remove_student(student.student_id)
+                details = None
+            elif operation_type == "add_grade":
+                student.add_subject_grade(subject, grade)
+                details = (subject, grade)
+            else:
+                old_grade = student.report_card.get_grade(subject)
+                student.update_subject_grade(subject, grade)
+                details = (subject, old_grade, grade)
+            applied.append((operation_type, student, details))
+
+        if applied:
+            self._record(BatchOperation(applied), "batch", version=version)
+            self._enqueue(BatchOperation(applied), "batch")
+        return len(applied)
+
+    def _parse_mutation(self, mutation):
+        """Normalize one batch mutation into (operation_type, student_id, name, subject, grade)"""
+        if not isinstance(mutation, dict):
+            return None, "Mutation must be an object!"
+
+        operation_type = mutation.get("operation_type")
+        if operation_type not in BATCH_OPERATIONS:
+            return None, f"operation_type must be one of {', '.join(BATCH_OPERATIONS)}!"
+
+        student_id = str(mutation.get("student_id", "")).strip()
+        if not student_id:
+            return None, "Student ID is required!"
+
+        name = subject = grade = None
+        if operation_type == "add":
+            name = str(mutation.get("name", "")).strip()
+            if not name:
+                return None, "Name is required!"
+        elif operation_type in ("add_grade", "update_grade"):
+            subject = str(mutation.get("subject", "")).strip()
+            if not subject:
+                return None, "Subject is required!"
+            try:
+                grade = float(mutation.get("grade"))
+            except (ValueError, TypeError):
+                return None, "Grade must be a number!"
+            if not (0 <= grade <= 100):
+                return None, "Grade must be between 0 and 100!"
+
+        return (operation_type, student_id, name, subject, grade), None
+
+    def add_mutation_listener(self, listener):
+        """Register a callable notified of every applied mutation"""
+        self.mutation_listeners.append(listener)
+
+    def _enqueue(self, data, operation_type, details=None):
+        """Queue an applied mutation and notify the mutation listeners"""
+        self.operation_queue.enqueue(data, operation_type)
+        for listener in self.mutation_listeners:
+            listener(operation_type, data, details)
+
+    def _record(self, data, operation_type, details=None, version=None):
+        """Record a new mutation on the undo stack (invalidates redo)"""
+        self.sequence = version if version is not None else next(self.versions)
+        self.undo_stack.push(data, operation_type, details, self.sequence)
+        self.redo_stack.clear()
+
+    def get_version(self):
+        """Version of the current state (the last applied mutation)"""
+        top_node = self.undo_stack.peek()
+        if top_node is None:
+            return self.undo_stack.base_version
+        return top_node.version
+
+    def _apply(self, operation_type, data, details, inverse):
+        """Apply a recorded operation forwards (redo) or backwards (undo) and queue it"""
+        if operation_type == "batch":
+            operations = reversed(data.operations) if inverse else data.operations
+            applied = [self._apply_one(op_type, student, op_details, inverse)
+                       for op_type, student, op_details in operations]
+            self._enqueue(BatchOperation(applied), "batch")
+        else:
+            queued_type, student, queued_details = self._apply_one(operation_type, data, details, inverse)
+            self._enqueue(student, queued_type, queued_details)
+
+    def _apply_one(self, operation_type, student, details, inverse):
+        """Apply a single student operation, returning the effective (operation_type, student, details)"""
+        if operation_type in ("add", "delete"):
+            if (operation_type == "add") == inverse:
+                self.student_list.remove_student(student.student_id)
+                return "delete", student, None
+            self.student_list.add_student(student)
+            return "add", student, None
+
+        if operation_type == "add_grade":
+            subject, grade = details
+            if inverse:
+                student.report_card.remove_subject(subject)
+                return "remove_grade", student, (subject, grade)
+            student.add_subject_grade(subject, grade)
+            return "add_grade", student, details
+
+        subject, old_grade, new_grade = details
+        if inverse:
+            student.update_subject_grade(subject, old_grade)
+            return "update_grade", student, (subject, new_grade, old_grade)
+        student.update_subject_grade(subject, new_grade)
+        return "update_grade", student, details
+
+    def _describe(self, node):
+        """Short human-readable description of a recorded operation"""
+        if isinstance(node.data, Student):
+            return f"{node.operation_type} for Student {node.data.name} (ID: {node.data.student_id})"
+        return f"{node.operation_type} of {node.data}"
+
+    @synchronized
+    def undo(self):
+        """Undo the last operation of any type"""
+        node = self.undo_stack.pop()
+        if node is None:
+            return False, "No operations to undo!"
+
+        self._apply(node.operation_type, node.data, node.details, inverse=True)
+        self.redo_stack.push(node.data, node.operation_type, node.details, node.version)
+        if node.operation_type == "delete":
+            student = node.data
+            return True, f"Undone: Student {student.name} (ID: {student.student_id}) restored!"
+        return True, f"Undone: {self._describe(node)}"
+
+    @synchronized
+    def redo(self):
+        """Redo the last undone operation"""
+        node = self.redo_stack.pop()
+        if node is None:
+            return False, "No operations to redo!"
+
+        self._apply(node.operation_type, node.data, node.details, inverse=False)
+        self.undo_stack.push(node.data, node.operation_type, node.details, node.version)
+        return True, f"Redone: {self._describe(node)}"
+
+    @synchronized
+    def undo_to_version(self, version):
+        """Undo operations until the system is back at the given version"""
+        if version == self.get_version():
+            return True, f"Already at version {version}."
+
+        # Make sure the target is still reachable before undoing anything
+        reachable = version == self.undo_stack.base_version
+        current = self.undo_stack.top
+        while current is not None and not reachable:
+            reachable = current.version == version
+            current = current.next
+        if not reachable:
+            return False, f"Version {version} is not in the undo history!"
+
+        count = 0
+        while self.get_version() != version:
+            self.undo()
+            count += 1
+        return True, f"Undone {count} operations, now at version {version}."
+
+    @contextlib.contextmanager
+    def mutating(self):
+        """Hold the system lock for one mutation, publishing a new snapshot when
+        the outermost mutation ends (so readers never see a partial batch)"""
+        with self.lock:
+            self.lock_depth += 1
+            try:
+                yield
+            finally:
+                self.lock_depth -= 1
+                if self.lock_depth == 0:
+                    self.publish_snapshot()
+
+    def publish_snapshot(self):
+        """Make the changes of the finished mutation visible to snapshot readers"""
+        if self.snapshot_index is not None:
+            self.snapshot_index.publish()
+
+    def snapshot(self):
+        """Consistent read view of the roster, without taking the lock
+
+        The view has iter_students() and get_size(). Falls back to the live
+        list when snapshots are disabled.
+        """
+        if self.snapshot_index is None:
+            return self.student_list
+        return self.snapshot_index.current
+
+    def get_all_students(self):
+        """Get all students as a list"""
+        return list(self.snapshot().iter_students())
+
+    def get_sorted_students(self, sort="id", order="asc", offset=0, limit=None):
+        """A page of students ordered by id, name or average, returning (students, total, error)
+
+        Reads O(log n + page size) index entries under the lock and returns
+        frozen copies, so the page is consistent.
+        """
+        if sort not in SORT_KEYS:
+            return None, 0, f"sort must be one of {', '.join(SORT_KEYS)}!"
+        if order not in ("asc", "desc"):
+            return None, 0, "order must be 'asc' or 'desc'!"
+        if offset < 0 or (limit is not None and limit < 0):
+            return None, 0, "offset and limit must not be negative!"
+        with self.lock:
+            index = self.sorted_indexes[sort]
+            students = [StudentVersion.freeze(student) for student in index.page(offset, limit, order == "desc")]
+            return students, index.get_size(), None
+
+    def get_statistics(self):
+        """Get system statistics"""
+        view = self.snapshot()
+        stats = {
+            "total_students": view.get_size(),
+            "undo_stack_size": self.undo_stack.get_size(),
+            "queue_size": self.operation_queue.get_size(),
+            "highest_average": 0,
+            "lowest_average": 0,
+            "overall_average": 0
+        }
+
+        # A published snapshot never changes, so its averages are computed once
+        version = getattr(view, "version", None)
+        cached = self.statistics_cache
+        if version is not None and cached is not None and cached[0] == version:
+            _, stats["highest_average"], stats["lowest_average"], stats["overall_average"] = cached
+            return stats
+
+        if view.get_size() > 0:
+            averages = [s.get_average() for s in view.iter_students() if s.report_card.get_all_subjects()]
+            if averages:
+                stats["highest_average"] = round(max(averages), 2)
+                stats["lowest_average"] = round(min(averages), 2)
+                stats["overall_average"] = round(sum(averages) / len(averages), 2)
+        if version is not None:
+            self.statistics_cache = (version, stats["highest_average"], stats["lowest_average"],
+                                     stats["overall_average"])
+
+        return stats
+
+    def get_grade_history(self, student_id, subject=None, since=None):
+        """Grade changes of a student after 'since' (epoch seconds), returning (changes, error)"""
+        if not self.grade_history.has_history(student_id):
+            return None, f"No grade history for student with ID {student_id}!"
+        return self.grade_history.history(student_id, subject, since), None
+
+    def get_grades_as_of(self, student_id, when, subject=None):
+        """A student's grades at time 'when' (epoch seconds), returning ({subject: grade}, error)"""
+        if not self.grade_history.has_history(student_id):
+            return None, f"No grade history for student with ID {student_id}!"
+        return self.grade_history.as_of(student_id, when, subject), None
+
+    def get_changes_since(self, since, limit=None):
+        """Grade changes of all students after 'since' (epoch seconds), oldest first"""
+        return self.grade_history.changes_since(since, limit)
+
+    def get_history_stats(self):
+        """Size of the grade history (series, changes, bytes per change)"""
+        return self.grade_history.get_stats()
+
+    def memory_structures(self):
+        """(name, structure) pairs for memory accounting; owners of shared objects come first"""
+        return [
+            ("student_list", self.student_list),
+            ("undo_stack", self.undo_stack),
+            ("redo_stack", self.redo_stack),
+            ("operation_queue", self.operation_queue),
+            ("autocomplete_index", self.autocomplete_index),
+            ("fuzzy_index", self.fuzzy_index),
+            # One root per index (the dict alone would leave them to student_list)
+            *(("sorted_indexes", index) for index in self.sorted_indexes.values()),
+            ("id_index", self.id_index),
+            ("name_index", self.name_index),
+            ("snapshot_index", self.snapshot_index),
+            ("grade_history", self.grade_history),
+            ("tiered_store", self.store),
+        ]
+
+    def get_memory_usage(self, extra=(), exclude=()):
+        """Estimated bytes and objects per data structure (walks them all under the lock)"""
+        from .memory import measure
+        with self.lock:
+            return measure(self.memory_structures() + list(extra), exclude=(self, *exclude))
+
+    def get_storage_stats(self):
+        """Get tiered storage metrics (None when every report card stays in memory)"""
+        if self.store is None:
+            return None
+        return self.store.get_stats()
+
+    def display_all_students(self):
+        """Display all students"""
+        return self.student_list.display_all()
+
+    def display_statistics(self):
+        """Display system statistics"""
+        stats = f"\n{'='*60}\n"
+        stats += "SYSTEM STATISTICS\n"
+        stats += f"{'='*60}\n"
+        stats += f"Total Students: {self.student_list.get_size()}\n"
+        stats += f"Undo Stack Size: {self.undo_stack.get_size()}\n"
+        stats += f"Operation Queue Size: {self.operation_queue.get_size()}\n"
+
+        if self.student_list.get_size() > 0:
+            students = self.student_list.get_all_students()
+            averages = [s.get_average() for s in students]
+            if averages:
+                stats += f"\nAverage Grade Statistics:\n"
+                stats += f"  Highest Average: {max(averages):.2f}\n"
+                stats += f"  Lowest Average: {min(averages):.2f}\n"
+                stats += f"  Overall Average: {sum(averages)/len(averages):.2f}\n"
+
+        stats += f"{'='*60}\n"
+        return stats
+
+    def process_queue(self):
+        """Process all operations in the queue"""
+        if self.operation_queue.is_empty():
+            return "No operations in queue to process."
+
+        operations = self.operation_queue.process_all()
+        result = f"\nProcessed {len(operations)} operations from queue:\n"
+        result += "-" * 40 + "\n"
+        for i, op in enumerate(operations, 1):
+            if op and op.data:
+                if isinstance(op.data, Student):
+                    result += f"[{i}] {op.operation_type.upper()}: {op.data.name} (ID: {op.data.student_id})\n"
+                else:
+                    result += f"[{i}] {op.operation_type.upper()}: {op.data}\n"
+        return result
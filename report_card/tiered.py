@@ -0,0 +1,181 @@
+"""
+Tiered Storage for Report Cards
+Keeps the report cards of recently used students in memory (an LRU of hot
+cards) and spills the rest to an on-disk SQLite table.
+
+Student and ReportCard objects always stay in place; only the subject and
+grade lists of a cold card are evicted. The linked list, the indexes and the
+undo history therefore keep valid references, and a cold card is faulted
+back in transparently the next time its subjects or grades are read.
+
+The hot set is bounded by a number of report cards, an estimated memory
+budget in bytes, or both.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+
+DEFAULT_MAX_STUDENTS = 1000
+
+
+def estimate_size(subjects, grades):
+    """Approximate bytes held by a report card's lists"""
+    return (sys.getsizeof(subjects) + sys.getsizeof(grades)
+            + sum(sys.getsizeof(subject) for subject in subjects)
+            + sum(sys.getsizeof(grade) for grade in grades))
+
+
+def _close(connection, path):
+    connection.close()
+    if path is not None and os.path.exists(path):
+        os.remove(path)
+
+
+class TieredStore:
+    """LRU of hot report cards backed by a SQLite table of cold ones"""
+
+    def __init__(self, path=None, max_students=DEFAULT_MAX_STUDENTS, max_bytes=None):
+        owns_file = path is None
+        if owns_file:
+            handle, path = tempfile.mkstemp(prefix="report_cards_", suffix=".sqlite")
+            os.close(handle)
+        self.path = path
+        self.max_students = max_students
+        self.max_bytes = max_bytes
+
+        self.hot = OrderedDict()  # ReportCard -> [dirty, estimated bytes], least recent first
+        self.hot_bytes = 0
+        self.keys = weakref.WeakKeyDictionary()  # ReportCard -> row key on disk
+        self.next_key = 1
+        self.garbage = []  # Row keys of collected report cards, deleted lazily
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.writes = 0
+
+        # Held by ReportCard while it changes its lists, so it must be reentrant
+        self.lock = threading.RLock()
+
+        # A spill file, not a database: rows are only meaningful to this process
+        self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=OFF")
+        self.connection.execute("PRAGMA synchronous=OFF")
+        self.connection.execute("DROP TABLE IF EXISTS report_cards")
+        self.connection.execute(
+            "CREATE TABLE report_cards (key INTEGER PRIMARY KEY, subjects TEXT NOT NULL, grades TEXT NOT NULL)")
+        self._finalizer = weakref.finalize(self, _close, self.connection, path if owns_file else None)
+
+    @classmethod
+    def from_environ(cls, environ=None):
+        """Build a store from TIERED_STORAGE_PATH, TIERED_MAX_STUDENTS and TIERED_MAX_BYTES"""
+        environ = os.environ if environ is None else environ
+        max_bytes = environ.get("TIERED_MAX_BYTES")
+        return cls(path=environ.get("TIERED_STORAGE_PATH") or None,
+                   max_students=int(environ.get("TIERED_MAX_STUDENTS", DEFAULT_MAX_STUDENTS)),
+                   max_bytes=int(max_bytes) if max_bytes else None)
+
+    def touch(self, card, dirty=False):
+        """Mark a report card as used, faulting it in if it is cold
+
+        Returns its (subjects, grades) lists. Pass dirty=True before changing
+        them so the new contents are written out when the card is evicted.
+        """
+        with self.lock:
+            entry = self.hot.get(card)
+            if entry is not None:
+                self.hot.move_to_end(card)
+                self.hits += 1
+            else:
+                if card._subjects is None:
+                    self._load(card)
+                    self.misses += 1
+                    entry = [False, 0]
+                else:
+                    entry = [True, 0]  # Never written to disk yet
+                self.hot[card] = entry
+                self._resize(card, entry)
+                self._evict()
+
+            if dirty:
+                entry[0] = True
+                self._resize(card, entry)
+            return card._subjects, card._grades
+
+    def _resize(self, card, entry):
+        size = estimate_size(card._subjects, card._grades)
+        self.hot_bytes += size - entry[1]
+        entry[1] = size
+
+    def _over_budget(self):
+        if self.max_students is not None and len(self.hot) > self.max_students:
+            return True
+        return self.max_bytes is not None and self.hot_bytes > self.max_bytes
+
+    def _evict(self):
+        """Spill least recently used cards until the hot set fits (never the newest)"""
+        rows = []
+        while len(self.hot) > 1 and self._over_budget():
+            card, (dirty, size) = self.hot.popitem(last=False)
+            if dirty:
+                rows.append((self._key(card), json.dumps(card._subjects), json.dumps(card._grades)))
+            card._subjects = None
+            card._grades = None
+            self.hot_bytes -= size
+            self.evictions += 1
+
+        if rows:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO report_cards (key, subjects, grades) VALUES (?, ?, ?)", rows)
+            self.writes += len(rows)
+        if self.garbage:
+            garbage, self.garbage = self.garbage, []
+            self.connection.executemany("DELETE FROM report_cards WHERE key = ?",
+                                        [(key,) for key in garbage])
+
+    def _key(self, card):
+        key = self.keys.get(card)
+        if key is None:
+            key = self.next_key
+            self.next_key += 1
+            self.keys[card] = key
+            # Drop the row once nothing references the report card any more
+            weakref.finalize(card, self._collected, key)
+        return key
+
+    def _collected(self, key):
+        self.garbage.append(key)  # May run inside any call, so only queue the delete
+
+    def _load(self, card):
+        row = self.connection.execute(
+            "SELECT subjects, grades FROM report_cards WHERE key = ?", (self.keys[card],)).fetchone()
+        card._subjects = json.loads(row[0])
+        card._grades = json.loads(row[1])
+
+    def get_stats(self):
+        """Cache size and hit/miss/eviction counters"""
+        with self.lock:
+            disk_records = self.connection.execute("SELECT COUNT(*) FROM report_cards").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                "max_students": self.max_students,
+                "max_bytes": self.max_bytes,
+                "hot_students": len(self.hot),
+                "hot_bytes": self.hot_bytes,
+                "disk_records": disk_records,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "writes": self.writes,
+            }
+
+    def close(self):
+        """Close the spill file (and delete it if the store created it)"""
+        self._finalizer()
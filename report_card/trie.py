@@ -0,0 +1,169 @@
+"""
+Trie (Prefix Tree) Implementation for Autocomplete
+Indexes student names and subject names so the top completions for a prefix
+can be returned in O(prefix length + N).
+"""
+
+# Completions cached per node, and so the largest limit a lookup can ask for
+MAX_COMPLETIONS = 10
+
+
+class TrieNode:
+    """Node class for Trie"""
+
+    __slots__ = ("children", "values", "top")
+
+    def __init__(self):
+        self.children = {}  # character -> TrieNode
+        self.values = {}  # display value -> count, for keys ending at this node
+        self.top = []  # best (-count, display value) pairs in this subtree, best first
+
+
+class PrefixTrie:
+    """Trie ADT mapping lower-cased keys to display values with counts
+
+    Every node caches the best completions of its subtree, so a lookup only
+    walks the prefix and slices that cache. The caches along the key's path
+    are refreshed on every insert and remove.
+    """
+
+    def __init__(self, max_completions=MAX_COMPLETIONS):
+        self.root = TrieNode()
+        self.max_completions = max_completions
+        self.size = 0  # Number of distinct (key, display value) pairs
+
+    def insert(self, key, value):
+        """Add one occurrence of value under key"""
+        path = [self.root]
+        for char in key:
+            node = path[-1].children.get(char)
+            if node is None:
+                node = TrieNode()
+                path[-1].children[char] = node
+            path.append(node)
+
+        values = path[-1].values
+        if value not in values:
+            self.size += 1
+        values[value] = values.get(value, 0) + 1
+        self._refresh(path)
+
+    def remove(self, key, value):
+        """Remove one occurrence of value under key"""
+        path = [self.root]
+        for char in key:
+            node = path[-1].children.get(char)
+            if node is None:
+                return False
+            path.append(node)
+
+        values = path[-1].values
+        if value not in values:
+            return False
+        values[value] -= 1
+        if values[value] == 0:
+            del values[value]
+            self.size -= 1
+
+        # Prune nodes that no longer lead anywhere
+        for depth in range(len(key), 0, -1):
+            node = path[depth]
+            if node.values or node.children:
+                break
+            del path[depth - 1].children[key[depth - 1]]
+            path.pop()
+        self._refresh(path)
+        return True
+
+    def complete(self, prefix, limit=None):
+        """Top completions for prefix as a list of (value, count), most common first
+
+        limit must be between 1 and max_completions (None for max_completions).
+        """
+        if limit is not None and not (1 <= limit <= self.max_completions):
+            raise ValueError(f"limit must be between 1 and {self.max_completions}")
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        limit = self.max_completions if limit is None else limit
+        return [(value, -negative_count) for negative_count, value in node.top[:limit]]
+
+    def _refresh(self, path):
+        """Recompute the cached completions bottom-up along a path"""
+        for node in reversed(path):
+            candidates = [(-count, value) for value, count in node.values.items()]
+            for child in node.children.values():
+                candidates.extend(child.top)
+            candidates.sort()
+
+            top = []
+            seen = set()
+            for candidate in candidates:
+                if candidate[1] not in seen:
+                    seen.add(candidate[1])
+                    top.append(candidate)
+                    if len(top) == self.max_completions:
+                        break
+            node.top = top
+
+    def clear(self):
+        """Remove every key"""
+        self.root = TrieNode()
+        self.size = 0
+
+
+def word_keys(text):
+    """Keys under which text is indexed: the whole text and each later word onwards
+
+    "John Doe" is found both by "jo" and by "do".
+    """
+    words = text.lower().split()
+    return [" ".join(words[i:]) for i in range(len(words))]
+
+
+class AutocompleteIndex:
+    """Student name and subject completions, kept current by StudentLinkedList"""
+
+    def __init__(self, max_completions=MAX_COMPLETIONS):
+        self.names = PrefixTrie(max_completions)
+        self.subjects = PrefixTrie(max_completions)  # counts = students taking the subject
+
+    def student_added(self, student):
+        for key in word_keys(student.name):
+            self.names.insert(key, student.name)
+        for subject in student.report_card.subjects:
+            self._add_subject(subject)
+
+    def student_removed(self, student):
+        for key in word_keys(student.name):
+            self.names.remove(key, student.name)
+        for subject in student.report_card.subjects:
+            self._remove_subject(subject)
+
+    def report_card_changed(self, student, event, subject, old_grade, new_grade):
+        if event == "subject_added":
+            self._add_subject(subject)
+        elif event == "subject_removed":
+            self._remove_subject(subject)
+
+    def clear(self):
+        self.names.clear()
+        self.subjects.clear()
+
+    def _add_subject(self, subject):
+        for key in word_keys(subject):
+            self.subjects.insert(key, subject)
+
+    def _remove_subject(self, subject):
+        for key in word_keys(subject):
+            self.subjects.remove(key, subject)
+
+    def complete_names(self, prefix, limit=None):
+        """Top student name completions for prefix"""
+        return self.names.complete(" ".join(prefix.lower().split()), limit)
+
+    def complete_subjects(self, prefix, limit=None):
+        """Top subject name completions for prefix"""
+        return self.subjects.complete(" ".join(prefix.lower().split()), limit)
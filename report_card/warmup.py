@@ -0,0 +1,269 @@
+"""
+Warm Start (background index builds)
+Builds the lookup structures of a system on a thread pool while the app is
+already serving requests, instead of paying the whole rebuild inline on the
+first requests after a restart:
+
+- id_index    student_id -> Student, so lookups skip the linked list walk
+- name_index  trigram index for the substring name search
+- statistics  the averages of the published snapshot, precomputed
+- any extra task added with add_task (e.g. pre-rendering hot responses)
+
+Until an index is built the system attribute stays None and reads use the
+StudentLinkedList scans as before. Each build copies the roster under the
+lock and attaches a listener that buffers changes made meanwhile, builds
+from the copy without the lock, then replays the buffered changes under the
+lock and installs the index. A failed build leaves the scans in place.
+"""
+
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_WORKERS = 2
+
+
+class StudentIdIndex:
+    """student_id -> Student for every student in the list"""
+
+    def __init__(self):
+        self.students = {}
+
+    def student_added(self, student):
+        self.students[student.student_id] = student
+
+    def student_removed(self, student):
+        self.students.pop(student.student_id, None)
+
+    def report_card_changed(self, student, event, subject, old_grade, new_grade):
+        pass
+
+    def clear(self):
+        self.students = {}
+
+    def get(self, student_id):
+        return self.students.get(student_id)
+
+    def get_many(self, student_ids):
+        """student_id -> Student for the IDs that were found"""
+        students = self.students
+        return {student_id: students[student_id] for student_id in student_ids if student_id in students}
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class NameIndex:
+    """Trigram index over lower-cased names for substring search"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.names = {}  # student_id -> (list position, lower-cased name, student)
+        self.grams = {}  # trigram -> student_ids whose name contains it
+        # Students are always appended to the list, so arrival order is list order
+        self.positions = itertools.count()
+
+    def student_added(self, student):
+        name = student.name.lower()
+        with self.lock:
+            self.names[student.student_id] = (next(self.positions), name, student)
+            for gram in _trigrams(name):
+                self.grams.setdefault(gram, set()).add(student.student_id)
+
+    def student_removed(self, student):
+        with self.lock:
+            entry = self.names.pop(student.student_id, None)
+            if entry is None:
+                return
+            for gram in _trigrams(entry[1]):
+                ids = self.grams[gram]
+                ids.discard(student.student_id)
+                if not ids:
+                    del self.grams[gram]
+
+    def report_card_changed(self, student, event, subject, old_grade, new_grade):
+        pass
+
+    def clear(self):
+        with self.lock:
+            self.names = {}
+            self.grams = {}
+
+    def search(self, name):
+        """Students whose name contains 'name' (case-insensitive) in list order
+
+        Returns None for queries shorter than a trigram; use the list scan then.
+        """
+        query = name.lower()
+        grams = _trigrams(query)
+        if not grams:
+            return None
+        with self.lock:
+            candidates = sorted((self.grams.get(gram, ()) for gram in grams), key=len)
+            ids = set(candidates[0]).intersection(*candidates[1:])
+            matches = [self.names[student_id] for student_id in ids]
+        return [student for _, lowered, student in sorted(matches, key=lambda entry: entry[0])
+                if query in lowered]
+
+
+class BufferedIndex:
+    """List listener that queues changes until the index it feeds is built"""
+
+    def __init__(self):
+        self.index = None
+        self.pending = []
+
+    def _event(self, method, *args):
+        if self.index is None:
+            self.pending.append((method, args))
+        else:
+            getattr(self.index, method)(*args)
+
+    def student_added(self, student):
+        self._event("student_added", student)
+
+    def student_removed(self, student):
+        self._event("student_removed", student)
+
+    def report_card_changed(self, student, event, subject, old_grade, new_grade):
+        self._event("report_card_changed", student, event, subject, old_grade, new_grade)
+
+    def clear(self):
+        self._event("clear")
+
+    def attach(self, index):
+        """Replay the queued changes into index and feed it directly from now on"""
+        for method, args in self.pending:
+            getattr(index, method)(*args)
+        self.pending = []
+        self.index = index
+
+
+class BuildTask:
+    """Progress of one background build"""
+
+    def __init__(self, name, total=None):
+        self.name = name
+        self.state = "pending"  # pending, building, ready or failed
+        self.done = 0
+        self.total = total
+        self.started = None
+        self.finished = None
+        self.error = None
+
+    def to_dict(self):
+        end = self.finished if self.finished is not None else time.perf_counter()
+        return {
+            "name": self.name,
+            "state": self.state,
+            "done": self.done,
+            "total": self.total,
+            "seconds": round(end - self.started, 3) if self.started is not None else None,
+            "error": self.error,
+        }
+
+
+class WarmStart:
+    """Builds a system's indexes and precomputed results on a thread pool"""
+
+    def __init__(self, system, workers=DEFAULT_WORKERS):
+        self.system = system
+        self.workers = workers
+        self.jobs = []  # (BuildTask, function running it)
+        self.pool = None
+        self.lock = threading.Lock()
+        self.all_done = threading.Event()
+        # A ShardedSystem gets one index per shard; a single system is its own shard
+        for position, shard in enumerate(getattr(system, "shards", [system])):
+            suffix = f"[{position}]" if shard is not system else ""
+            self.add_index("id_index", StudentIdIndex, shard, suffix)
+            self.add_index("name_index", NameIndex, shard, suffix)
+        self.add_task("statistics", system.get_statistics)
+
+    @classmethod
+    def from_environ(cls, system, environ=None):
+        """Build when WARM_START is set, with WARM_START_WORKERS threads (None otherwise)"""
+        environ = os.environ if environ is None else environ
+        if environ.get("WARM_START", "").lower() not in ("1", "true", "yes"):
+            return None
+        return cls(system, int(environ.get("WARM_START_WORKERS", DEFAULT_WORKERS)))
+
+    def add_index(self, attribute, factory, shard, suffix=""):
+        """Build factory() from the shard's students, then install it as shard.<attribute>"""
+        task = BuildTask(attribute + suffix)
+        self.jobs.append((task, lambda: self._build_index(task, attribute, factory, shard)))
+
+    def add_task(self, name, func):
+        """Run func() in the background (any precomputation the app wants warm)"""
+        task = BuildTask(name)
+        self.jobs.append((task, func))
+
+    def start(self):
+        """Submit every build (once); returns immediately"""
+        with self.lock:
+            if self.pool is not None:
+                return
+            self.pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="warm-start")
+            remaining = [len(self.jobs)]
+
+        def run(task, func):
+            task.state = "building"
+            task.started = time.perf_counter()
+            try:
+                func()
+                task.state = "ready"
+            except Exception as error:  # The scans keep serving; report why
+                task.state = "failed"
+                task.error = str(error)
+            task.finished = time.perf_counter()
+            with self.lock:
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    self.all_done.set()
+
+        for task, func in self.jobs:
+            self.pool.submit(run, task, func)
+
+    def _build_index(self, task, attribute, factory, shard):
+        buffer = BufferedIndex()
+        with shard.lock:
+            students = list(shard.student_list.iter_students())
+            shard.student_list.indexes.append(buffer)
+        task.total = len(students)
+        try:
+            index = factory()
+            for student in students:
+                index.student_added(student)
+                task.done += 1
+        except Exception:
+            with shard.lock:
+                shard.student_list.indexes.remove(buffer)
+            raise
+        with shard.lock:
+            buffer.attach(index)
+            setattr(shard, attribute, index)
+
+    def wait(self, timeout=None):
+        """Block until every build has finished; False on timeout"""
+        return self.all_done.wait(timeout)
+
+    def is_ready(self):
+        """Every build finished (a failed one falls back to scans for good)"""
+        return self.all_done.is_set()
+
+    def get_status(self):
+        tasks = [task.to_dict() for task, _ in self.jobs]
+        return {
+            "ready": self.is_ready(),
+            "started": self.pool is not None,
+            "workers": self.workers,
+            "tasks": tasks,
+            "failed": [task["name"] for task in tasks if task["state"] == "failed"],
+        }
+
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
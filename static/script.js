@@ -291,7 +291,8 @@ async function searchByName() {
     }
     
     try {
-        const response = await fetch(`${API_BASE}/students/search?name=${encodeURIComponent(name)}`);
+        const fuzzy = document.getElementById('search-fuzzy').checked ? '&fuzzy=true' : '';
+        const response = await fetch(`${API_BASE}/students/search?name=${encodeURIComponent(name)}${fuzzy}`);
         const data = await response.json();
         
         if (data.success) {
@@ -377,7 +378,7 @@ async function loadStack() {
                 container.innerHTML = '<div class="empty-state">Stack is empty</div>';
             } else {
                 container.innerHTML = `
-                    <p style="margin-bottom: 15px; font-weight: 600;">Stack Size: ${data.size}</p>
+                    <p style="margin-bottom: 15px; font-weight: 600;">Stack Size: ${data.size} &middot; Redo: ${data.redo_size} &middot; Version: ${data.version}</p>
                     ${data.stack.map((item, index) => `
                         <div class="ds-item">
                             <div class="ds-item-header">
@@ -385,7 +386,7 @@ async function loadStack() {
                                 <span style="color: #666;">#${index + 1}</span>
                             </div>
                             <div style="margin-top: 8px;">
-                                <strong>${item.student_name}</strong> (ID: ${item.student_id})
+                                <strong>${item.student_name}</strong>${item.student_id ? ` (ID: ${item.student_id})` : ''}
                             </div>
                         </div>
                     `).join('')}
@@ -412,15 +413,15 @@ async function loadQueue() {
                 container.innerHTML = '<div class="empty-state">Queue is empty</div>';
             } else {
                 container.innerHTML = `
-                    <p style="margin-bottom: 15px; font-weight: 600;">Queue Size: ${data.size}</p>
+                    <p style="margin-bottom: 15px; font-weight: 600;">Queue Size: ${data.size}${data.coalesced ? ` (${data.coalesced} operations coalesced)` : ''}</p>
                     ${data.queue.map((item, index) => `
                         <div class="ds-item">
                             <div class="ds-item-header">
                                 <span class="operation-type ${item.operation_type}">${item.operation_type}</span>
-                                <span style="color: #666;">#${index + 1}</span>
+                                <span style="color: #666;">#${index + 1}${item.count > 1 ? ` (${item.count} merged)` : ''}</span>
                             </div>
                             <div style="margin-top: 8px;">
-                                <strong>${item.student_name}</strong> (ID: ${item.student_id})
+                                <strong>${item.student_name}</strong>${item.student_id ? ` (ID: ${item.student_id})` : ''}
                             </div>
                         </div>
                     `).join('')}
@@ -433,8 +434,8 @@ async function loadQueue() {
     }
 }
 
-// Undo Delete
-async function undoDelete() {
+// Undo Last Operation
+async function undoOperation() {
     try {
         const response = await fetch(`${API_BASE}/undo`, {
             method: 'POST'
@@ -450,7 +451,29 @@ async function undoDelete() {
             showToast(data.message, 'error');
         }
     } catch (error) {
-        showToast('Error undoing delete', 'error');
+        showToast('Error undoing operation', 'error');
+        console.error('Error:', error);
+    }
+}
+
+// Redo Last Undone Operation
+async function redoOperation() {
+    try {
+        const response = await fetch(`${API_BASE}/redo`, {
+            method: 'POST'
+        });
+        
+        const data = await response.json();
+        
+        if (data.success) {
+            showToast(data.message, 'success');
+            loadStack();
+            loadAllStudents();
+        } else {
+            showToast(data.message, 'error');
+        }
+    } catch (error) {
+        showToast('Error redoing operation', 'error');
         console.error('Error:', error);
     }
 }
@@ -493,6 +516,40 @@ document.getElementById('search-by-name').addEventListener('keypress', function(
     }
 });
 
+// Autocomplete suggestions for name and subject inputs
+function setupAutocomplete(inputId, datalistId, type) {
+    const input = document.getElementById(inputId);
+    const datalist = document.getElementById(datalistId);
+    let timer = null;
+    
+    input.addEventListener('input', function() {
+        clearTimeout(timer);
+        const prefix = input.value.trim();
+        if (!prefix) {
+            datalist.innerHTML = '';
+            return;
+        }
+        
+        timer = setTimeout(async () => {
+            try {
+                const response = await fetch(`${API_BASE}/autocomplete?type=${type}&limit=8&q=${encodeURIComponent(prefix)}`);
+                const data = await response.json();
+                if (data.success) {
+                    datalist.innerHTML = data.completions
+                        .map(item => `<option value="${item.value}"></option>`)
+                        .join('');
+                }
+            } catch (error) {
+                console.error('Error:', error);
+            }
+        }, 150);
+    });
+}
+
+setupAutocomplete('search-by-name', 'name-suggestions', 'name');
+setupAutocomplete('subject', 'subject-suggestions', 'subject');
+setupAutocomplete('update-subject', 'subject-suggestions', 'subject');
+
 // Load students on page load
 document.addEventListener('DOMContentLoaded', function() {
     loadAllStudents();
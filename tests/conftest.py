@@ -0,0 +1,6 @@
+"""Make the project root importable (app.py, asgi.py, report_card) however pytest is started"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
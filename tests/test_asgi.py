@@ -0,0 +1,111 @@
+"""ASGI routes driven in-process"""
+
+import asyncio
+import json
+
+import pytest
+
+import asgi
+from report_card.export import export_roster
+
+
+def call(method, path, body=None, headers=()):
+    """(status, headers, body bytes, body messages) of one request"""
+    path, _, query = path.partition("?")
+    scope = {"type": "http", "method": method, "path": path, "query_string": query.encode(),
+             "headers": [(b"content-type", b"application/json"), *headers]}
+    messages = [{"type": "http.request", "body": json.dumps(body).encode() if body else b"", "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(asgi.application(scope, receive, send))
+    bodies = [message for message in sent[1:]]
+    return sent[0]["status"], dict(sent[0]["headers"]), b"".join(m.get("body", b"") for m in bodies), bodies
+
+
+def test_export_streams_the_roster():
+    asgi.system.student_list.clear()
+    for i in range(25):
+        asgi.system.add_student(f"E{i:02d}", f"Export {i}")
+        asgi.system.add_grade(f"E{i:02d}", "Math", i)
+
+    status, headers, body, messages = call("GET", "/api/export?format=csv&chunk_size=10")
+
+    expected, _ = export_roster(asgi.system.snapshot(), "csv", chunk_size=10)
+    assert status == 200
+    assert headers[b"content-type"] == b"text/csv"
+    assert b"content-length" not in headers
+    assert body == b"".join(expected)
+    assert len(messages) > 2  # Sent in chunks, not as one body
+
+
+def test_export_rejects_unknown_format():
+    status, _, body, _ = call("GET", "/api/export?format=xml")
+    assert status == 400
+    assert json.loads(body)["success"] is False
+
+
+def test_export_holds_admission_until_streamed(monkeypatch):
+    from report_card.admission import AdmissionController, estimate_cost
+
+    controller = AdmissionController()
+    monkeypatch.setattr(asgi, "admission", controller)
+    monkeypatch.setattr(asgi, "estimate_cost", estimate_cost, raising=False)
+
+    status, _, _, _ = call("GET", "/api/export?format=ndjson&chunk_size=5")
+
+    assert status == 200
+    assert controller.get_stats()["active"] == {}
+    assert controller.get_stats()["cost_in_flight"] == 0
+
+
+def test_export_releases_admission_when_client_leaves_before_first_chunk(monkeypatch):
+    from report_card.admission import AdmissionController, estimate_cost
+
+    controller = AdmissionController()
+    monkeypatch.setattr(asgi, "admission", controller)
+    monkeypatch.setattr(asgi, "estimate_cost", estimate_cost, raising=False)
+    scope = {"type": "http", "method": "GET", "path": "/api/export", "query_string": b"format=csv",
+             "headers": []}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        raise OSError("client disconnected")
+
+    with pytest.raises(OSError):
+        asyncio.run(asgi.application(scope, receive, send))
+    assert controller.get_stats()["active"] == {}
+    assert controller.get_stats()["cost_in_flight"] == 0
+
+
+def test_compact_shape_and_compression():
+    import gzip
+
+    asgi.system.student_list.clear()
+    asgi.system.add_student("C1", "Compact One")
+    asgi.system.add_grade("C1", "Math", 90)
+    asgi.system.add_grade("C1", "Art", 80)
+
+    status, _, body, _ = call("GET", "/api/students?shape=compact")
+    payload = json.loads(body)
+    assert status == 200
+    assert payload["shape"] == "compact"
+    assert payload["subjects"] == ["Math", "Art"]
+    assert payload["students"] == [["C1", "Compact One", 85.0, [0, 1], [90.0, 80.0]]]
+
+    status, _, body, _ = call("POST", "/api/students/batch?shape=compact", {"student_ids": ["C1", "C9"]})
+    assert json.loads(body)["students"][0][0] == "C1"
+    assert json.loads(body)["missing"] == ["C9"]
+
+    for i in range(40):
+        asgi.system.add_student(f"Z{i:02d}", f"Zipped {i}")
+    status, headers, body, _ = call("GET", "/api/students", headers=[(b"accept-encoding", b"gzip")])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert len(json.loads(gzip.decompress(body))["students"]) == 41
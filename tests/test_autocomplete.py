@@ -0,0 +1,45 @@
+"""Autocomplete limits"""
+
+import json
+
+import pytest
+
+import app
+import asgi
+from report_card.trie import MAX_COMPLETIONS, PrefixTrie
+from test_asgi import call
+
+
+def test_complete_returns_exactly_limit():
+    trie = PrefixTrie()
+    for n in range(15):
+        trie.insert(f"ann {n:02d}", f"Ann {n:02d}")
+    assert len(trie.complete("ann", 1)) == 1
+    assert len(trie.complete("ann", MAX_COMPLETIONS)) == MAX_COMPLETIONS
+    for limit in (-1, 0, MAX_COMPLETIONS + 1):
+        with pytest.raises(ValueError):
+            trie.complete("ann", limit)
+
+
+@pytest.mark.parametrize("limit", ["-1", "0", str(MAX_COMPLETIONS + 1)])
+def test_servers_reject_limits_out_of_range(limit):
+    message = f"limit must be between 1 and {MAX_COMPLETIONS}!"
+    response = app.app.test_client().get(f"/api/autocomplete?q=an&limit={limit}")
+    assert response.status_code == 400
+    assert response.get_json()["message"] == message
+
+    status, _, body, _ = call("GET", f"/api/autocomplete?q=an&limit={limit}")
+    assert status == 400
+    assert json.loads(body)["message"] == message
+
+
+def test_servers_answer_within_range():
+    for system in (app.system, asgi.system):
+        system.student_list.clear()
+        for n in range(3):
+            system.add_student(f"A{n}", f"Anna {n}")
+
+    response = app.app.test_client().get("/api/autocomplete?q=an&limit=2")
+    assert len(response.get_json()["completions"]) == 2
+    status, _, body, _ = call("GET", "/api/autocomplete?q=an&limit=2")
+    assert len(json.loads(body)["completions"]) == 2
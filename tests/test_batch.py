@@ -0,0 +1,84 @@
+"""All-or-nothing batches and rolling them back with undo"""
+
+import pytest
+
+from report_card import ReportCardManagementSystem, ShardedSystem
+
+
+def make_system(kind):
+    system = ShardedSystem(3) if kind == "sharded" else ReportCardManagementSystem()
+    system.add_student("B1", "Bea")
+    system.add_grade("B1", "Math", 70)
+    return system
+
+
+def roster(system, students=None):
+    students = system.get_all_students() if students is None else students
+    return sorted((student.student_id, student.name, tuple(student.report_card.subjects),
+                   tuple(student.report_card.grades)) for student in students)
+
+
+@pytest.fixture(params=["single", "sharded"])
+def system(request):
+    return make_system(request.param)
+
+
+def test_failing_mutation_applies_nothing(system):
+    before, version, queued = roster(system), system.get_version(), system.operation_queue.size
+
+    success, message = system.apply_batch([
+        {"operation_type": "add", "student_id": "B2", "name": "Ben"},
+        {"operation_type": "add_grade", "student_id": "B2", "subject": "Art", "grade": 90},
+        {"operation_type": "update_grade", "student_id": "B1", "subject": "Math", "grade": 95},
+        {"operation_type": "add_grade", "student_id": "B2", "subject": "Art", "grade": 80},
+    ])
+
+    assert not success
+    assert message == "Mutation 4: Subject Art already exists! Use update instead."
+    assert roster(system) == before
+    assert system.get_version() == version
+    assert system.operation_queue.size == queued
+    assert roster(system, system.snapshot().iter_students()) == before
+
+
+def test_invalid_field_rejects_the_whole_batch(system):
+    before = roster(system)
+    success, message = system.apply_batch([
+        {"operation_type": "delete", "student_id": "B1"},
+        {"operation_type": "add_grade", "student_id": "B1", "subject": "Art", "grade": 101},
+    ])
+    assert not success
+    assert message == "Mutation 2: Grade must be between 0 and 100!"
+    assert roster(system) == before
+
+
+def test_batch_sees_its_own_earlier_mutations(system):
+    success, _ = system.apply_batch([
+        {"operation_type": "delete", "student_id": "B1"},
+        {"operation_type": "add_grade", "student_id": "B1", "subject": "Art", "grade": 50},
+    ])
+    assert not success
+    assert system.find_student("B1") is not None
+
+
+def test_undo_rolls_back_the_whole_batch(system):
+    before = roster(system)
+    success, message = system.apply_batch([
+        {"operation_type": "add", "student_id": "B2", "name": "Ben"},
+        {"operation_type": "add", "student_id": "B3", "name": "Bo"},
+        {"operation_type": "add_grade", "student_id": "B2", "subject": "Art", "grade": 90},
+        {"operation_type": "update_grade", "student_id": "B1", "subject": "Math", "grade": 95},
+        {"operation_type": "delete", "student_id": "B1"},
+    ])
+    assert (success, message) == (True, "Applied 5 mutations!")
+    after = roster(system)
+    assert [student_id for student_id, *_ in after] == ["B2", "B3"]
+
+    success, _ = system.undo()
+    assert success
+    assert roster(system) == before
+    assert system.find_student("B1").report_card.get_grade("Math") == 70
+
+    success, _ = system.redo()
+    assert success
+    assert roster(system) == after
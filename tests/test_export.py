@@ -0,0 +1,97 @@
+"""Resuming interrupted roster exports"""
+
+import csv
+import io
+
+import pytest
+
+from report_card import ReportCardManagementSystem, ShardedSystem
+from report_card.export import _last_exported_id, export_roster
+
+
+def make_system():
+    system = ReportCardManagementSystem()
+    for student_id, name, grades in [("S0", "Ann", {"Math": 90}),
+                                     ("S1", "Bob", {"Math": 80, "Bio": 70, "Art": 60}),
+                                     ("S2", "Cy", {}),
+                                     ("S3", "Dee", {"Math": 50, "Bio": 40})]:
+        system.add_student(student_id, name)
+        for subject, grade in grades.items():
+            system.add_grade(student_id, subject, grade)
+    return system
+
+
+def export(system, fmt, after=None):
+    stream, error = export_roster(system.snapshot(), fmt, after, chunk_size=2)
+    assert error is None
+    return b"".join(stream)
+
+
+def resume(system, path, fmt):
+    last_id, _ = _last_exported_id(path, fmt)
+    with open(path, "ab") as output:
+        output.write(export(system, fmt, after=last_id) if last_id is not None
+                     else export(system, fmt).split(b"\n", 1)[1])
+    with open(path, "rb") as output:
+        return output.read()
+
+
+def test_csv_resume_after_cut_inside_a_student(tmp_path):
+    system = make_system()
+    full = export(system, "csv")
+    path = tmp_path / "roster.csv"
+    # Cut right after S1's first row: its Bio and Art rows are missing
+    cut = full.index(b"S1,Bob,Math") + len(b"S1,Bob,Math,80.0\n")
+    for end in (cut, cut - 3, len(b"student_id,name,subject,grade\n") + 4):
+        path.write_bytes(full[:end])
+        assert resume(system, path, "csv") == full
+
+
+def test_csv_resume_when_cursor_student_was_deleted(tmp_path):
+    system = make_system()
+    full = export(system, "csv")
+    path = tmp_path / "roster.csv"
+    path.write_bytes(full[:full.index(b"S2,")])
+    system.remove_student("S1")
+
+    rows = list(csv.reader(io.StringIO(resume(system, path, "csv").decode())))
+    # S0 was complete; S1 was deleted, so the export continues after its position
+    assert [row[0] for row in rows[1:]] == ["S0", "S2", "S3", "S3"]
+
+
+def test_ndjson_resume_with_deleted_cursor(tmp_path):
+    system = make_system()
+    full = export(system, "ndjson")
+    lines = full.splitlines(keepends=True)
+    system.remove_student("S1")
+
+    stream, error = export_roster(system.snapshot(), "ndjson", after="S1")
+    assert error is None
+    assert b"".join(stream) == b"".join(lines[2:])
+
+
+@pytest.mark.parametrize("view", ["snapshot", "live", "sharded"])
+def test_resume_after_deleted_cursor_keeps_list_order(view):
+    system = ShardedSystem(2) if view == "sharded" else ReportCardManagementSystem()
+    for student_id in ["S5", "S1", "S3", "S4", "S2"]:
+        system.add_student(student_id, "Name " + student_id)
+
+    def ids(after=None):
+        students = system.snapshot() if view != "live" else system.student_list
+        stream, error = export_roster(students, "csv", after)
+        assert error is None
+        return [row[0] for row in csv.reader(io.StringIO(b"".join(stream).decode())) if row[0] != "student_id"]
+
+    for cut in range(5):
+        order = ids()
+        system.remove_student(order[cut])
+        # Everything listed after the deleted cursor, nothing before it, no repeats
+        assert ids(after=order[cut]) == order[cut + 1:]
+        system.undo()  # Re-adds the student at the end of the list
+
+
+def test_resume_with_unknown_cursor_is_rejected():
+    system = make_system()
+    stream, error = export_roster(system.snapshot(), "ndjson", after="S9")
+    assert stream is None
+    assert error == "Cursor student S9 not found!"
@@ -0,0 +1,49 @@
+"""Typo-tolerant name search under concurrent writes"""
+
+import threading
+import time
+
+from report_card import ReportCardManagementSystem
+
+
+def test_fuzzy_search_while_roster_changes():
+    system = ReportCardManagementSystem()
+    for i in range(200):
+        system.add_student(f"S{i}", f"John Doe{i}")
+
+    stop = threading.Event()
+    errors = []
+
+    def writer():
+        i = 200
+        while not stop.is_set():
+            system.add_student(f"S{i}", f"Jane Doe{i}")
+            system.remove_student(f"S{i - 100}")
+            i += 1
+
+    def reader():
+        while not stop.is_set():
+            try:
+                system.fuzzy_search_by_name("jon doe4")
+            except Exception as error:  # Any exception here would be a 500
+                errors.append(error)
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(1.5)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+def test_fuzzy_search_finds_typos():
+    system = ReportCardManagementSystem()
+    system.add_student("S1", "Deepika Sharma")
+    system.add_student("S2", "John Smith")
+
+    results, error = system.fuzzy_search_by_name("Deepka")
+    assert error is None
+    assert [(student.student_id, distance) for student, distance in results] == [("S1", 1)]
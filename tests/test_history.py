@@ -0,0 +1,89 @@
+"""Grade history encoding and point-in-time queries"""
+
+import itertools
+
+from report_card import ReportCardManagementSystem
+from report_card.history import CHECKPOINT_EVERY, GradeSeries
+
+
+def test_series_round_trips_every_kind_of_entry():
+    series = GradeSeries()
+    grades = itertools.cycle([85.5, 90.0, 1 / 3, None, 0.0, 100.0, 72.25, -0.5])
+    entries = []
+    for i in range(CHECKPOINT_EVERY * 3 + 5):
+        when, grade = 1000 + i * 7, next(grades)
+        series.append(when, grade)
+        entries.append((when, grade))
+
+    decoded = list(series.decode())
+    assert [(when, new) for when, _, new in decoded] == entries
+    assert [old for _, old, _ in decoded] == [None] + [grade for _, grade in entries[:-1]]
+
+    since = entries[CHECKPOINT_EVERY * 2][0] + 3
+    assert [(when, new) for when, _, new in series.decode(since)] == [entry for entry in entries if entry[0] > since]
+
+    assert series.value_at(999) is None
+    for when, grade in entries:
+        assert series.value_at(when) == grade
+        assert series.value_at(when + 6) == grade  # Until the next change
+    assert series.checkpoints is not None
+
+
+def test_hundredths_cost_a_few_bytes_per_change():
+    series = GradeSeries()
+    series.append(1_700_000_000_000, 80.0)  # The first entry holds the absolute time and grade
+    first = len(series.data)
+    # Then a change a minute, moving the grade by up to a point
+    for i in range(1, 1001):
+        series.append(1_700_000_000_000 + i * 60_000, 80 + (i % 5) / 4)
+    assert (len(series.data) - first) / 1000 <= 5
+
+
+def make_system():
+    now = [1000.0]
+    system = ReportCardManagementSystem()
+    system.grade_history.clock = lambda: now[0]
+    return system, now
+
+
+def test_as_of_and_changes_since_survive_updates_and_deletes():
+    system, now = make_system()
+    system.add_student("H1", "Hal")
+    system.add_grade("H1", "Math", 80)
+    now[0] = 1010.0
+    system.update_grade("H1", "Math", 90)
+    system.add_grade("H1", "Art", 70)
+    now[0] = 1020.0
+    system.remove_student("H1")
+
+    assert system.get_grades_as_of("H1", 999) == ({}, None)
+    assert system.get_grades_as_of("H1", 1005) == ({"Math": 80.0}, None)
+    assert system.get_grades_as_of("H1", 1010) == ({"Math": 90.0, "Art": 70.0}, None)
+    assert system.get_grades_as_of("H1", 1015, "Art") == ({"Art": 70.0}, None)
+    assert system.get_grades_as_of("H1", 1020) == ({}, None)
+
+    changes = system.get_changes_since(1005)
+    assert sorted((change["time"], change["subject"], change["old_grade"], change["new_grade"]) for change in changes) == [
+        (1010.0, "Art", None, 70.0), (1010.0, "Math", 80.0, 90.0),
+        (1020.0, "Art", 70.0, None), (1020.0, "Math", 90.0, None)]
+    assert len(system.get_changes_since(1005, limit=2)) == 2
+    assert system.get_changes_since(1020) == []
+
+    history, error = system.get_grade_history("H1", "Math", since=1000)
+    assert error is None
+    assert [change["new_grade"] for change in history] == [90.0, None]
+    assert system.get_grade_history("H9") == (None, "No grade history for student with ID H9!")
+
+
+def test_undo_records_restored_and_removed_grades():
+    system, now = make_system()
+    system.add_student("H1", "Hal")
+    system.add_grade("H1", "Math", 80)
+    now[0] = 1010.0
+    system.remove_student("H1")
+    now[0] = 1020.0
+    system.undo()  # Restores Math = 80
+    system.undo()  # Undoes add_grade: Math is removed again
+    history, _ = system.get_grade_history("H1")
+    assert [(change["time"], change["new_grade"]) for change in history] == [
+        (1000.0, 80.0), (1010.0, None), (1020.0, 80.0), (1020.0, None)]
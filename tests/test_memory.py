@@ -0,0 +1,18 @@
+"""Per-structure memory accounting"""
+
+import pytest
+
+from report_card import ReportCardManagementSystem
+from report_card.sharding import ShardedSystem
+
+
+@pytest.mark.parametrize("make_system", [ReportCardManagementSystem, lambda: ShardedSystem(3)])
+def test_sorted_indexes_are_charged_to_themselves(make_system):
+    system = make_system()
+    for i in range(500):
+        system.add_student(f"S{i:04d}", f"Name {i}")
+
+    report = system.get_memory_usage()
+
+    # Three indexes of 500 entries each: at least one tuple per entry
+    assert report["sorted_indexes"]["objects"] >= 3 * 500
@@ -0,0 +1,55 @@
+"""Operation queue coalescing while another thread processes the queue"""
+
+import threading
+
+import pytest
+
+from report_card import OperationQueue, ReportCardManagementSystem, SynchronizedOperationQueue
+from report_card.sharding import ShardedSystem
+
+
+def run_updates_while_processing(system, updates=20000):
+    """Total operation count seen by the processor, and the number of updates made"""
+    for i in range(5):
+        system.add_student(f"S{i}", f"Student {i}")
+        system.add_grade(f"S{i}", "Math", 50)
+    processed = sum(node.count for node in system.operation_queue.process_all())
+
+    done = threading.Event()
+    seen = []
+
+    def processor():
+        while not done.is_set():
+            # Count right away, as the /api/queue/process response does
+            seen.append(sum(node.count for node in system.operation_queue.process_all()))
+
+    thread = threading.Thread(target=processor)
+    thread.start()
+    for i in range(updates):
+        success, _ = system.update_grade(f"S{i % 5}", "Math", i % 100)
+        assert success
+    done.set()
+    thread.join()
+    seen.append(sum(node.count for node in system.operation_queue.process_all()))
+    return sum(seen), updates
+
+
+@pytest.mark.parametrize("make_system", [
+    lambda: ReportCardManagementSystem(operation_queue=SynchronizedOperationQueue(coalesce=True)),
+    lambda: ShardedSystem(2, coalesce=True),
+])
+def test_coalesced_operations_are_never_lost(make_system):
+    total, updates = run_updates_while_processing(make_system())
+    assert total == updates
+
+
+def test_coalescing_merges_grade_changes():
+    queue = OperationQueue(coalesce=True)
+    system = ReportCardManagementSystem(operation_queue=queue)
+    system.add_student("S1", "Ann")
+    queue.process_all()
+    system.add_grade("S1", "Math", 50)
+    system.update_grade("S1", "Math", 60)
+
+    nodes = queue.nodes()
+    assert [(node.operation_type, node.count) for node in nodes] == [("upsert", 2)]
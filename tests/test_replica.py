@@ -0,0 +1,47 @@
+"""Read-only replicas reject writes by route, not by HTTP method"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import app
+import asgi
+from report_card.replication import WRITE_ENDPOINTS
+from test_asgi import call
+
+
+@pytest.fixture
+def replica(monkeypatch):
+    for server in (app, asgi):
+        monkeypatch.setattr(server, "replication", SimpleNamespace(role="replica"))
+        monkeypatch.setattr(server, "WRITE_ENDPOINTS", WRITE_ENDPOINTS, raising=False)
+    asgi.system.student_list.clear()
+    asgi.system.add_student("R1", "Replica Read")
+
+
+def test_flask_replica_serves_batch_lookup_and_rejects_writes(replica):
+    client = app.app.test_client()
+    app.system.student_list.clear()
+    app.system.add_student("R1", "Replica Read")
+
+    response = client.post("/api/students/batch", json={"student_ids": ["R1"]})
+    assert response.status_code == 200
+    for method, path, body in [("POST", "/api/students", {"student_id": "R2", "name": "New"}),
+                               ("DELETE", "/api/students/R1", None),
+                               ("POST", "/api/undo", None)]:
+        response = client.open(path, method=method, json=body)
+        assert response.status_code == 403
+    assert app.system.find_student("R1") is not None
+
+
+def test_asgi_replica_serves_batch_lookup_and_rejects_writes(replica):
+    status, _, body, _ = call("POST", "/api/students/batch", {"student_ids": ["R1"]})
+    assert status == 200
+    assert json.loads(body)["success"] is True
+    for method, path, body in [("POST", "/api/students", {"student_id": "R2", "name": "New"}),
+                               ("DELETE", "/api/students/R1", None),
+                               ("POST", "/api/undo", None)]:
+        status, _, _, _ = call(method, path, body)
+        assert status == 403
+    assert asgi.system.find_student("R1") is not None
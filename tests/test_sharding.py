@@ -0,0 +1,27 @@
+"""Sharded store behaving like a single system"""
+
+from report_card import ReportCardManagementSystem, ShardedSystem
+from report_card.sharding import shard_index
+
+
+def ids_on_two_shards(shard_count=2):
+    """One student ID on shard 0 and one on shard 1"""
+    by_shard = {}
+    for n in range(100):
+        by_shard.setdefault(shard_index(f"S{n}", shard_count), f"S{n}")
+    return by_shard[0], by_shard[1]
+
+
+def test_new_mutation_invalidates_redo_on_every_shard():
+    first, second = ids_on_two_shards()
+    for system in (ReportCardManagementSystem(), ShardedSystem(2)):
+        system.add_student(first, "First")
+        system.add_student(second, "Second")
+        system.undo()  # Second's add goes to the redo history
+        system.add_grade(first, "Math", 90)  # New mutation, on the other shard
+
+        success, message = system.redo()
+        assert not success, type(system).__name__
+        assert message == "No operations to redo!"
+        assert system.find_student(second) is None
+        assert system.redo_stack.is_empty()
@@ -0,0 +1,84 @@
+"""Snapshot reads stay consistent while the roster is mutated"""
+
+import threading
+import time
+
+import pytest
+
+from report_card import ReportCardManagementSystem, ShardedSystem
+
+
+def records(snapshot):
+    return [(student.student_id, tuple(student.report_card.subjects), tuple(student.report_card.grades))
+            for student in snapshot.iter_students()]
+
+
+@pytest.fixture(params=["single", "sharded"])
+def system(request):
+    return ShardedSystem(4) if request.param == "sharded" else ReportCardManagementSystem()
+
+
+def test_held_snapshot_does_not_change(system):
+    for i in range(100):
+        system.add_student(f"S{i:03d}", f"Student {i}")
+        system.add_grade(f"S{i:03d}", "Math", i % 100)
+    snapshot = system.snapshot()
+    before = records(snapshot)
+
+    system.update_grade("S005", "Math", 99)
+    system.remove_student("S010")
+    system.add_student("S999", "Late")
+    system.undo()
+
+    assert records(snapshot) == before
+    assert snapshot.get_size() == 100
+    assert records(system.snapshot()) != before
+
+
+def pair_batch(n):
+    """Replace the pair of students of batch n - 1 with a graded pair for batch n"""
+    mutations = [{"operation_type": "delete", "student_id": f"N{n - 1}-{k}"} for k in range(2)] if n else []
+    for k in range(2):
+        mutations += [{"operation_type": "add", "student_id": f"N{n}-{k}", "name": "New"},
+                      {"operation_type": "add_grade", "student_id": f"N{n}-{k}", "subject": "Math", "grade": n % 100}]
+    return mutations
+
+
+def test_readers_never_see_a_batch_half_applied(system):
+    for i in range(20):
+        system.add_student(f"S{i:03d}", f"Student {i}")
+    system.apply_batch(pair_batch(0))
+    start_version = system.get_version()
+    stop = threading.Event()
+    errors = []
+
+    def writer():
+        n = 1
+        while not stop.is_set():
+            success, message = system.apply_batch(pair_batch(n))
+            if not success:
+                errors.append(message)
+            n += 1
+
+    def reader():
+        while not stop.is_set():
+            snapshot = system.snapshot()
+            first = records(snapshot)
+            pair = [(student_id.split("-")[0], grades) for student_id, _, grades in first if student_id.startswith("N")]
+            # One whole pair from a single batch, both students graded
+            if len(first) != 22 or snapshot.get_size() != 22 or len(pair) != 2 or \
+                    pair[0] != pair[1] or len(pair[0][1]) != 1:
+                errors.append(f"half-applied batch in {pair}")
+            if records(snapshot) != first:
+                errors.append("snapshot changed while held")
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(1.0)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert system.get_version() > start_version
@@ -0,0 +1,84 @@
+"""Positional paging of the sorted views"""
+
+import random
+
+import pytest
+
+from report_card import ReportCardManagementSystem, ShardedSystem
+from report_card.sorted_index import SortedList
+
+
+def test_sorted_list_slices_match_a_plain_sorted_list(monkeypatch):
+    monkeypatch.setattr(SortedList, "LOAD", 4)  # Split and drop sublists often
+    rng = random.Random(7)
+    items = SortedList()
+    reference = []
+    for step in range(600):
+        if reference and rng.random() < 0.4:
+            item = rng.choice(reference)
+            items.remove(item)
+            reference.remove(item)
+        else:
+            item = rng.randrange(200)
+            items.add(item)
+            reference.append(item)
+        reference.sort()
+        if step % 20 == 0:
+            assert len(items) == len(reference)
+            for start in range(0, len(reference) + 2, 3):
+                for stop in (start, start + 1, start + 7, len(reference) + 5):
+                    assert list(items.islice(start, stop)) == reference[start:stop]
+                    assert list(items.ireverse(start, stop)) == reference[start:stop][::-1]
+
+    with pytest.raises(ValueError):
+        items.remove(1000)
+
+
+def pages(system, sort, order, limit):
+    """Walk the whole sorted view page by page"""
+    ids, offset = [], 0
+    while True:
+        students, total, error = system.get_sorted_students(sort, order, offset, limit)
+        assert error is None
+        ids += [student.student_id for student in students]
+        offset += limit
+        if offset >= total:
+            return ids
+
+
+def expected(system, sort, order):
+    keys = {"id": lambda s: ("", s.student_id), "name": lambda s: (s.name.casefold(), s.student_id),
+            "average": lambda s: (s.get_average(), s.student_id)}
+    students = sorted(system.get_all_students(), key=keys[sort])
+    ids = [student.student_id for student in students]
+    return ids[::-1] if order == "desc" else ids
+
+
+@pytest.mark.parametrize("kind", ["single", "sharded"])
+def test_pages_follow_adds_deletes_and_undo(kind, monkeypatch):
+    monkeypatch.setattr(SortedList, "LOAD", 4)
+    system = ShardedSystem(3) if kind == "sharded" else ReportCardManagementSystem()
+    rng = random.Random(11)
+    for i in range(60):
+        student_id = f"P{rng.randrange(1000):03d}"
+        if system.add_student(student_id, rng.choice(["ann", "Bob", "cy", "Dee"]) + f" {i}")[0]:
+            system.add_grade(student_id, "Math", rng.randrange(101))
+
+    def check():
+        for sort in ("id", "name", "average"):
+            for order in ("asc", "desc"):
+                assert pages(system, sort, order, 7) == expected(system, sort, order), (sort, order)
+
+    check()
+    victims = [student.student_id for student in system.get_all_students()][::4]
+    for student_id in victims:
+        system.remove_student(student_id)
+    system.update_grade(system.get_all_students()[0].student_id, "Math", 100)
+    check()
+    for _ in range(len(victims) + 1):
+        system.undo()
+    check()
+
+    _, total, _ = system.get_sorted_students("id", "asc", 0, 5)
+    assert total == len(system.get_all_students())
+    assert system.get_sorted_students("id", "asc", total + 10, 5)[0] == []
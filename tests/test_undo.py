@@ -0,0 +1,90 @@
+"""Multi-level undo/redo and undoing back to a version"""
+
+import pytest
+
+from report_card import ReportCardManagementSystem, ShardedSystem
+
+
+def state(system):
+    return sorted((student.student_id, dict(zip(student.report_card.subjects, student.report_card.grades)))
+                  for student in system.get_all_students())
+
+
+@pytest.fixture(params=["single", "sharded"])
+def system(request):
+    return ShardedSystem(3) if request.param == "sharded" else ReportCardManagementSystem()
+
+
+def run_history(system):
+    """Apply one mutation of every kind, returning [(version, state)] after each"""
+    history = [(system.get_version(), state(system))]
+    for mutation in [lambda: system.add_student("U1", "Uma"),
+                     lambda: system.add_student("U2", "Ugo"),
+                     lambda: system.add_grade("U1", "Math", 60),
+                     lambda: system.update_grade("U1", "Math", 75),
+                     lambda: system.add_grade("U2", "Art", 88),
+                     lambda: system.remove_student("U2")]:
+        success, _ = mutation()
+        assert success
+        history.append((system.get_version(), state(system)))
+    return history
+
+
+def test_every_level_undoes_and_redoes_in_order(system):
+    history = run_history(system)
+
+    for version, expected in reversed(history[:-1]):
+        success, _ = system.undo()
+        assert success
+        assert (system.get_version(), state(system)) == (version, expected)
+    assert system.undo() == (False, "No operations to undo!")
+
+    for version, expected in history[1:]:
+        success, _ = system.redo()
+        assert success
+        assert (system.get_version(), state(system)) == (version, expected)
+    assert system.redo() == (False, "No operations to redo!")
+
+
+def test_undo_restores_a_deleted_student_with_its_grades(system):
+    run_history(system)
+    system.undo()
+    assert system.find_student("U2").report_card.get_grade("Art") == 88
+
+
+def test_undo_to_version(system):
+    history = run_history(system)
+    version, expected = history[2]
+
+    success, message = system.undo_to_version(version)
+    assert success
+    assert message == f"Undone 4 operations, now at version {version}."
+    assert state(system) == expected
+    assert system.undo_to_version(version) == (True, f"Already at version {version}.")
+
+    # The undone operations can be redone one by one
+    for version, expected in history[3:]:
+        system.redo()
+        assert (system.get_version(), state(system)) == (version, expected)
+
+
+def test_undo_to_unknown_version_changes_nothing(system):
+    history = run_history(system)
+    current = state(system)
+    for version in (history[-1][0] + 1, -5):
+        success, message = system.undo_to_version(version)
+        assert not success
+        assert message == f"Version {version} is not in the undo history!"
+    assert state(system) == current
+
+
+def test_versions_dropped_from_a_full_stack_are_unreachable():
+    system = ReportCardManagementSystem()
+    system.undo_stack.max_size = 3
+    history = run_history(system)
+
+    assert not system.undo_to_version(history[1][0])[0]
+    success, _ = system.undo_to_version(history[3][0])
+    assert success
+    assert state(system) == history[3][1]
+    assert system.undo() == (False, "No operations to undo!")